@@ -0,0 +1,32 @@
+"""Benchmark demonstrating the linear scaling of acyclic_toposort on deep and wide acyclic graphs."""
+
+import time
+from collections.abc import Callable
+
+from benchmarks.graph_generators import create_deep_chain, create_wide_dag
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+
+SIZES = (10_000, 20_000, 40_000, 80_000, 160_000)
+
+
+def benchmark(create_graph: Callable[[int], list[tuple[int, int]]]) -> None:
+    """Time acyclic_toposort on graphs of increasing size and print the time per edge, which stays constant for a
+    linear time algorithm.
+
+    :param create_graph: function creating a graph with the supplied number of nodes.
+    """
+    print(f"{create_graph.__name__}:")
+    for num_nodes in SIZES:
+        edges = create_graph(num_nodes)
+        start_time = time.perf_counter()
+        graph_topology = acyclic_toposort(edges)
+        elapsed_time = time.perf_counter() - start_time
+        print(
+            f"  nodes: {num_nodes:>7}  edges: {len(edges):>7}  levels: {len(graph_topology):>7}  "
+            f"time: {elapsed_time:.4f}s  time per edge: {elapsed_time / len(edges) * 1e9:.1f}ns",
+        )
+
+
+if __name__ == "__main__":
+    benchmark(create_deep_chain)
+    benchmark(create_wide_dag)
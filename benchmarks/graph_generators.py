@@ -0,0 +1,122 @@
+"""Seeded graph generators for benchmarks, creating graphs of up to millions of edges in O(E) time and memory."""
+
+import random
+from collections.abc import Callable
+
+
+def create_deep_chain(num_nodes: int, seed: int = 0) -> list[tuple[int, int]]:
+    """Create an acyclic graph in which every node depends on its predecessor and on a random earlier node, resulting
+    in num_nodes topological levels.
+
+    :param num_nodes: number of nodes in the graph.
+    :param seed: seed of the random number generator.
+    :return: list of edges of the graph.
+    """
+    rng = random.Random(seed)
+    edges = [(node - 1, node) for node in range(1, num_nodes)]
+    edges.extend((rng.randrange(node - 1), node) for node in range(2, num_nodes))
+    return edges
+
+
+def create_wide_dag(num_nodes: int, seed: int = 0, num_levels: int = 100) -> list[tuple[int, int]]:
+    """Create an acyclic graph of num_nodes nodes distributed over num_levels topological levels, in which every node
+    depends on two random nodes of the preceding level.
+
+    :param num_nodes: number of nodes in the graph.
+    :param seed: seed of the random number generator.
+    :param num_levels: number of topological levels of the graph.
+    :return: list of edges of the graph.
+    """
+    rng = random.Random(seed)
+    width = max(num_nodes // num_levels, 1)
+    return [
+        (node - node % width - width + rng.randrange(width), node) for node in range(width, num_nodes) for _ in range(2)
+    ]
+
+
+def create_random_dag(num_nodes: int, seed: int = 0, edges_per_node: int = 4) -> list[tuple[int, int]]:
+    """Create a random acyclic graph by drawing edges between random pairs of nodes and directing each edge from the
+    smaller to the larger node. Duplicate edges are kept, as the sorting algorithms drop them.
+
+    :param num_nodes: number of nodes in the graph.
+    :param seed: seed of the random number generator.
+    :param edges_per_node: average number of edges per node.
+    :return: list of edges of the graph.
+    """
+    rng = random.Random(seed)
+    edges: list[tuple[int, int]] = []
+    for _ in range(num_nodes * edges_per_node):
+        edge_start, edge_end = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if edge_start != edge_end:
+            edges.append((min(edge_start, edge_end), max(edge_start, edge_end)))
+    return edges
+
+
+def create_planted_cycle_graph(
+    num_nodes: int,
+    seed: int = 0,
+    cycle_length: int = 4,
+    num_cycles: int | None = None,
+) -> list[tuple[int, int]]:
+    """Create a random acyclic graph and plant disjoint cycles into it. Each planted cycle is a chain of cycle_length
+    consecutive nodes with an additional shortcut edge from its first to its last node and a back edge from its last to
+    its first node. Every cycle of the graph then runs through a back edge, whose set is the unique minimal set of
+    cyclic edges. This keeps the number of candidate sets of cyclic edges at one for any number of planted cycles.
+
+    :param num_nodes: number of nodes in the graph.
+    :param seed: seed of the random number generator.
+    :param cycle_length: number of nodes of each planted cycle, at least 3.
+    :param num_cycles: number of planted cycles, defaulting to one cycle per 100 nodes.
+    :return: list of edges of the graph.
+    """
+    rng = random.Random(seed)
+    if num_cycles is None:
+        num_cycles = max(num_nodes // 100, 1)
+
+    # Edges of the acyclic graph only lead into a node from a node of an earlier chain, keeping the cycles disjoint
+    edges = [(rng.randrange(node - node % cycle_length), node) for node in range(cycle_length, num_nodes)]
+    for chain_start in rng.sample(range(0, num_nodes - cycle_length + 1, cycle_length), k=num_cycles):
+        chain_end = chain_start + cycle_length - 1
+        edges.extend((node, node + 1) for node in range(chain_start, chain_end))
+        edges.extend(((chain_start, chain_end), (chain_end, chain_start)))
+    return edges
+
+
+def create_scc_heavy_graph(
+    num_nodes: int,
+    seed: int = 0,
+    component_size: int = 5,
+    component_edges: int = 8,
+) -> list[tuple[int, int]]:
+    """Create a graph consisting entirely of strongly connected components of component_size nodes that are connected
+    by random edges from earlier to later components. Each component is a planted cycle like in
+    create_planted_cycle_graph with additional random forward edges within the chain. The back edges are therefore the
+    unique minimal set of cyclic edges, whereas the search still has to explore each component.
+
+    :param num_nodes: number of nodes in the graph.
+    :param seed: seed of the random number generator.
+    :param component_size: number of nodes of each strongly connected component, at least 3.
+    :param component_edges: number of edges within each strongly connected component, at least component_size + 1.
+    :return: list of edges of the graph.
+    """
+    rng = random.Random(seed)
+    edges: list[tuple[int, int]] = []
+    for component_start in range(0, num_nodes - component_size + 1, component_size):
+        component_end = component_start + component_size - 1
+        edges.extend((node, node + 1) for node in range(component_start, component_end))
+        edges.extend(((component_start, component_end), (component_end, component_start)))
+        for _ in range(component_edges - component_size - 1):
+            edge_start, edge_end = sorted(rng.sample(range(component_start, component_end + 1), k=2))
+            edges.append((edge_start, edge_end))
+        if component_start:
+            edges.append((rng.randrange(component_start), rng.randint(component_start, component_end)))
+    return edges
+
+
+GRAPH_GENERATORS: dict[str, Callable[[int, int], list[tuple[int, int]]]] = {
+    "deep_chain": create_deep_chain,
+    "wide_dag": create_wide_dag,
+    "random_dag": create_random_dag,
+    "planted_cycles": create_planted_cycle_graph,
+    "scc_heavy": create_scc_heavy_graph,
+}
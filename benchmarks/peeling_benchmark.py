@@ -0,0 +1,44 @@
+"""Benchmark comparing the peeling of the recursive engine on bitsets with the peeling on dicts of sets."""
+
+import importlib
+import timeit
+from unittest import mock
+
+from benchmarks.graph_generators import create_deep_chain, create_planted_cycle_graph, create_random_dag
+from cyclic_toposort.cyclic_toposort import BITSET_MAX_NODES, BITSET_MIN_NODES, _cyclic_toposort_recursive
+from cyclic_toposort.graph import IndexedGraph
+
+SIZES = (BITSET_MIN_NODES, 32, 64, 128, BITSET_MAX_NODES)
+NUMBER = 200
+
+
+def benchmark(name: str, edges: list[tuple[int, int]]) -> None:
+    """Time the recursive engine on a graph once peeling on bitsets and once peeling on dicts of sets and print both
+    times per call as well as the speedup of the bitsets.
+
+    :param name: name of the graph printed with the results.
+    :param edges: list of edges of the graph.
+    """
+    graph = IndexedGraph.from_edges(edges)
+    node_ins, node_outs = graph.subgraph_ins_outs(set(range(graph.num_nodes)))
+
+    def sort() -> None:
+        _cyclic_toposort_recursive(node_ins=node_ins, node_outs=node_outs)
+
+    # The package exports the function cyclic_toposort under the name of its module, which is therefore imported by its
+    # full name to disable the peeling on bitsets
+    bitsets_time = min(timeit.repeat(sort, number=NUMBER, repeat=3)) / NUMBER
+    with mock.patch.object(importlib.import_module("cyclic_toposort.cyclic_toposort"), "BITSET_MAX_NODES", 0):
+        dicts_time = min(timeit.repeat(sort, number=NUMBER, repeat=3)) / NUMBER
+    print(
+        f"  {name:<16} nodes: {graph.num_nodes:>4}  edges: {graph.num_edges:>5}  "
+        f"bitsets: {bitsets_time * 1e6:>8.1f}us  dicts: {dicts_time * 1e6:>8.1f}us  "
+        f"speedup: {dicts_time / bitsets_time:.2f}x",
+    )
+
+
+if __name__ == "__main__":
+    for num_nodes in SIZES:
+        benchmark("deep_chain", create_deep_chain(num_nodes))
+        benchmark("random_dag", create_random_dag(num_nodes))
+        benchmark("planted_cycles", create_planted_cycle_graph(num_nodes, num_cycles=1))
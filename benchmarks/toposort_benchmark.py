@@ -0,0 +1,153 @@
+"""Reproducible benchmark suite timing and memory-profiling acyclic_toposort and cyclic_toposort on seeded graphs of
+increasing size, emitting the results as JSON so that performance can be compared between versions.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from benchmarks.graph_generators import GRAPH_GENERATORS
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+
+ACYCLIC_GENERATORS = ("deep_chain", "wide_dag", "random_dag")
+CYCLIC_GENERATORS = ("planted_cycles", "scc_heavy")
+ACYCLIC_SIZES = (10_000, 100_000, 1_000_000)
+CYCLIC_SIZES = (1_000, 10_000, 100_000)
+SEED = 0
+REPEAT = 3
+
+
+def benchmark_case(
+    function: Callable[[list[tuple[int, int]]], Any],
+    edges: list[tuple[int, int]],
+    repeat: int,
+) -> dict[str, Any]:
+    """Time a sorting function on a graph repeat times and determine its peak memory allocation in an additional run
+    with tracemalloc, which is separate as tracing slows down the sorting.
+
+    :param function: sorting function called with the edges of the graph.
+    :param edges: list of edges of the graph.
+    :param repeat: number of timed runs.
+    :return: dict of the run times, the best run time, the peak memory allocation and the result size of the sorting.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start_time = time.perf_counter()
+        result = function(edges)
+        times.append(time.perf_counter() - start_time)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = function(edges)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    graph_topology, cyclic_edges = result if isinstance(result, tuple) else (result, set())
+    return {
+        "times": times,
+        "best_time": min(times),
+        "peak_memory_bytes": peak_memory,
+        "num_levels": len(graph_topology),
+        "num_cyclic_edges": len(cyclic_edges),
+    }
+
+
+def run_benchmarks(
+    acyclic_sizes: Sequence[int] = ACYCLIC_SIZES,
+    cyclic_sizes: Sequence[int] = CYCLIC_SIZES,
+    seed: int = SEED,
+    repeat: int = REPEAT,
+) -> dict[str, Any]:
+    """Run acyclic_toposort on the acyclic graph generators and cyclic_toposort on all graph generators for each
+    supplied number of nodes.
+
+    :param acyclic_sizes: numbers of nodes of the graphs sorted with acyclic_toposort.
+    :param cyclic_sizes: numbers of nodes of the graphs sorted with cyclic_toposort.
+    :param seed: seed of the graph generators.
+    :param repeat: number of timed runs of each benchmark case.
+    :return: dict of the environment of the benchmark and a list of the results of each benchmark case.
+    """
+    try:
+        version = metadata.version("cyclic-toposort")
+    except metadata.PackageNotFoundError:
+        version = None
+
+    suites: list[tuple[str, Callable[[list[tuple[int, int]]], Any], Sequence[str], Sequence[int]]] = [
+        ("acyclic_toposort", acyclic_toposort, ACYCLIC_GENERATORS, acyclic_sizes),
+        ("cyclic_toposort", cyclic_toposort, ACYCLIC_GENERATORS + CYCLIC_GENERATORS, cyclic_sizes),
+    ]
+    results = []
+    for function_name, function, generator_names, sizes in suites:
+        for generator_name in generator_names:
+            for num_nodes in sizes:
+                edges = GRAPH_GENERATORS[generator_name](num_nodes, seed)
+                result = {
+                    "function": function_name,
+                    "generator": generator_name,
+                    "num_nodes": num_nodes,
+                    "num_edges": len(edges),
+                    **benchmark_case(function=function, edges=edges, repeat=repeat),
+                }
+                results.append(result)
+                print(
+                    f"{function_name:<16}  {generator_name:<14}  nodes: {num_nodes:>9}  edges: {len(edges):>9}  "
+                    f"time: {result['best_time']:.4f}s  peak memory: {result['peak_memory_bytes'] / 2**20:.1f}MiB",
+                    file=sys.stderr,
+                )
+
+    return {
+        "cyclic_toposort_version": version,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark suite and write its results as JSON to stdout or an output file.
+
+    :param argv: Command line arguments, defaulting to sys.argv[1:].
+    :return: Exit code of the command.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark acyclic_toposort and cyclic_toposort on seeded graphs.")
+    parser.add_argument("--acyclic-sizes", type=int, nargs="+", default=ACYCLIC_SIZES, help="numbers of nodes")
+    parser.add_argument("--cyclic-sizes", type=int, nargs="+", default=CYCLIC_SIZES, help="numbers of nodes")
+    parser.add_argument("--seed", type=int, default=SEED, help="seed of the graph generators")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="number of timed runs of each benchmark case")
+    parser.add_argument("--output", type=Path, help="JSON file to write the results to instead of stdout")
+    args = parser.parse_args(argv)
+
+    benchmark_results = run_benchmarks(
+        acyclic_sizes=args.acyclic_sizes,
+        cyclic_sizes=args.cyclic_sizes,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+    if args.output is None:
+        json.dump(benchmark_results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with args.output.open("w", encoding="utf-8") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,12 @@
 """Init module to create a clean namespace when importing cyclic_toposort."""
 
-from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.acyclic_toposort import acyclic_toposort, iter_acyclic_toposort
+from cyclic_toposort.anytime_toposort import AnytimeResult, anytime_cyclic_toposort
+from cyclic_toposort.async_toposort import async_cyclic_toposort
+from cyclic_toposort.batch_toposort import BatchResult, cyclic_toposort_many
+from cyclic_toposort.compact_topology import CompactTopology
 from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.dynamic_toposort import DynamicToposort
+from cyclic_toposort.numpy_toposort import numpy_acyclic_levels, numpy_acyclic_toposort
+from cyclic_toposort.prepared_toposort import PreparedToposort
+from cyclic_toposort.result_cache import ResultCache
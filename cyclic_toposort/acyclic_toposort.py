@@ -20,57 +20,142 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from collections.abc import Iterable
+from array import array
+from collections.abc import Collection, Iterable, Iterator
+from typing import Literal, overload
 
+from cyclic_toposort.compact_topology import CompactTopology
+from cyclic_toposort.graph import IndexedGraph, NodeT
 
-def acyclic_toposort(edges: Iterable[tuple[int, int]]) -> list[set[int]]:
+
+@overload
+def acyclic_toposort(edges: Iterable[tuple[NodeT, NodeT]], compact: Literal[False] = False) -> list[set[NodeT]]: ...
+
+
+@overload
+def acyclic_toposort(edges: Iterable[tuple[NodeT, NodeT]], compact: Literal[True]) -> CompactTopology[NodeT]: ...
+
+
+def acyclic_toposort(
+    edges: Iterable[tuple[NodeT, NodeT]],
+    compact: bool = False,
+) -> list[set[NodeT]] | CompactTopology[NodeT]:
     """Create and return a topological sorting of an acyclic graph as a list of sets, each set representing a
     topological level, starting with the nodes that have no dependencies.
 
-    :param edges: iterable of edges represented as 2-tuples, whereas each 2-tuple represents the start-index and end-
-        index of an edge
+    :param edges: iterable of edges represented as 2-tuples, whereas each 2-tuple represents the start-node and end-
+        node of an edge. Nodes can be of any hashable type.
+    :param compact: If True, return the topological sorting as CompactTopology, which stores the nodes of all levels
+        in a single array instead of a set per level.
     :return: topological sorting of the graph represented by the input edges as a list of sets that represent each
-        topological level in order beginning with all dependencyless nodes.
+        topological level in order beginning with all dependencyless nodes, or as CompactTopology if compact is True.
     :raises RuntimeError: if a cyclic graph is detected.
     """
-    # Create dict that associates each node with the set of all nodes that having an incoming edge (node_ins) to
-    # that particular node. If a node has no incoming connections will the node be associated with an empty set.
-    node_ins: dict[int, set[int]] = {}
-    for edge_start, edge_end in edges:
-        # Don't consider cyclic node edges as not relevant for topological sorting
-        if edge_start == edge_end:
-            continue
-
-        # Ensure that each node is present in the node_ins dict, even if it has no incoming edges
-        node_ins.setdefault(edge_start, set())
-
-        # Add the edge_start node to the set of incoming nodes of the edge_end node
-        node_ins.setdefault(edge_end, set()).add(edge_start)
-
-    # Create the topological sorting of the graph represented by the input edges as a list of sets that represent each
-    # topological level in order beginning with all dependencyless nodes.
-    graph_topology: list[set[int]] = []
-    while True:
-        # Determine all nodes having no input/dependency in the current topological level
-        dependencyless = {node for node, incomings in node_ins.items() if not incomings}
-
-        if not dependencyless:
-            msg = "Cyclic graph detected in acyclic_toposort function" if node_ins else "Invalid graph detected"
-            raise RuntimeError(msg)
+    if compact:
+        graph = IndexedGraph.from_edges(edges)
+        return CompactTopology.from_levels(labels=graph.labels, levels=iter_acyclic_toposort_indices(graph))
+    return list(iter_acyclic_toposort(edges))
 
-        # Set dependencyless nodes as the nodes of the next topological level
-        graph_topology.append(dependencyless)
 
-        # Remove dependencyless nodes from node_ins collection, as those dependencyless nodes have been placed.
-        for node in dependencyless:
-            del node_ins[node]
+def iter_acyclic_toposort(edges: Iterable[tuple[NodeT, NodeT]]) -> Iterator[set[NodeT]]:
+    """Create a topological sorting of an acyclic graph and yield each topological level as a set as soon as it has
+    been determined, starting with the nodes that have no dependencies. Only the frontier of the sorting is kept in
+    memory, allowing the caller to consume and discard the levels of deep graphs.
+
+    :param edges: iterable of edges represented as 2-tuples, whereas each 2-tuple represents the start-node and end-
+        node of an edge. Nodes can be of any hashable type.
+    :return: iterator over the topological levels of the graph represented by the input edges as sets in order
+        beginning with all dependencyless nodes.
+    :raises RuntimeError: if a cyclic graph is detected, which is only raised after all levels preceding the cycle have
+        been yielded.
+    """
+    graph = IndexedGraph.from_edges(edges)
+    for level in iter_acyclic_toposort_indices(graph):
+        yield graph.to_labels(level)
 
-        # If all nodes are placed, exit topological sorting
-        if not node_ins:
-            break
 
-        # Remove depdencyless nodes from node_ins (the set of required incoming nodes) as those dependencyless nodes
-        # have been placed and their dependency to other nodes is therefore fulfilled
-        node_ins = {node: incomings - dependencyless for node, incomings in node_ins.items()}
+def acyclic_toposort_indices(
+    graph: IndexedGraph[NodeT],
+    excluded_edges: Collection[tuple[int, int]] = (),
+) -> list[list[int]]:
+    """Create and return a topological sorting of an indexed acyclic graph as a list of lists of node indices, each
+    list representing a topological level, starting with the nodes that have no dependencies.
+
+    :param graph: The indexed graph to sort.
+    :param excluded_edges: Edges of node indices that are excluded from the graph before sorting it. Nodes whose edges
+        are all excluded are not part of the sorting.
+    :return: topological sorting of the graph as a list of lists of node indices that represent each topological level
+        in order beginning with all dependencyless nodes.
+    :raises RuntimeError: if a cyclic graph is detected.
+    """
+    return list(iter_acyclic_toposort_indices(graph=graph, excluded_edges=excluded_edges))
+
+
+def iter_acyclic_toposort_indices(
+    graph: IndexedGraph[NodeT],
+    excluded_edges: Collection[tuple[int, int]] = (),
+) -> Iterator[list[int]]:
+    """Create a topological sorting of an indexed acyclic graph and yield each topological level as a list of node
+    indices as soon as it has been determined, starting with the nodes that have no dependencies.
+
+    :param graph: The indexed graph to sort.
+    :param excluded_edges: Edges of node indices that are excluded from the graph before sorting it. Nodes whose edges
+        are all excluded are not part of the sorting.
+    :return: iterator over the topological levels of the graph as lists of node indices in order beginning with all
+        dependencyless nodes.
+    :raises RuntimeError: if a cyclic graph is detected, which is only raised after all levels preceding the cycle have
+        been yielded.
+    """
+    node_ins = graph.node_ins
+    node_outs = graph.node_outs
+    offsets = node_outs.offsets
+    targets = node_outs.targets
+
+    # Determine the number of incoming edges (in_degree) of each node from the CSR offsets, which is decremented as the
+    # nodes having an edge to the node are placed
+    in_degree = array("q", (node_ins.offsets[node + 1] - node_ins.offsets[node] for node in node_ins))
+
+    # Exclude the supplied edges by removing them from the in_degree of their end node and remembering them in
+    # excluded_outs so that they are skipped when their start node is placed. Nodes with only excluded edges are not
+    # part of the graph anymore.
+    excluded_outs: dict[int, set[int]] = {}
+    excluded_degree: dict[int, int] = {}
+    for edge_start, edge_end in excluded_edges:
+        excluded_outs.setdefault(edge_start, set()).add(edge_end)
+        in_degree[edge_end] -= 1
+        excluded_degree[edge_start] = excluded_degree.get(edge_start, 0) + 1
+        excluded_degree[edge_end] = excluded_degree.get(edge_end, 0) + 1
+    removed_nodes = {
+        node for node, degree in excluded_degree.items() if degree == node_ins.degree(node) + node_outs.degree(node)
+    }
+
+    num_unplaced_nodes = graph.num_nodes - len(removed_nodes)
+    if not num_unplaced_nodes:
+        msg = "Invalid graph detected"
+        raise RuntimeError(msg)
+
+    # Yield the topological levels of the graph in order beginning with all dependencyless nodes. Only the current
+    # level is kept as frontier to determine the next level.
+    dependencyless = [node for node in node_ins if not in_degree[node] and node not in removed_nodes]
+    while dependencyless:
+        # Set dependencyless nodes as the nodes of the next topological level
+        yield dependencyless
+        num_unplaced_nodes -= len(dependencyless)
+
+        # Decrement the in_degree of all followers of the just placed nodes as their dependency on those nodes is
+        # fulfilled. Followers whose in_degree reaches zero have no remaining dependencies and form the next level.
+        next_dependencyless = []
+        for node in dependencyless:
+            node_excluded_outs = excluded_outs.get(node)
+            for follower in targets[offsets[node] : offsets[node + 1]]:
+                if node_excluded_outs is not None and follower in node_excluded_outs:
+                    continue
+                in_degree[follower] -= 1
+                if not in_degree[follower]:
+                    next_dependencyless.append(follower)
+        dependencyless = next_dependencyless
 
-    return graph_topology
+    # If not all nodes could be placed then the remaining nodes are part of or depend on a cycle
+    if num_unplaced_nodes:
+        msg = "Cyclic graph detected in acyclic_toposort function"
+        raise RuntimeError(msg)
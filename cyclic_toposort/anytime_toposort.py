@@ -0,0 +1,141 @@
+"""Module providing an anytime variant of cyclic_toposort that refines a heuristic solution within a budget."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Generic
+
+from cyclic_toposort.cyclic_toposort import (
+    _cyclic_components,
+    _cyclic_toposort_recursive,
+    _sort_with_minimal_cyclic_edges,
+)
+from cyclic_toposort.graph import IndexedGraph, NodeT
+from cyclic_toposort.utils import (
+    SearchBudget,
+    SearchBudgetExhaustedError,
+    cycle_packing_lower_bound,
+    greedy_cyclic_edges,
+)
+
+
+@dataclass
+class AnytimeResult(Generic[NodeT]):
+    """Result of anytime_cyclic_toposort.
+
+    :ivar graph_topology: A list of sets representing the topological ordering of nodes.
+    :ivar cyclic_edges: A set of tuples representing the cyclic edges of the graph topology.
+    :ivar optimal: True if the cyclic edges are proven to be minimal and yield the fewest topological groupings.
+    :ivar lower_bound: The best determined lower bound on the minimal number of cyclic edges.
+    """
+
+    graph_topology: list[set[NodeT]]
+    cyclic_edges: set[tuple[NodeT, NodeT]]
+    optimal: bool
+    lower_bound: int
+
+
+def anytime_cyclic_toposort(
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None = None,
+    time_budget: float | None = None,
+    node_budget: int | None = None,
+) -> AnytimeResult[NodeT]:
+    """Perform a topological sorting on a potentially cyclic graph by first determining a set of cyclic edges for each
+    strongly connected component with a fast heuristic and then refining it with the exact recursive search of
+    cyclic_toposort until the supplied budget is exhausted.
+
+    :param edges: An iterable of tuples where each tuple represents a directed edge (start_node, end_node) in the graph.
+        Nodes can be of any hashable type.
+    :param start_node: An optional node. If provided, any edge leading into this node will be considered as a forced
+        cyclic edge.
+    :param time_budget: Optional wall-clock time in seconds after which the exact search is stopped.
+    :param node_budget: Optional amount of explored sets of cyclic edges after which the exact search is stopped.
+    :return: An AnytimeResult consisting of the graph topology and cyclic edges, as well as whether the result has been
+        proven optimal and the best lower bound on the minimal number of cyclic edges. If no budget is supplied then the
+        result is always optimal and equivalent to the result of cyclic_toposort.
+    """
+    graph = IndexedGraph.from_edges(edges)
+    budget = SearchBudget(time_budget=time_budget, node_budget=node_budget)
+
+    # If start_node is supplied then all edges leading into it are considered as forced cyclic edges
+    start_node_index = None if start_node is None else graph.label_indices.get(start_node)
+    cyclic_edges_forced = set()
+    if start_node_index is not None:
+        cyclic_edges_forced = {(edge_start, start_node_index) for edge_start in graph.node_ins[start_node_index]}
+
+    # Solve the smallest strongly connected components first, as they are the most likely to be solved exactly
+    components = sorted(_cyclic_components(graph=graph, start_node_index=start_node_index), key=len)
+
+    optimal = True
+    lower_bound = len(cyclic_edges_forced)
+    cyclic_edges: list[set[tuple[int, int]]] = [set()]
+    for component in components:
+        component_ins, component_outs = graph.subgraph_ins_outs(component)
+
+        # Determine a heuristic set of cyclic edges and a lower bound, between which the exact search looks for sets of
+        # cyclic edges of increasing size. Each search that finds no set of cyclic edges of at most its size refutes it
+        # and raises the lower bound. The first search that finds sets of cyclic edges finds all minimal sets of cyclic
+        # edges, which ensures the fewest topological groupings, and at the latest the search bounded by the size of the
+        # heuristic set of cyclic edges does. If the budget is exhausted then the sets of cyclic edges the interrupted
+        # search has found so far are kept, as they are smaller than the heuristic set of cyclic edges.
+        heuristic_cyclic_edges = greedy_cyclic_edges(node_ins=component_ins, node_outs=component_outs)
+        component_lower_bound = cycle_packing_lower_bound(node_outs=component_outs)
+        component_cyclic_edges = [heuristic_cyclic_edges]
+        try:
+            for max_cyclic_edges in range(component_lower_bound, len(heuristic_cyclic_edges) + 1):
+                searched_cyclic_edges = _cyclic_toposort_recursive(
+                    node_ins=component_ins,
+                    node_outs=component_outs,
+                    budget=budget,
+                    max_cyclic_edges=max_cyclic_edges,
+                )
+                if searched_cyclic_edges:
+                    component_cyclic_edges = searched_cyclic_edges
+                    break
+                component_lower_bound = max_cyclic_edges + 1
+        except SearchBudgetExhaustedError as error:
+            if error.cyclic_edges:
+                component_cyclic_edges = error.cyclic_edges
+            optimal = False
+
+        lower_bound += component_lower_bound
+        cyclic_edges = [
+            cyclic_edges_set.union(component_cyclic_edges_set)
+            for cyclic_edges_set in cyclic_edges
+            for component_cyclic_edges_set in component_cyclic_edges
+        ]
+
+    # Select the set of cyclic edges that yields the fewest topological groupings like cyclic_toposort and map the
+    # graph topology and cyclic edges back to the node labels
+    graph_topology, cyclic_edges_set = _sort_with_minimal_cyclic_edges(
+        graph=graph,
+        cyclic_edges=cyclic_edges,
+        cyclic_edges_forced=cyclic_edges_forced,
+    )
+    return AnytimeResult(
+        graph_topology=[graph.to_labels(level) for level in graph_topology],
+        cyclic_edges=graph.to_label_edges(cyclic_edges_set),
+        optimal=optimal,
+        lower_bound=lower_bound,
+    )
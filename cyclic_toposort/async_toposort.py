@@ -0,0 +1,180 @@
+"""Module providing an asyncio entry point to cyclic_toposort with cooperative cancellation."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import threading
+from collections.abc import Hashable, Iterable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Literal
+
+from cyclic_toposort.cyclic_toposort import _cyclic_toposort_indexed
+from cyclic_toposort.graph import IndexedGraph, NodeT
+from cyclic_toposort.utils import SolverStats
+
+# Number of explored sets of cyclic edges after which the search checks whether it has been cancelled
+CANCELLATION_CHECK_INTERVAL = 100
+
+
+@dataclass
+class _InFlightSearch:
+    """Search of async_cyclic_toposort that is shared by all concurrent calls for the same graph and start node until it
+    is done or all of them have been cancelled.
+    """
+
+    future: "asyncio.Future[tuple[list[set[Any]], set[tuple[Any, Any]]]]"
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    num_waiters: int = 0
+
+
+# Searches in flight, keyed by the event loop, the engine and the distinct edges and start node of their graph
+_in_flight_searches: dict[tuple[asyncio.AbstractEventLoop, str, Hashable], _InFlightSearch] = {}
+
+
+async def async_cyclic_toposort(
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None = None,
+    engine: Literal["recursive", "bitmask"] = "recursive",
+    timeout: float | None = None,
+    executor: Executor | None = None,
+) -> tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]:
+    """Perform the topological sorting of cyclic_toposort in an executor without blocking the event loop. Concurrent
+    calls for the same graph and start node share a single search. If a call is cancelled or its timeout expires while
+    no other call awaits the shared search, the search is cancelled as well and the worker thread stops at its next
+    cancellation check of the recursive engine. The bitmask engine can't be interrupted and finishes its current
+    strongly connected component.
+
+    :param edges: An iterable of tuples where each tuple represents a directed edge (start_node, end_node) in the graph.
+        Nodes can be of any hashable type.
+    :param start_node: An optional node. If provided, any edge leading into this node will be considered as a forced
+        cyclic edge.
+    :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component of the
+        graph, see cyclic_toposort.
+    :param timeout: Optional time in seconds after which the call is cancelled with an asyncio.TimeoutError.
+    :param executor: Optional executor running the search. It has to run the search in a thread of the current process
+        for the cancellation to reach it. By default the default executor of the event loop is used.
+    :return: A tuple containing the graph topology and the cyclic edges as returned by cyclic_toposort.
+    :raises ValueError: if an unknown engine is supplied or if a strongly connected component exceeds the node limit of
+        the bitmask engine.
+    :raises asyncio.TimeoutError: if the timeout expires before the search is done.
+    """
+    if engine not in ("recursive", "bitmask"):
+        msg = f"Unknown engine '{engine}' supplied to async_cyclic_toposort function"
+        raise ValueError(msg)
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    graph, graph_key = await asyncio.wait_for(
+        loop.run_in_executor(executor, partial(_index_graph, edges, start_node)),
+        timeout,
+    )
+
+    # Join the search for the same graph and start node that is already in flight or start a new one
+    search_key = (loop, engine, graph_key)
+    search = _in_flight_searches.get(search_key)
+    if search is None:
+        cancelled = threading.Event()
+        search = _InFlightSearch(
+            future=loop.run_in_executor(executor, _solve, graph, start_node, engine, cancelled),
+            cancelled=cancelled,
+        )
+        search.future.add_done_callback(lambda future: _finish_search(search_key, future))
+        _in_flight_searches[search_key] = search
+
+    search.num_waiters += 1
+    try:
+        graph_topology, cyclic_edges = await asyncio.wait_for(
+            asyncio.shield(search.future),
+            None if deadline is None else deadline - loop.time(),
+        )
+    finally:
+        search.num_waiters -= 1
+        if not search.num_waiters and not search.future.done():
+            search.cancelled.set()
+            if _in_flight_searches.get(search_key) is search:
+                del _in_flight_searches[search_key]
+
+    # Return copies as the result is shared by all calls that awaited the search
+    return [set(level) for level in graph_topology], set(cyclic_edges)
+
+
+def _index_graph(
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None,
+) -> tuple[IndexedGraph[NodeT], Hashable]:
+    """Create the indexed graph of the supplied edges and the key identifying the graph and start node among the
+    searches in flight.
+
+    :param edges: An iterable of tuples where each tuple represents a directed edge (start_node, end_node) in the graph.
+    :param start_node: The optional start node.
+    :return: A tuple containing the indexed graph and the frozenset of its distinct edges together with the start node
+        if it is a node of the graph.
+    """
+    graph = IndexedGraph.from_edges(edges)
+    graph_edges = frozenset(graph.to_label_edges(graph.edges()))
+    return graph, (graph_edges, start_node if start_node in graph.label_indices else None)
+
+
+def _solve(
+    graph: IndexedGraph[NodeT],
+    start_node: NodeT | None,
+    engine: Literal["recursive", "bitmask"],
+    cancelled: threading.Event,
+) -> tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]:
+    """Perform the topological sorting of cyclic_toposort on an indexed graph in a worker thread, checking for the
+    cancellation of the search every CANCELLATION_CHECK_INTERVAL explored sets of cyclic edges.
+
+    :param graph: The indexed graph to sort.
+    :param start_node: The optional start node.
+    :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component.
+    :param cancelled: Event that is set once the search is cancelled.
+    :return: A tuple containing the graph topology and the cyclic edges, both mapped back to the node labels.
+    :raises SearchCancelledError: if the search is cancelled.
+    """
+    stats = SolverStats(progress=lambda _: cancelled.is_set(), progress_interval=CANCELLATION_CHECK_INTERVAL)
+    graph_topology, cyclic_edges_set = _cyclic_toposort_indexed(
+        graph=graph,
+        start_node=start_node,
+        engine=engine,
+        cache=None,
+        pool=None,
+        stats=stats,
+    )
+    return [graph.to_labels(level) for level in graph_topology], graph.to_label_edges(cyclic_edges_set)
+
+
+def _finish_search(
+    search_key: tuple[asyncio.AbstractEventLoop, str, Hashable],
+    future: "asyncio.Future[tuple[list[set[Any]], set[tuple[Any, Any]]]]",
+) -> None:
+    """Remove a done search from the searches in flight and retrieve the exception of a cancelled search, which no call
+    awaits anymore.
+
+    :param search_key: The key of the search among the searches in flight.
+    :param future: The done future of the search.
+    """
+    search = _in_flight_searches.get(search_key)
+    if search is not None and search.future is future:
+        del _in_flight_searches[search_key]
+    if not future.cancelled():
+        future.exception()
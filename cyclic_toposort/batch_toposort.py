@@ -0,0 +1,257 @@
+"""Module providing the sorting of many potentially cyclic graphs, solving each distinct graph structure once."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Generic, Literal
+
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.graph import IndexedGraph, NodeT
+
+
+@dataclass
+class BatchResult(Generic[NodeT]):
+    """Result of cyclic_toposort_many.
+
+    :ivar results: The result of cyclic_toposort for each graph in the order of the supplied graphs, each a tuple of
+        the graph topology and the cyclic edges.
+    :ivar num_solves: The number of distinct graph structures that were solved.
+    :ivar num_saved_solves: The number of graphs whose result was mapped from an isomorphic graph instead of solved.
+    """
+
+    results: list[tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]]
+    num_solves: int
+    num_saved_solves: int
+
+
+def cyclic_toposort_many(
+    graphs: Iterable[Iterable[tuple[NodeT, NodeT]]],
+    start_nodes: Sequence[NodeT | None] | None = None,
+    engine: Literal["recursive", "bitmask"] = "recursive",
+    workers: int | None = None,
+) -> BatchResult[NodeT]:
+    """Perform a topological sorting on each of many potentially cyclic graphs. Graphs that are isomorphic to an
+    already seen graph, including the position of their start node, are not solved again. Instead the result of the
+    isomorphic graph is mapped to their node labels, which is an equally minimal result.
+
+    Isomorphic graphs are found by grouping the graphs by a Weisfeiler-Lehman hash of their structure and confirming an
+    isomorphism within each group with a backtracking search restricted to nodes of the same Weisfeiler-Lehman color.
+
+    :param graphs: An iterable of graphs, each an iterable of tuples where each tuple represents a directed edge
+        (start_node, end_node) in the graph. Nodes can be of any hashable type.
+    :param start_nodes: An optional start node for each graph, whose incoming edges are considered as forced cyclic
+        edges, or None for no start node.
+    :param engine: The engine used by cyclic_toposort to determine the minimal cyclic edges.
+    :param workers: An optional number of worker processes the distinct graph structures are solved in.
+    :return: A BatchResult consisting of the result of each graph as returned by cyclic_toposort as well as the number
+        of solved graphs and the number of graphs whose solve was saved.
+    :raises ValueError: if the number of start nodes differs from the number of graphs.
+    """
+    indexed_graphs = [IndexedGraph.from_edges(edges) for edges in graphs]
+    if start_nodes is None:
+        start_nodes = [None] * len(indexed_graphs)
+    if len(start_nodes) != len(indexed_graphs):
+        msg = "Number of start nodes supplied to cyclic_toposort_many differs from the number of graphs"
+        raise ValueError(msg)
+
+    # Assign each graph to an isomorphic representative graph, which is the first graph of its structure, together with
+    # the mapping of each node index of the representative to the isomorphic node index of the graph
+    representatives: list[int] = []
+    representative_groups: dict[int, list[int]] = {}
+    graph_colors: list[list[int]] = []
+    graph_isomorphisms: list[tuple[int, list[int]]] = []
+    start_node_indices = [
+        None if start_node is None else graph.label_indices.get(start_node)
+        for graph, start_node in zip(indexed_graphs, start_nodes, strict=True)
+    ]
+    for graph_index, (graph, start_node_index) in enumerate(zip(indexed_graphs, start_node_indices, strict=True)):
+        colors = _weisfeiler_lehman_colors(graph=graph, start_node_index=start_node_index)
+        graph_colors.append(colors)
+
+        structure_hash = hash((graph.num_nodes, graph.num_edges, *sorted(Counter(colors).items())))
+        group = representative_groups.setdefault(structure_hash, [])
+        for representative_index in group:
+            isomorphism = _find_isomorphism(
+                graph=indexed_graphs[representative_index],
+                colors=graph_colors[representative_index],
+                other_graph=graph,
+                other_colors=colors,
+            )
+            if isomorphism is not None:
+                graph_isomorphisms.append((representative_index, isomorphism))
+                break
+        else:
+            group.append(graph_index)
+            representatives.append(graph_index)
+            graph_isomorphisms.append((graph_index, list(range(graph.num_nodes))))
+
+    # Solve each representative graph on its node indices, possibly distributed to a process pool
+    representative_edges = [list(indexed_graphs[index].edges()) for index in representatives]
+    representative_start_nodes = [start_node_indices[index] for index in representatives]
+    solve = partial(_cyclic_toposort_indices, engine=engine)
+    if workers is not None and workers > 1 and len(representatives) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            solutions = list(executor.map(solve, representative_edges, representative_start_nodes))
+    else:
+        solutions = list(map(solve, representative_edges, representative_start_nodes))
+    representative_solutions = dict(zip(representatives, solutions, strict=True))
+
+    # Map the solution of each representative through the isomorphism to the node labels of each graph
+    results: list[tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]] = []
+    for graph, (representative_index, isomorphism) in zip(indexed_graphs, graph_isomorphisms, strict=True):
+        graph_topology, cyclic_edges = representative_solutions[representative_index]
+        results.append(
+            (
+                [graph.to_labels(isomorphism[node] for node in level) for level in graph_topology],
+                graph.to_label_edges((isomorphism[start], isomorphism[end]) for start, end in cyclic_edges),
+            ),
+        )
+
+    return BatchResult(
+        results=results,
+        num_solves=len(representatives),
+        num_saved_solves=len(indexed_graphs) - len(representatives),
+    )
+
+
+def _cyclic_toposort_indices(
+    edges: list[tuple[int, int]],
+    start_node: int | None,
+    engine: Literal["recursive", "bitmask"],
+) -> tuple[list[set[int]], set[tuple[int, int]]]:
+    """Perform cyclic_toposort on a graph given as edges of node indices, which is picklable for a process pool.
+
+    :param edges: The edges of the graph as 2-tuples of node indices.
+    :param start_node: The optional node index of the start node.
+    :param engine: The engine used by cyclic_toposort to determine the minimal cyclic edges.
+    :return: The result of cyclic_toposort.
+    """
+    return cyclic_toposort(edges=edges, start_node=start_node, engine=engine)
+
+
+def _weisfeiler_lehman_colors(graph: IndexedGraph[NodeT], start_node_index: int | None = None) -> list[int]:
+    """Determine the stable Weisfeiler-Lehman color of each node of a graph. Each node is initially colored by its
+    degrees and whether it is the start node, and is then iteratively recolored by its color and the multisets of colors
+    of the nodes it has edges from and to, until the number of colors doesn't increase anymore. Isomorphic graphs have
+    the same multiset of colors and isomorphic nodes have the same color.
+
+    :param graph: The indexed graph.
+    :param start_node_index: The optional node index of the start node.
+    :return: List of the color of each node index.
+    """
+    node_ins = graph.node_ins
+    node_outs = graph.node_outs
+    colors = [
+        hash((node_ins.degree(node), node_outs.degree(node), node == start_node_index))
+        for node in range(graph.num_nodes)
+    ]
+
+    num_colors = len(set(colors))
+    while True:
+        refined_colors = [
+            hash(
+                (
+                    colors[node],
+                    tuple(sorted(colors[dependency] for dependency in node_ins[node])),
+                    tuple(sorted(colors[follower] for follower in node_outs[node])),
+                ),
+            )
+            for node in range(graph.num_nodes)
+        ]
+        num_refined_colors = len(set(refined_colors))
+        if num_refined_colors == num_colors:
+            return colors
+        colors = refined_colors
+        num_colors = num_refined_colors
+
+
+def _find_isomorphism(
+    graph: IndexedGraph[NodeT],
+    colors: list[int],
+    other_graph: IndexedGraph[NodeT],
+    other_colors: list[int],
+) -> list[int] | None:
+    """Search for an isomorphism between two graphs that maps each node to a node of the same Weisfeiler-Lehman color,
+    by assigning the nodes one at a time and backtracking if an assignment contradicts the edges between the already
+    assigned nodes.
+
+    :param graph: The first indexed graph.
+    :param colors: The Weisfeiler-Lehman colors of the nodes of the first graph.
+    :param other_graph: The second indexed graph.
+    :param other_colors: The Weisfeiler-Lehman colors of the nodes of the second graph.
+    :return: List mapping each node index of the first graph to its isomorphic node index of the second graph, or None
+        if the graphs are not isomorphic.
+    """
+    if (graph.num_nodes, graph.num_edges) != (other_graph.num_nodes, other_graph.num_edges):
+        return None
+
+    color_nodes: dict[int, list[int]] = {}
+    for node, color in enumerate(other_colors):
+        color_nodes.setdefault(color, []).append(node)
+
+    node_ins = [set(graph.node_ins[node]) for node in range(graph.num_nodes)]
+    node_outs = [set(graph.node_outs[node]) for node in range(graph.num_nodes)]
+    other_node_ins = [set(other_graph.node_ins[node]) for node in range(other_graph.num_nodes)]
+    other_node_outs = [set(other_graph.node_outs[node]) for node in range(other_graph.num_nodes)]
+
+    # Assign the nodes with the rarest colors first, as they have the fewest candidates
+    node_order = sorted(range(graph.num_nodes), key=lambda node: len(color_nodes.get(colors[node], ())))
+    mapping: dict[int, int] = {}
+    inverse_mapping: dict[int, int] = {}
+
+    def is_consistent(node: int, other_node: int) -> bool:
+        """Check if mapping node to other_node preserves all edges between node and the already assigned nodes."""
+        for adjacent, other_adjacent in ((node_ins, other_node_ins), (node_outs, other_node_outs)):
+            mapped_adjacent = [mapping[neighbor] for neighbor in adjacent[node] if neighbor in mapping]
+            if any(other_neighbor not in other_adjacent[other_node] for other_neighbor in mapped_adjacent):
+                return False
+            if len(mapped_adjacent) != sum(neighbor in inverse_mapping for neighbor in other_adjacent[other_node]):
+                return False
+        return True
+
+    # Depth-first search over the assignments of the nodes in node_order, whereas candidate_iterators holds the
+    # remaining candidates of each assigned node
+    candidate_iterators = [iter(color_nodes.get(colors[node_order[0]], ()))] if node_order else []
+    while candidate_iterators:
+        depth = len(candidate_iterators) - 1
+        node = node_order[depth]
+        if node in mapping:
+            del inverse_mapping[mapping.pop(node)]
+
+        for other_node in candidate_iterators[-1]:
+            if other_node not in inverse_mapping and is_consistent(node, other_node):
+                mapping[node] = other_node
+                inverse_mapping[other_node] = node
+                break
+        else:
+            candidate_iterators.pop()
+            continue
+
+        if len(mapping) == graph.num_nodes:
+            return [mapping[node] for node in range(graph.num_nodes)]
+        candidate_iterators.append(iter(color_nodes.get(colors[node_order[depth + 1]], ())))
+
+    return None
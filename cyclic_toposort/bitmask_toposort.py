@@ -0,0 +1,102 @@
+"""Module providing an exact bitmask dynamic programming solver for the minimal cyclic edges of a graph."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from functools import cache
+
+# Maximum number of nodes of a graph whose minimal cyclic edges are determined with the bitmask engine by default, as
+# its tables of 2^n entries per node subset take minutes to fill and don't fit into memory for larger graphs
+BITMASK_MAX_NODES = 20
+
+
+def bitmask_cyclic_edges(
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+    max_nodes: int = BITMASK_MAX_NODES,
+) -> list[set[tuple[int, int]]]:
+    """Determine all minimal sets of cyclic edges of a graph with a dynamic programming approach over subsets of nodes,
+    represented as Python int bitmasks. Runs in O(2^n * n) time and O(2^n) memory for a graph with n nodes, making it
+    suitable for cycle-heavy strongly connected components with few nodes but many edges.
+
+    Each linear ordering of the nodes turns the edges pointing from a later to an earlier node into cyclic edges and
+    each minimal set of cyclic edges corresponds to such an ordering. The minimal number of cyclic edges of an ordering
+    whose first nodes are the subset S is determined by appending each node of S to the best ordering of the rest of S.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param max_nodes: The maximum number of nodes of the graph.
+    :returns: A list of all distinct minimal sets of tuples, where each tuple represents a cyclic edge in the graph.
+    :raises ValueError: if the graph has more than max_nodes nodes.
+    """
+    if len(node_ins) > max_nodes:
+        msg = (
+            f"Graph of {len(node_ins)} nodes exceeds the limit of {max_nodes} nodes of the bitmask engine, use the "
+            "recursive engine instead"
+        )
+        raise ValueError(msg)
+
+    nodes = list(node_ins)
+    node_bits = {node: 1 << index for index, node in enumerate(nodes)}
+    out_masks = [sum(node_bits[follower] for follower in node_outs[node]) for node in nodes]
+    full_mask = (1 << len(nodes)) - 1
+
+    # min_cyclic_edges[mask] is the minimal number of cyclic edges of any ordering of the nodes in mask, which are the
+    # edges from each node to the nodes in mask preceding it in the ordering
+    min_cyclic_edges = [0] * (full_mask + 1)
+    for mask in range(1, full_mask + 1):
+        best = len(node_ins) ** 2
+        remaining_mask = mask
+        while remaining_mask:
+            node_bit = remaining_mask & -remaining_mask
+            remaining_mask ^= node_bit
+            prefix_mask = mask ^ node_bit
+            cost = min_cyclic_edges[prefix_mask] + (out_masks[node_bit.bit_length() - 1] & prefix_mask).bit_count()
+            best = min(best, cost)
+        min_cyclic_edges[mask] = best
+
+    @cache
+    def optimal_cyclic_edges(mask: int) -> frozenset[frozenset[tuple[int, int]]]:
+        """Backtrack all optimal orderings of the nodes in mask and determine their distinct sets of cyclic edges.
+
+        :param mask: bitmask of the nodes that make up the first nodes of an ordering.
+        :returns: Set of all distinct minimal sets of cyclic edges of the nodes in mask.
+        """
+        if not mask:
+            return frozenset({frozenset()})
+
+        cyclic_edges_sets: set[frozenset[tuple[int, int]]] = set()
+        remaining_mask = mask
+        while remaining_mask:
+            node_bit = remaining_mask & -remaining_mask
+            remaining_mask ^= node_bit
+            prefix_mask = mask ^ node_bit
+            node = nodes[node_bit.bit_length() - 1]
+            node_cyclic_edges = frozenset(
+                (node, follower) for follower in node_outs[node] if node_bits[follower] & prefix_mask
+            )
+            if min_cyclic_edges[prefix_mask] + len(node_cyclic_edges) == min_cyclic_edges[mask]:
+                cyclic_edges_sets.update(
+                    prefix_cyclic_edges | node_cyclic_edges for prefix_cyclic_edges in optimal_cyclic_edges(prefix_mask)
+                )
+        return frozenset(cyclic_edges_sets)
+
+    return [set(cyclic_edges_set) for cyclic_edges_set in optimal_cyclic_edges(full_mask)]
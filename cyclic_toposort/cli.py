@@ -0,0 +1,146 @@
+"""Module providing the cyclic-toposort command line entry point for sorting graphs stored in edge files."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import argparse
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+from cyclic_toposort.acyclic_toposort import iter_acyclic_toposort
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.edge_io import iter_binary_edges, iter_csv_edges, memmap_binary_edges
+from cyclic_toposort.numpy_toposort import numpy_acyclic_toposort
+from cyclic_toposort.result_cache import ResultCache
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Sort the graph of an edge file and write its topological levels and cyclic edges to stdout or an output file.
+    Each level is written as one line of space separated nodes, followed by the cyclic edges in the CSV edge format.
+
+    :param argv: Command line arguments, defaulting to sys.argv[1:].
+    :return: Exit code of the command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="cyclic-toposort",
+        description="Sort the directed graph of an edge file into topological levels with minimal cyclic edges.",
+    )
+    parser.add_argument("edge_file", type=Path, help="binary or CSV file of the edges of the graph")
+    parser.add_argument(
+        "--format",
+        choices=("binary", "csv"),
+        help="format of the edge file, inferred from its suffix if not supplied ('.csv' for CSV, binary otherwise)",
+    )
+    parser.add_argument("--dtype", choices=("int32", "int64"), default="int64", help="int type of a binary edge file")
+    parser.add_argument("--delimiter", default=",", help="delimiter of a CSV edge file and the written cyclic edges")
+    parser.add_argument("--start-node", type=int, help="integer node whose incoming edges are forced to be cyclic")
+    parser.add_argument(
+        "--acyclic",
+        action="store_true",
+        help="sort the graph as acyclic graph, writing each level as soon as it has been determined",
+    )
+    parser.add_argument("--numpy", action="store_true", help="sort an acyclic binary edge file with the NumPy backend")
+    parser.add_argument(
+        "--result-cache",
+        type=Path,
+        help="SQLite database file caching the results of cyclic graphs across runs",
+    )
+    parser.add_argument("--output", type=Path, help="file to write the result to instead of stdout")
+    args = parser.parse_args(argv)
+
+    edge_file_format = args.format or ("csv" if args.edge_file.suffix == ".csv" else "binary")
+    if args.numpy and not (args.acyclic and edge_file_format == "binary"):
+        parser.error("--numpy requires --acyclic and a binary edge file")
+    if args.numpy:
+        try:
+            import numpy as np  # noqa: F401
+        except ImportError:
+            parser.error("--numpy requires the numpy extra, install it with 'pip install cyclic-toposort[numpy]'")
+
+    edges: Iterable[tuple[int, int]]
+    if edge_file_format == "csv":
+        edges = iter_csv_edges(args.edge_file, delimiter=args.delimiter)
+    else:
+        edges = iter_binary_edges(args.edge_file, dtype=args.dtype)
+
+    try:
+        with _open_output(args.output) as output:
+            if args.numpy:
+                _write_levels(output, numpy_acyclic_toposort(*memmap_binary_edges(args.edge_file, dtype=args.dtype)))
+            elif args.acyclic:
+                _write_levels(output, iter_acyclic_toposort(edges))
+            else:
+                if args.result_cache is None:
+                    graph_topology, cyclic_edges = cyclic_toposort(edges, start_node=args.start_node)
+                else:
+                    with ResultCache(args.result_cache) as result_cache:
+                        graph_topology, cyclic_edges = cyclic_toposort(
+                            edges,
+                            start_node=args.start_node,
+                            result_cache=result_cache,
+                        )
+                _write_levels(output, graph_topology)
+                output.write("# cyclic edges\n")
+                for edge_start, edge_end in sorted(cyclic_edges):
+                    output.write(f"{edge_start}{args.delimiter}{edge_end}\n")
+    except (RuntimeError, ValueError) as error:
+        print(f"cyclic-toposort: error: {error}", file=sys.stderr)  # noqa: T201
+        return 1
+
+    return 0
+
+
+@contextmanager
+def _open_output(path: Path | None) -> Iterator[TextIO]:
+    """Open the output of the command, which is stdout if no output file is supplied. Otherwise a temporary file next to
+    the output file is written that only replaces the output file once the result has been written completely, so that
+    a failing sort leaves an existing output file untouched.
+
+    :param path: Optional path of the output file.
+    :return: Context manager yielding the text stream to write the result to.
+    """
+    if path is None:
+        yield sys.stdout
+        return
+
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open("x", encoding="utf-8") as output:
+            yield output
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_levels(output: TextIO, graph_topology: Iterable[set[int]]) -> None:
+    """Write each topological level as one line of space separated nodes as soon as it is available.
+
+    :param output: Text stream to write the levels to.
+    :param graph_topology: Iterable of the topological levels in order.
+    """
+    output.write("# levels\n")
+    for level in graph_topology:
+        output.write(" ".join(map(str, sorted(level))) + "\n")
@@ -0,0 +1,107 @@
+"""Module providing a compact array-based representation of the topological sorting of a graph."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic
+
+from cyclic_toposort.graph import NodeT
+
+
+class CompactTopology(Generic[NodeT]):
+    """Topological sorting of a graph stored as an array of the node indices of all levels in topological order and an
+    array of level offsets, requiring 8 bytes per node and level instead of a set per level. The node indices map to
+    the node labels via the labels of the sorted graph, which are shared and not copied.
+    """
+
+    __slots__ = ("labels", "order", "offsets", "_order_view")
+
+    def __init__(self, labels: Sequence[NodeT], order: "array[int]", offsets: "array[int]") -> None:
+        """Initialize the topology from its arrays. Use from_levels to create a topology from levels of node indices.
+
+        :param labels: Sequence mapping each node index to its label.
+        :param order: Array of the node indices of all levels in topological order.
+        :param offsets: Array of length num_levels + 1 whereas the node indices of level i are stored in
+            order[offsets[i]:offsets[i + 1]].
+        """
+        self.labels = labels
+        self.order = order
+        self.offsets = offsets
+        self._order_view = memoryview(order)
+
+    @classmethod
+    def from_levels(cls, labels: Sequence[NodeT], levels: Iterable[Iterable[int]]) -> "CompactTopology[NodeT]":
+        """Create a topology from levels of node indices, consuming the iterable once and copying each level into the
+        order array as soon as it has been supplied.
+
+        :param labels: Sequence mapping each node index to its label.
+        :param levels: Iterable of the topological levels as iterables of node indices.
+        :return: The compact topology.
+        """
+        order = array("q")
+        offsets = array("q", [0])
+        for level in levels:
+            order.extend(level)
+            offsets.append(len(order))
+        return cls(labels=labels, order=order, offsets=offsets)
+
+    def __reduce__(self) -> tuple[type["CompactTopology[NodeT]"], tuple[Sequence[NodeT], "array[int]", "array[int]"]]:
+        """Pickle the topology by its arrays, as the memoryview into the order can't be pickled."""
+        return CompactTopology, (self.labels, self.order, self.offsets)
+
+    def __len__(self) -> int:
+        """Return the number of topological levels."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, level: int) -> memoryview:
+        """Return a zero-copy view of the node indices of the supplied topological level.
+
+        :raises IndexError: if the level is out of range.
+        """
+        if not -len(self) <= level < len(self):
+            msg = f"Topological level {level} out of range"
+            raise IndexError(msg)
+        level %= len(self)
+        return self._order_view[self.offsets[level] : self.offsets[level + 1]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Iterate over zero-copy views of the node indices of all topological levels in order."""
+        for level in range(len(self)):
+            yield self._order_view[self.offsets[level] : self.offsets[level + 1]]
+
+    @property
+    def num_nodes(self) -> int:
+        """Return the number of sorted nodes."""
+        return len(self.order)
+
+    def level_labels(self, level: int) -> list[NodeT]:
+        """Return the labels of the nodes of the supplied topological level.
+
+        :raises IndexError: if the level is out of range.
+        """
+        labels = self.labels
+        return [labels[node] for node in self[level]]
+
+    def to_sets(self) -> list[set[NodeT]]:
+        """Return the topology as a list of sets of node labels, as returned by acyclic_toposort and cyclic_toposort."""
+        labels = self.labels
+        return [{labels[node] for node in level} for level in self]
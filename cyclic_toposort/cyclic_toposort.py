@@ -20,82 +20,447 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import multiprocessing
 import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack, closing
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
-from cyclic_toposort.acyclic_toposort import acyclic_toposort
-from cyclic_toposort.utils import generate_reduced_ins_outs
+from cyclic_toposort.acyclic_toposort import acyclic_toposort_indices, iter_acyclic_toposort_indices
+from cyclic_toposort.bitmask_toposort import bitmask_cyclic_edges
+from cyclic_toposort.compact_topology import CompactTopology
+from cyclic_toposort.graph import IndexedGraph, NodeT
+from cyclic_toposort.result_cache import ResultCache, graph_fingerprint
+from cyclic_toposort.utils import (
+    SearchBudget,
+    SearchBudgetExhaustedError,
+    SolverStats,
+    SubresultCache,
+    bitsets_to_ins_outs,
+    cycle_packing_lower_bound,
+    generate_reduced_ins_outs,
+    greedy_cyclic_edges,
+    ins_outs_to_bitsets,
+    strongly_connected_components,
+)
 
+if TYPE_CHECKING:
+    from multiprocessing.sharedctypes import Synchronized
 
-def cyclic_toposort(
-    edges: set[tuple[int, int]],
-    start_node: int | None = None,
-) -> tuple[list[set[int]], set[tuple[int, int]]]:
+# Minimum and maximum number of nodes of a graph that the recursive engine peels on the bitset representation of the
+# graph, whereas the cycle resolution always works on dicts of sets. Smaller graphs are peeled faster on dicts of sets
+# than they are converted to bitsets. Larger graphs are peeled on dicts of sets, as each step of the peeling scans nodes
+# with an operation on a bitset of all nodes. See benchmarks/peeling_benchmark.py for the gain on deep graphs.
+BITSET_MIN_NODES = 16
+BITSET_MAX_NODES = 256
+
+# State of each worker process of the process pool of cyclic_toposort, which is set by the pool initializer
+_worker_graph: IndexedGraph[Any] | None = None
+_worker_incumbent: "Synchronized[int] | None" = None
+_worker_cache: SubresultCache | None = None
+
+
+@dataclass
+class _ProcessPool:
+    """Process pool of cyclic_toposort together with the number of cyclic edges of the best solution found so far,
+    which is shared with all worker processes so that they can prune each other.
+    """
+
+    executor: ProcessPoolExecutor
+    incumbent: "Synchronized[int]"
+    workers: int
+
+
+@overload
+def cyclic_toposort(  # noqa: PLR0913
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None = None,
+    engine: Literal["recursive", "bitmask"] = "recursive",
+    cache: SubresultCache | None = None,
+    workers: int | None = None,
+    result_cache: ResultCache | None = None,
+    stats: SolverStats | None = None,
+    compact: Literal[False] = False,
+) -> tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]: ...
+
+
+@overload
+def cyclic_toposort(  # noqa: PLR0913
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None = None,
+    engine: Literal["recursive", "bitmask"] = "recursive",
+    cache: SubresultCache | None = None,
+    workers: int | None = None,
+    result_cache: ResultCache | None = None,
+    stats: SolverStats | None = None,
+    *,
+    compact: Literal[True],
+) -> tuple[CompactTopology[NodeT], set[tuple[NodeT, NodeT]]]: ...
+
+
+def cyclic_toposort(  # noqa: PLR0913
+    edges: Iterable[tuple[NodeT, NodeT]],
+    start_node: NodeT | None = None,
+    engine: Literal["recursive", "bitmask"] = "recursive",
+    cache: SubresultCache | None = None,
+    workers: int | None = None,
+    result_cache: ResultCache | None = None,
+    stats: SolverStats | None = None,
+    compact: bool = False,
+) -> tuple[list[set[NodeT]] | CompactTopology[NodeT], set[tuple[NodeT, NodeT]]]:
     """Perform a topological sorting on a potentially cyclic graph, returning a tuple consisting of a graph topology
     with the fewest topological groupings and a minimal set of cyclic edges.
 
-    :param edges: A set of tuples where each tuple represents a directed edge (start_node, end_node) in the graph.
+    :param edges: An iterable of tuples where each tuple represents a directed edge (start_node, end_node) in the graph.
+        Nodes can be of any hashable type.
     :param start_node: An optional node. If provided, any edge leading into this node will be considered as a forced
         cyclic edge.
+    :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component of the
+        graph. "recursive" declares edges cyclic one at a time and is exponential in the number of edges.
+        "bitmask" searches orderings of the nodes with dynamic programming over node subsets and is exponential in the
+        number of nodes, which makes it preferable for components with many edges but few nodes. It rejects components
+        of more than 20 nodes.
+    :param cache: An optional cache of sub-results of the recursive engine, keyed by the graphs it reaches after
+        declaring edges cyclic. The cache may be shared between calls and exposes hit and miss counters for tuning.
+        Worker processes use their own caches of the same size.
+    :param workers: An optional number of worker processes. If more than one, the cycle resolution branches of the
+        recursive engine and the sorting of each candidate set of minimal cyclic edges are distributed to a process
+        pool. The result is the same as the one of the serial search.
+    :param result_cache: An optional persistent cache of complete results, keyed by the fingerprint of the graph and the
+        start node. A valid cached result is returned without any search and a computed result is stored in the cache.
+        The nodes have to be integers, strings, bytes or tuples thereof, which have a canonical encoding.
+    :param stats: Optional statistics recording the explored search space and the time spent in each phase of the
+        search, whose progress callback may cancel the search. With worker processes only the search of the main
+        process is recorded.
+    :param compact: If True, return the topological ordering of nodes as CompactTopology, which stores the nodes of all
+        levels in a single array instead of a set per level.
     :return: A tuple containing:
         - A list of sets representing the topological ordering of nodes. Each set contains nodes at the same depth. The
-            amount of topological groupings is minimal out of all possible sets of cyclic edges.
+            amount of topological groupings is minimal out of all possible sets of cyclic edges. If compact is True, a
+            CompactTopology of the same topological ordering.
         - A set of tuples representing the cyclic edges that were identified in the graph and that yielded a graph
             topology with the fewest topological groupings.
+    :raises ValueError: if an unknown engine or less than one worker is supplied or if a strongly connected component
+        exceeds the node limit of the bitmask engine.
+    :raises SearchCancelledError: if the progress callback of the supplied stats cancels the search.
     """
-    node_ins: dict[int, set[int]] = {}
-    node_outs: dict[int, set[int]] = {}
-    cyclic_edges_forced: set[tuple[int, int]] = set()
+    if engine not in ("recursive", "bitmask"):
+        msg = f"Unknown engine '{engine}' supplied to cyclic_toposort function"
+        raise ValueError(msg)
+    if workers is not None and workers < 1:
+        msg = f"Invalid number of workers {workers} supplied to cyclic_toposort function"
+        raise ValueError(msg)
 
-    for edge_start, edge_end in edges:
-        # Don't consider cyclic node edges as not relevant for topological sorting
-        if edge_start == edge_end:
-            continue
+    graph = IndexedGraph.from_edges(edges)
+    fingerprint = None
+    if result_cache is not None:
+        fingerprint = graph_fingerprint(graph=graph, start_node=start_node)
+        cached_result = result_cache.get(fingerprint=fingerprint, graph=graph, start_node=start_node)
+        if cached_result is not None:
+            if compact:
+                label_indices = graph.label_indices
+                return (
+                    CompactTopology.from_levels(
+                        labels=graph.labels,
+                        levels=([label_indices[node] for node in level] for level in cached_result[0]),
+                    ),
+                    cached_result[1],
+                )
+            return cached_result
 
-        # Ensure the nodes exist in the dictionaries
-        node_ins.setdefault(edge_start, set())
-        node_outs.setdefault(edge_end, set())
+    with ExitStack() as exit_stack:
+        pool = None
+        if workers is not None and workers > 1:
+            incumbent = cast("Synchronized[int]", multiprocessing.Value("q", sys.maxsize))
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(graph, incumbent, None if cache is None else cache.maxsize),
+            )
+            pool = _ProcessPool(executor=exit_stack.enter_context(executor), incumbent=incumbent, workers=workers)
+        graph_topology, cyclic_edges_set = _cyclic_toposort_indexed(
+            graph=graph,
+            start_node=start_node,
+            engine=engine,
+            cache=cache,
+            pool=pool,
+            stats=stats,
+        )
 
-        # If start_node is supplied then violating edges are considered as forced cyclic edges
-        if start_node and start_node == edge_end:
-            cyclic_edges_forced.add((edge_start, edge_end))
-            continue
+    cyclic_edges_labels = graph.to_label_edges(cyclic_edges_set)
+    if result_cache is not None and fingerprint is not None:
+        result_cache.put(
+            fingerprint=fingerprint,
+            result=([graph.to_labels(level) for level in graph_topology], cyclic_edges_labels),
+        )
+    if compact:
+        return CompactTopology.from_levels(labels=graph.labels, levels=graph_topology), cyclic_edges_labels
+    return [graph.to_labels(level) for level in graph_topology], cyclic_edges_labels
 
-        # Store the edge_start and edge_end in the node_ins and node_outs dictionaries
-        node_ins.setdefault(edge_end, set()).add(edge_start)
-        node_outs.setdefault(edge_start, set()).add(edge_end)
 
-    # Recursively sort the (possibly cyclic) graph represented by the just determined node inputs and outputs, which
-    # take the potential start_node constraint in consideration.
-    cyclic_edges = _cyclic_toposort_recursive(
-        node_ins=node_ins,
-        node_outs=node_outs,
+def _cyclic_toposort_indexed(  # noqa: PLR0913
+    graph: IndexedGraph[NodeT],
+    start_node: NodeT | None,
+    engine: Literal["recursive", "bitmask"],
+    cache: SubresultCache | None,
+    pool: _ProcessPool | None,
+    stats: SolverStats | None = None,
+) -> tuple[list[list[int]], set[tuple[int, int]]]:
+    """Perform a topological sorting on a potentially cyclic indexed graph, returning a tuple consisting of a graph
+    topology with the fewest topological groupings and a minimal set of cyclic edges, both of node indices.
+
+    :param graph: The indexed graph to sort.
+    :param start_node: An optional node. If provided, any edge leading into this node will be considered as a forced
+        cyclic edge.
+    :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component.
+    :param cache: An optional cache of sub-results of the recursive engine.
+    :param pool: An optional process pool the work is distributed to.
+    :param stats: Optional statistics of the search.
+    :return: A tuple containing the graph topology as a list of lists of node indices and the cyclic edges as a set of
+        tuples of node indices.
+    """
+    # If start_node is supplied then all edges leading into it are considered as forced cyclic edges
+    start_node_index = None if start_node is None else graph.label_indices.get(start_node)
+    cyclic_edges_forced = set()
+    if start_node_index is not None:
+        cyclic_edges_forced = {(edge_start, start_node_index) for edge_start in graph.node_ins[start_node_index]}
+
+    # Determine the minimal cyclic edges of each non-trivial strongly connected component of the graph, which takes
+    # the potential start_node constraint into consideration, and combine them. The components are converted from the
+    # compact graph representation to dicts of sets as the solvers are exponential in the size of the components.
+    phase_start_time = time.perf_counter()
+    components = _cyclic_components(graph=graph, start_node_index=start_node_index)
+    if stats is not None:
+        stats.add_phase_time("components", phase_start_time)
+        phase_start_time = time.perf_counter()
+    cyclic_edges = _cyclic_toposort_components(
+        node_ins=graph.node_ins,
+        node_outs=graph.node_outs,
+        components=components,
+        solver=_component_solver(engine=engine, cache=cache, pool=pool, stats=stats),
     )
+    if stats is not None:
+        stats.add_phase_time("search", phase_start_time)
 
-    # If there are forced cyclic_edges due to a start_node constraint add them to the computed cyclic_edges
-    if cyclic_edges_forced:
-        for cyclic_edges_set in cyclic_edges:
-            cyclic_edges_set.update(cyclic_edges_forced)
+    return _sort_with_minimal_cyclic_edges(
+        graph=graph,
+        cyclic_edges=cyclic_edges,
+        cyclic_edges_forced=cyclic_edges_forced,
+        pool=pool,
+        stats=stats,
+    )
 
-    # Determine the topological groupings for each set of minimal cyclic edges and return the graph topology with
-    # the least amount of topological groupings and its corresponding cyclic edges
-    graph_topologies = [
-        (acyclic_toposort(edges - cyclic_edges_set), cyclic_edges_set) for cyclic_edges_set in cyclic_edges
-    ]
-    return min(graph_topologies, key=lambda x: len(x[0]))
+
+def _sort_with_minimal_cyclic_edges(
+    graph: IndexedGraph[NodeT],
+    cyclic_edges: list[set[tuple[int, int]]],
+    cyclic_edges_forced: set[tuple[int, int]],
+    pool: _ProcessPool | None = None,
+    stats: SolverStats | None = None,
+) -> tuple[list[list[int]], set[tuple[int, int]]]:
+    """Select the set of minimal cyclic edges of an indexed graph that yields the fewest topological groupings and
+    sort the graph without it.
+
+    :param graph: The indexed graph to sort.
+    :param cyclic_edges: The minimal sets of cyclic edges of the graph as sets of tuples of node indices.
+    :param cyclic_edges_forced: The forced cyclic edges due to a start node constraint, which are added to each set.
+    :param pool: An optional process pool the counting of topological groupings is distributed to.
+    :param stats: Optional statistics of the search.
+    :return: A tuple containing the graph topology as a list of lists of node indices and the cyclic edges as a set of
+        tuples of node indices.
+    """
+    phase_start_time = time.perf_counter()
+
+    # Add the forced cyclic_edges due to a potential start_node constraint to the computed cyclic_edges. As the sets of
+    # minimal cyclic edges are combined from the components and resolution branches, the same set may occur multiple
+    # times and is only evaluated once. The sets are evaluated in the order of their sorted edges, which breaks ties
+    # between sets yielding the same number of topological groupings and makes the result independent of the order in
+    # which the sets were found.
+    candidates = sorted(
+        {frozenset(cyclic_edges_set | cyclic_edges_forced) for cyclic_edges_set in cyclic_edges},
+        key=sorted,
+    )
+    if stats is not None:
+        stats.candidates_tied = len(candidates)
+
+    # Determine the graph topology with the least amount of topological groupings and its corresponding cyclic edges
+    graph_topology: list[list[int]] | None
+    if len(candidates) == 1:
+        cyclic_edges_set = candidates[0]
+        graph_topology = None
+    elif pool is None:
+        cyclic_edges_set, graph_topology = _select_fewest_groupings(graph=graph, candidates=candidates, stats=stats)
+    else:
+        chunksize = max(1, len(candidates) // (4 * pool.workers))
+        num_levels = list(pool.executor.map(_count_worker_levels, candidates, chunksize=chunksize))
+        cyclic_edges_set = candidates[min(range(len(candidates)), key=num_levels.__getitem__)]
+        graph_topology = None
+        if stats is not None:
+            stats.candidates_evaluated += len(candidates)
+    if stats is not None:
+        stats.add_phase_time("tie_break", phase_start_time)
+        phase_start_time = time.perf_counter()
+
+    if graph_topology is None:
+        graph_topology = acyclic_toposort_indices(graph=graph, excluded_edges=cyclic_edges_set)
+    if stats is not None:
+        stats.add_phase_time("final_sort", phase_start_time)
+    return graph_topology, set(cyclic_edges_set)
+
+
+def _select_fewest_groupings(
+    graph: IndexedGraph[NodeT],
+    candidates: list[frozenset[tuple[int, int]]],
+    stats: SolverStats | None = None,
+) -> tuple[frozenset[tuple[int, int]], list[list[int]]]:
+    """Select the first of the supplied sets of minimal cyclic edges of an indexed graph that yields the fewest
+    topological groupings. The sets are evaluated lazily, only keeping the graph topology of the best set so far. The
+    sorting of each later set is aborted as soon as it reaches as many topological groupings as the best set and the
+    evaluation stops once a set reaches a lower bound on the number of topological groupings.
+
+    :param graph: The indexed graph.
+    :param candidates: The distinct sets of minimal cyclic edges of the graph, in the order in which ties are broken.
+    :param stats: Optional statistics of the search.
+    :return: A tuple containing the selected set of cyclic edges and the graph topology without them.
+    """
+    # The edges that are not cyclic in any set are part of each sorted graph, so the longest path along them is a lower
+    # bound on the number of topological groupings. As each set of cyclic edges is minimal, each sorted graph contains
+    # at least one edge and therefore at least two topological groupings.
+    candidates_union = frozenset().union(*candidates)
+    lower_bound = 2
+    if len(candidates_union) < graph.num_edges:
+        lower_bound = max(lower_bound, len(acyclic_toposort_indices(graph=graph, excluded_edges=candidates_union)))
+
+    best_candidate = candidates[0]
+    best_graph_topology = acyclic_toposort_indices(graph=graph, excluded_edges=best_candidate)
+    num_evaluated = 1
+    for candidate in candidates[1:]:
+        if len(best_graph_topology) <= lower_bound:
+            break
+        num_evaluated += 1
+        graph_topology: list[list[int]] = []
+        for level in iter_acyclic_toposort_indices(graph=graph, excluded_edges=candidate):
+            graph_topology.append(level)
+            if len(graph_topology) >= len(best_graph_topology):
+                break
+        else:
+            best_candidate, best_graph_topology = candidate, graph_topology
+
+    if stats is not None:
+        stats.candidates_evaluated += num_evaluated
+    return best_candidate, best_graph_topology
 
 
-def _cyclic_toposort_recursive(
+def _component_solver(
+    engine: Literal["recursive", "bitmask"],
+    cache: SubresultCache | None = None,
+    pool: _ProcessPool | None = None,
+    stats: SolverStats | None = None,
+) -> Callable[[dict[int, set[int]], dict[int, set[int]], int], list[set[tuple[int, int]]]]:
+    """Return the function determining the minimal cyclic edges of a strongly connected component with the supplied
+    engine, as used by _cyclic_toposort_components.
+
+    :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component.
+    :param cache: An optional cache of sub-results of the recursive engine.
+    :param pool: An optional process pool the work of the recursive engine is distributed to.
+    :param stats: Optional statistics of the search of the recursive engine.
+    :return: The function determining the minimal cyclic edges of a component given its node inputs and outputs.
+    """
+    if engine == "bitmask":
+        return lambda component_ins, component_outs, _: bitmask_cyclic_edges(component_ins, component_outs)
+    return lambda component_ins, component_outs, _: _cyclic_toposort_recursive(
+        node_ins=component_ins,
+        node_outs=component_outs,
+        cache=cache,
+        pool=pool,
+        stats=stats,
+    )
+
+
+def _cyclic_components(graph: IndexedGraph[NodeT], start_node_index: int | None = None) -> list[set[int]]:
+    """Determine the non-trivial strongly connected components of an indexed graph without the edges leading into the
+    start node, which contain all cycles of the graph.
+
+    :param graph: The indexed graph.
+    :param start_node_index: The optional node index of the start node, whose incoming edges are forced cyclic edges.
+    :return: A list of the non-trivial strongly connected components of the graph as sets of node indices.
+    """
+    components: list[set[int]] = []
+    for component in strongly_connected_components(graph.node_outs):
+        if len(component) == 1:
+            continue
+        if start_node_index in component:
+            components.extend(_split_component(graph=graph, component=component, start_node_index=start_node_index))
+        else:
+            components.append(component)
+
+    return components
+
+
+def _split_component(graph: IndexedGraph[NodeT], component: set[int], start_node_index: int) -> list[set[int]]:
+    """Determine the non-trivial strongly connected components that a strongly connected component of an indexed
+    graph splits up into without the edges leading into the start node it contains. Without its incoming edges the
+    start node can't be part of any cycle.
+
+    :param graph: The indexed graph.
+    :param component: The strongly connected component containing the start node as a set of node indices.
+    :param start_node_index: The node index of the start node, whose incoming edges are forced cyclic edges.
+    :return: A list of the non-trivial strongly connected components of the component without the start node.
+    """
+    _, component_outs = graph.subgraph_ins_outs(component - {start_node_index})
+    return [subcomponent for subcomponent in strongly_connected_components(component_outs) if len(subcomponent) > 1]
+
+
+def _cyclic_toposort_recursive(  # noqa: PLR0913
     node_ins: dict[int, set[int]],
     node_outs: dict[int, set[int]],
+    budget: SearchBudget | None = None,
+    cache: SubresultCache | None = None,
+    max_cyclic_edges: int = sys.maxsize,
+    pool: _ProcessPool | None = None,
+    stats: SolverStats | None = None,
 ) -> list[set[tuple[int, int]]]:
     """Recursive helper function to perform a topological sorting on a potentially cyclic graph by finding minimal
     cyclic edges in the graph represented by the node inputs and outputs.
 
     :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
     :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
-    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph.
+    :param budget: An optional budget that is charged for each explored set of cyclic edges.
+    :param cache: An optional cache of the minimal cyclic edges of already resolved graphs.
+    :param max_cyclic_edges: The maximum number of cyclic edges of interest. Larger sets of cyclic edges are pruned.
+    :param pool: An optional process pool the cycle resolution branches are distributed to.
+    :param stats: Optional statistics of the search.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph. The list is empty if the
+        minimal sets of cyclic edges are larger than max_cyclic_edges.
+    :raises SearchBudgetExhaustedError: if the supplied budget is exhausted.
+    :raises SearchCancelledError: if the progress callback of the supplied stats cancels the search.
     """
-    cyclic_edges: list[set[tuple[int, int]]] = [set()]
+    # Only sort on the bitset representation if there are nodes to place, as the conversion to bitsets costs more than
+    # the sorting of small graphs and of the strongly connected graphs reached by the cycle resolution
+    if BITSET_MIN_NODES <= len(node_ins) <= BITSET_MAX_NODES and (
+        not all(node_ins.values()) or not all(node_outs.values())
+    ):
+        nodes = list(node_ins)
+        in_masks, out_masks = ins_outs_to_bitsets(nodes=nodes, node_ins=node_ins, node_outs=node_outs)
+        return _cyclic_toposort_bitsets(
+            node_ins=node_ins,
+            node_outs=node_outs,
+            nodes=nodes,
+            in_masks=in_masks,
+            out_masks=out_masks,
+            budget=budget,
+            cache=cache,
+            max_cyclic_edges=max_cyclic_edges,
+            pool=pool,
+            stats=stats,
+        )
+
+    if stats is not None:
+        stats.recursive_calls += 1
+        peeling_start_time = time.perf_counter()
 
     while True:
         #### FORWARD SORTING ###########################################################################################
@@ -112,69 +477,476 @@ def _cyclic_toposort_recursive(
 
                 if not followerless:
                     #### CYCLE RESOLUTION ##############################################################################
-                    min_number_cyclic_edges = sys.maxsize
-
-                    # Recreate edge list from current state of node_ins
-                    edges = {
-                        (edge_start, edge_end) for edge_end, incomings in node_ins.items() for edge_start in incomings
-                    }
-
-                    # Iteratively and randomly declare more and more edges as cyclic and see how well the resulting
-                    # graph (represented as reduced_node_ins and reduced_node_outs) is sortable.
-                    for reduced_node_ins, reduced_node_outs, forced_cyclic_edges in generate_reduced_ins_outs(
-                        edges=edges,
+                    if stats is not None:
+                        stats.add_phase_time("peeling", peeling_start_time)
+                    return _resolve_cycles(
                         node_ins=node_ins,
                         node_outs=node_outs,
-                    ):
-                        # Break if the necessary cyclic edges are higher than the already found minimum number of
-                        # cyclic edges
-                        if len(forced_cyclic_edges) > min_number_cyclic_edges:
-                            break
-
-                        # Recursively check for the minimum amount of cyclic edges in the resulting restgraph
-                        reduced_cyclic_edges = _cyclic_toposort_recursive(
-                            node_ins=reduced_node_ins,
-                            node_outs=reduced_node_outs,
-                        )
-
-                        # If a new minimal amount of cyclic edges has been found update the min_number_cyclic_edges
-                        # variables and only save the new min cyclic edges
-                        total_cyclic_edges = len(forced_cyclic_edges) + len(reduced_cyclic_edges[0])
-                        if total_cyclic_edges < min_number_cyclic_edges:
-                            min_number_cyclic_edges = total_cyclic_edges
-                            cyclic_edges = [
-                                reduced_cyclic_edges_set.union(forced_cyclic_edges)
-                                for reduced_cyclic_edges_set in reduced_cyclic_edges
-                            ]
-                        # If a set of cyclic edges has been found that has the same size as the current minimum,
-                        # save these cyclic edges as well
-                        elif total_cyclic_edges == min_number_cyclic_edges:
-                            for reduced_cyclic_edges_set in reduced_cyclic_edges:
-                                cyclic_edges.append(reduced_cyclic_edges_set.union(forced_cyclic_edges))
-
-                    return cyclic_edges
+                        budget=budget,
+                        cache=cache,
+                        max_cyclic_edges=max_cyclic_edges,
+                        pool=pool,
+                        stats=stats,
+                    )
                     ####################################################################################################
 
-                # Remove nodes with no outgoing edges from consideration
-                for node in followerless:
-                    del node_ins[node]
-                    del node_outs[node]
-
-                # Remove nodes that were placed/removed from consideration of being following nodes of other nodes
-                node_outs = {node: outgoings - followerless for node, outgoings in node_outs.items()}
+                # Remove nodes with no outgoing edges from consideration as well as from consideration of being
+                # following nodes of other nodes. New dicts are created as the supplied dicts must not be modified.
+                if stats is not None:
+                    stats.peeled_nodes += len(followerless)
+                node_ins = {node: incomings for node, incomings in node_ins.items() if node not in followerless}
+                node_outs = {
+                    node: outgoings - followerless for node, outgoings in node_outs.items() if node not in followerless
+                }
             ############################################################################################################
 
-        # Remove nodes with no incoming edges from consideration
-        for node in dependencyless:
-            del node_ins[node]
-            del node_outs[node]
+        # Remove nodes with no incoming edges from consideration as well as from consideration of being necessary
+        # nodes of other nodes. New dicts are created as the supplied dicts must not be modified.
+        if stats is not None:
+            stats.peeled_nodes += len(dependencyless)
+        node_outs = {node: outgoings for node, outgoings in node_outs.items() if node not in dependencyless}
+        node_ins = {
+            node: incomings - dependencyless for node, incomings in node_ins.items() if node not in dependencyless
+        }
 
         # Break if all nodes are placed
         if not node_ins:
             break
-
-        # Remove nodes that were placed/removed from consideration of being necessary nodes of other nodes
-        node_ins = {node: incomings - dependencyless for node, incomings in node_ins.items()}
         ################################################################################################################
 
+    if stats is not None:
+        stats.add_phase_time("peeling", peeling_start_time)
+    return [set()]
+
+
+def _cyclic_toposort_bitsets(  # noqa: PLR0913
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+    nodes: list[int],
+    in_masks: list[int],
+    out_masks: list[int],
+    budget: SearchBudget | None = None,
+    cache: SubresultCache | None = None,
+    max_cyclic_edges: int = sys.maxsize,
+    pool: _ProcessPool | None = None,
+    stats: SolverStats | None = None,
+) -> list[set[tuple[int, int]]]:
+    """Perform the peeling of _cyclic_toposort_recursive on the bitset representation of a graph, whereas bit i
+    represents nodes[i]. Placing the nodes without incoming or outgoing edges only shrinks a bitset of the remaining
+    nodes, which are tested for remaining edges with a single big int operation each. The bitsets are only used for the
+    peeling, the cycle resolution and its branches work on dicts of sets. Only if nodes have been placed and cycles
+    remain are the node inputs and outputs of the remaining nodes created for the cycle resolution.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param nodes: List of all nodes of the graph.
+    :param in_masks: List of the bitset of the nodes from which each node receives edges.
+    :param out_masks: List of the bitset of the nodes to which each node sends edges.
+    :param budget: An optional budget that is charged for each explored set of cyclic edges.
+    :param cache: An optional cache of the minimal cyclic edges of already resolved graphs.
+    :param max_cyclic_edges: The maximum number of cyclic edges of interest. Larger sets of cyclic edges are pruned.
+    :param pool: An optional process pool the cycle resolution branches are distributed to.
+    :param stats: Optional statistics of the search.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph. The list is empty if the
+        minimal sets of cyclic edges are larger than max_cyclic_edges.
+    :raises SearchBudgetExhaustedError: if the supplied budget is exhausted.
+    :raises SearchCancelledError: if the progress callback of the supplied stats cancels the search.
+    """
+    if stats is not None:
+        stats.recursive_calls += 1
+        peeling_start_time = time.perf_counter()
+
+    remaining_mask = (1 << len(nodes)) - 1
+    remaining_indices = list(range(len(nodes)))
+    for masks, adjacent_masks in ((in_masks, out_masks), (out_masks, in_masks)):
+        # Forward sorting repeatedly places the nodes without incoming edges from remaining nodes and backward sorting
+        # then repeatedly places the nodes without outgoing edges to remaining nodes. Backward sorting doesn't create
+        # new nodes without incoming edges, so a single pass of each suffices. After the first step only the nodes
+        # adjacent to the just placed nodes can become placeable.
+        placed_indices = [index for index in remaining_indices if not masks[index] & remaining_mask]
+        while placed_indices:
+            if stats is not None:
+                stats.peeled_nodes += len(placed_indices)
+            candidate_mask = 0
+            for index in placed_indices:
+                remaining_mask ^= 1 << index
+                candidate_mask |= adjacent_masks[index]
+            candidate_mask &= remaining_mask
+
+            placed_indices = []
+            while candidate_mask:
+                lowest_bit = candidate_mask & -candidate_mask
+                candidate_mask ^= lowest_bit
+                index = lowest_bit.bit_length() - 1
+                if not masks[index] & remaining_mask:
+                    placed_indices.append(index)
+        remaining_indices = [index for index in remaining_indices if remaining_mask >> index & 1]
+
+    if stats is not None:
+        stats.add_phase_time("peeling", peeling_start_time)
+    if not remaining_mask:
+        return [set()]
+
+    #### CYCLE RESOLUTION ##############################################################################################
+    if len(remaining_indices) < len(nodes):
+        node_ins, node_outs = bitsets_to_ins_outs(
+            nodes=nodes,
+            in_masks=in_masks,
+            out_masks=out_masks,
+            node_mask=remaining_mask,
+        )
+    return _resolve_cycles(
+        node_ins=node_ins,
+        node_outs=node_outs,
+        budget=budget,
+        cache=cache,
+        max_cyclic_edges=max_cyclic_edges,
+        pool=pool,
+        stats=stats,
+    )
+
+
+def _cyclic_toposort_components(
+    node_ins: Mapping[int, Iterable[int]],
+    node_outs: Mapping[int, Iterable[int]],
+    components: list[set[int]],
+    solver: Callable[[dict[int, set[int]], dict[int, set[int]], int], list[set[tuple[int, int]]]],
+    max_cyclic_edges: int = sys.maxsize,
+) -> list[set[tuple[int, int]]]:
+    """Determine the minimal cyclic edges of a graph by determining the minimal cyclic edges of each of its non-trivial
+    strongly connected components independently and combining them.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param components: A list of the non-trivial strongly connected components of the graph as sets of nodes.
+    :param solver: The function determining the minimal cyclic edges of the subgraph induced by each component, given
+        the node inputs, node outputs and maximum number of cyclic edges of interest of the subgraph.
+    :param max_cyclic_edges: The maximum number of cyclic edges of interest. Larger sets of cyclic edges are pruned.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph. The list is empty if the
+        minimal sets of cyclic edges are larger than max_cyclic_edges.
+    """
+    # Create the subgraphs induced by the components, which contain all cycles the components are involved in
+    component_ins_outs = [
+        (
+            {node: component.intersection(node_ins[node]) for node in component},
+            {node: component.intersection(node_outs[node]) for node in component},
+        )
+        for component in components
+    ]
+
+    # If the number of cyclic edges is limited, determine how many cyclic edges each component may at most contribute
+    # given the lower bounds on the cyclic edges of all other components
+    lower_bounds = [
+        0 if max_cyclic_edges == sys.maxsize else cycle_packing_lower_bound(node_outs=component_outs)
+        for _, component_outs in component_ins_outs
+    ]
+    num_spare_cyclic_edges = max_cyclic_edges - sum(lower_bounds)
+    if num_spare_cyclic_edges < 0:
+        return []
+
+    cyclic_edges: list[set[tuple[int, int]]] = [set()]
+    for (component_ins, component_outs), lower_bound in zip(component_ins_outs, lower_bounds, strict=True):
+        component_cyclic_edges = solver(component_ins, component_outs, num_spare_cyclic_edges + lower_bound)
+        if not component_cyclic_edges:
+            return []
+        num_spare_cyclic_edges -= len(component_cyclic_edges[0]) - lower_bound
+
+        # Each minimal set of cyclic edges of the graph is the union of a minimal set of cyclic edges of each component
+        cyclic_edges = [
+            cyclic_edges_set.union(component_cyclic_edges_set)
+            for cyclic_edges_set in cyclic_edges
+            for component_cyclic_edges_set in component_cyclic_edges
+        ]
+
+    return cyclic_edges
+
+
+def _resolve_cycles(  # noqa: PLR0913
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+    budget: SearchBudget | None = None,
+    cache: SubresultCache | None = None,
+    max_cyclic_edges: int = sys.maxsize,
+    pool: _ProcessPool | None = None,
+    stats: SolverStats | None = None,
+) -> list[set[tuple[int, int]]]:
+    """Determine the minimal cyclic edges of a graph that has neither nodes without incoming nor nodes without outgoing
+    edges by declaring each edge as cyclic in turn and recursively sorting the resulting graph. The search is a branch
+    and bound, cutting off branches that can't yield minimal sets of cyclic edges according to a lower bound.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param budget: An optional budget that is charged for each explored set of cyclic edges.
+    :param cache: An optional cache of the minimal cyclic edges of already resolved graphs.
+    :param max_cyclic_edges: The maximum number of cyclic edges of interest. Larger sets of cyclic edges are pruned.
+    :param pool: An optional process pool the branches of the search are distributed to.
+    :param stats: Optional statistics of the search.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph. The list is empty if the
+        minimal sets of cyclic edges are larger than max_cyclic_edges.
+    :raises SearchBudgetExhaustedError: if the supplied budget is exhausted.
+    :raises SearchCancelledError: if the progress callback of the supplied stats cancels the search.
+    """
+    # Recreate edge list from current state of node_ins, which as a frozenset also serves as the canonical form of the
+    # graph in the cache, as the same graph is often reached by declaring the same edges cyclic in a different order.
+    # Only complete results are cached, which are valid for any max_cyclic_edges they don't exceed.
+    edges = {(edge_start, edge_end) for edge_end, incomings in node_ins.items() for edge_start in incomings}
+    cache_key = frozenset(edges)
+    if cache is not None:
+        cached_cyclic_edges = cache.get(cache_key)
+        if cached_cyclic_edges is not None:
+            return cached_cyclic_edges if len(cached_cyclic_edges[0]) <= max_cyclic_edges else []
+
+    # Cyclic edges can only lie within a strongly connected component (SCC) of the graph. If the graph is not a single
+    # SCC then resolve the cycles of each non-trivial SCC on its own and combine the results, as the edges connecting
+    # the SCCs are never cyclic. Within a single SCC every edge lies on a cycle and is therefore a candidate.
+    components = strongly_connected_components(node_outs)
+    if len(components) != 1:
+        try:
+            cyclic_edges = _cyclic_toposort_components(
+                node_ins=node_ins,
+                node_outs=node_outs,
+                components=[component for component in components if len(component) > 1],
+                solver=lambda component_ins, component_outs, component_max_cyclic_edges: _cyclic_toposort_recursive(
+                    node_ins=component_ins,
+                    node_outs=component_outs,
+                    budget=budget,
+                    cache=cache,
+                    max_cyclic_edges=component_max_cyclic_edges,
+                    pool=pool,
+                    stats=stats,
+                ),
+                max_cyclic_edges=max_cyclic_edges,
+            )
+        except SearchBudgetExhaustedError as error:
+            # The sets of cyclic edges found for a single component are no sets of cyclic edges of the whole graph
+            error.cyclic_edges = []
+            raise
+        if cache is not None and cyclic_edges:
+            cache.put(cache_key, cyclic_edges)
+        return cyclic_edges
+
+    # Cut off the search if more edge-disjoint cycles exist than the maximum number of cyclic edges, as at least one
+    # edge of each of them has to be cyclic. Otherwise bound the search by the number of cyclic edges of a heuristic
+    # solution, as the search only has to find sets of cyclic edges that are at least as small.
+    if cycle_packing_lower_bound(node_outs=node_outs) > max_cyclic_edges:
+        return []
+    min_number_cyclic_edges = min(max_cyclic_edges, len(greedy_cyclic_edges(node_ins=node_ins, node_outs=node_outs)))
+    cyclic_edges = []
+
+    if pool is not None:
+        cyclic_edges = _resolve_branches_in_parallel(
+            edges=edges,
+            node_ins=node_ins,
+            node_outs=node_outs,
+            min_number_cyclic_edges=min_number_cyclic_edges,
+            pool=pool,
+            stats=stats,
+        )
+        if cache is not None and cyclic_edges:
+            cache.put(cache_key, cyclic_edges)
+        return cyclic_edges
+
+    # Declare each edge as cyclic and see how well the resulting graph (represented as reduced_node_ins and
+    # reduced_node_outs) is sortable. The reduced graph is created in place and restored by the generator, which
+    # therefore has to be closed when breaking. The recursion depth counts the nested loops.
+    if stats is not None:
+        stats.recursion_depth += 1
+        stats.max_recursion_depth = max(stats.max_recursion_depth, stats.recursion_depth)
+    reduced_ins_outs = generate_reduced_ins_outs(edges=edges, node_ins=node_ins, node_outs=node_outs)
+    with closing(reduced_ins_outs):
+        try:
+            for reduced_node_ins, reduced_node_outs, forced_cyclic_edges in reduced_ins_outs:
+                # Each minimal set of cyclic edges of the graph contains some edge, without which it is a minimal set of
+                # cyclic edges of the graph reduced by this edge. As the recursion returns all minimal sets of cyclic
+                # edges of the reduced graph, the branches of single cyclic edges already find all minimal sets of
+                # cyclic edges, which the branches of larger sets of cyclic edges would only find again.
+                if len(forced_cyclic_edges) > 1:
+                    break
+
+                if budget is not None:
+                    budget.tick()
+                if stats is not None:
+                    stats.tick()
+
+                # Prune the branch if the edge-disjoint cycles of the reduced graph require more cyclic edges than the
+                # already found minimum number of cyclic edges leaves, as at least one edge of each of them has to be
+                # cyclic
+                lower_bound = len(forced_cyclic_edges) + cycle_packing_lower_bound(node_outs=reduced_node_outs)
+                if lower_bound > min_number_cyclic_edges:
+                    continue
+
+                # Recursively check for the minimum amount of cyclic edges in the resulting restgraph, pruning all
+                # reduced graphs that can't be made acyclic with at most the already found minimum number of cyclic
+                # edges
+                reduced_cyclic_edges = _cyclic_toposort_recursive(
+                    node_ins=reduced_node_ins,
+                    node_outs=reduced_node_outs,
+                    budget=budget,
+                    cache=cache,
+                    max_cyclic_edges=min_number_cyclic_edges - len(forced_cyclic_edges),
+                    stats=stats,
+                )
+                if not reduced_cyclic_edges:
+                    continue
+
+                # If a new minimal amount of cyclic edges has been found update the min_number_cyclic_edges variables
+                # and only save the new min cyclic edges
+                total_cyclic_edges = len(forced_cyclic_edges) + len(reduced_cyclic_edges[0])
+                if total_cyclic_edges < min_number_cyclic_edges:
+                    min_number_cyclic_edges = total_cyclic_edges
+                    cyclic_edges = [
+                        reduced_cyclic_edges_set.union(forced_cyclic_edges)
+                        for reduced_cyclic_edges_set in reduced_cyclic_edges
+                    ]
+                # If a set of cyclic edges has been found that has the same size as the current minimum, save these
+                # cyclic edges as well
+                elif total_cyclic_edges == min_number_cyclic_edges:
+                    for reduced_cyclic_edges_set in reduced_cyclic_edges:
+                        cyclic_edges.append(reduced_cyclic_edges_set.union(forced_cyclic_edges))
+        except SearchBudgetExhaustedError as error:
+            # Report the best sets of cyclic edges found so far for this graph instead of those of the reduced graph of
+            # the interrupted branch
+            error.cyclic_edges = cyclic_edges
+            raise
+    if stats is not None:
+        stats.recursion_depth -= 1
+
+    if cache is not None and cyclic_edges:
+        cache.put(cache_key, cyclic_edges)
+    return cyclic_edges
+
+
+def _resolve_branches_in_parallel(  # noqa: PLR0913
+    edges: set[tuple[int, int]],
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+    min_number_cyclic_edges: int,
+    pool: _ProcessPool,
+    stats: SolverStats | None = None,
+) -> list[set[tuple[int, int]]]:
+    """Determine the minimal cyclic edges of a graph like the serial loop of _resolve_cycles, but resolve the reduced
+    graph of each branch in a worker process of the process pool. The workers share the number of cyclic edges of the
+    best solution found so far as incumbent, which bounds each branch when it starts.
+
+    :param edges: Set of edges of the graph.
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param min_number_cyclic_edges: The initial upper bound on the number of cyclic edges of interest.
+    :param pool: The process pool the branches are distributed to.
+    :param stats: Optional statistics of the search, which record the submitted branches.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the graph. The list is empty if the
+        minimal sets of cyclic edges are larger than min_number_cyclic_edges.
+    """
+    pool.incumbent.value = min_number_cyclic_edges
+    branches: list[tuple[set[tuple[int, int]], Future[list[set[tuple[int, int]]]]]] = []
+    pending_branches: set[Future[list[set[tuple[int, int]]]]] = set()
+
+    reduced_ins_outs = generate_reduced_ins_outs(edges=edges, node_ins=node_ins, node_outs=node_outs)
+    with closing(reduced_ins_outs):
+        for reduced_node_ins, reduced_node_outs, forced_cyclic_edges in reduced_ins_outs:
+            # The branches of single cyclic edges already find all minimal sets of cyclic edges, see _resolve_cycles
+            if len(forced_cyclic_edges) > 1:
+                break
+            if stats is not None:
+                stats.tick()
+
+            # Prune the branch if the edge-disjoint cycles of the reduced graph require more cyclic edges than the
+            # minimum number of cyclic edges found by any worker leaves
+            if len(forced_cyclic_edges) + cycle_packing_lower_bound(node_outs=reduced_node_outs) > pool.incumbent.value:
+                continue
+
+            # Limit the number of pending branches so that each branch is bounded by a recent incumbent when it starts
+            if len(pending_branches) >= 2 * pool.workers:
+                _, pending_branches = wait(pending_branches, return_when=FIRST_COMPLETED)
+
+            # The reduced graph is restored in place by the generator and therefore copied before it is submitted
+            branch = pool.executor.submit(
+                _resolve_worker_branch,
+                {node: set(incomings) for node, incomings in reduced_node_ins.items()},
+                {node: set(outgoings) for node, outgoings in reduced_node_outs.items()},
+                len(forced_cyclic_edges),
+            )
+            branches.append((forced_cyclic_edges, branch))
+            pending_branches.add(branch)
+
+    # Combine the results of the branches in the order of the serial search, keeping all sets of cyclic edges of the
+    # minimal size. Branches that were explored beyond the serial search only yield larger sets of cyclic edges.
+    cyclic_edges: list[set[tuple[int, int]]] = []
+    for forced_cyclic_edges, branch in branches:
+        reduced_cyclic_edges = branch.result()
+        if not reduced_cyclic_edges:
+            continue
+
+        total_cyclic_edges = len(forced_cyclic_edges) + len(reduced_cyclic_edges[0])
+        if total_cyclic_edges < min_number_cyclic_edges:
+            min_number_cyclic_edges = total_cyclic_edges
+            cyclic_edges = []
+        if total_cyclic_edges == min_number_cyclic_edges:
+            for reduced_cyclic_edges_set in reduced_cyclic_edges:
+                cyclic_edges.append(reduced_cyclic_edges_set.union(forced_cyclic_edges))
+
     return cyclic_edges
+
+
+def _init_worker(
+    graph: IndexedGraph[Any],
+    incumbent: "Synchronized[int]",
+    cache_maxsize: int | None,
+) -> None:
+    """Initialize the state of a worker process of the process pool of cyclic_toposort.
+
+    :param graph: The indexed graph that is sorted.
+    :param incumbent: The number of cyclic edges of the best solution found so far, shared by all processes.
+    :param cache_maxsize: The size of the cache of sub-results of the worker process, or None for no cache.
+    """
+    global _worker_graph, _worker_incumbent, _worker_cache  # noqa: PLW0603
+    _worker_graph = graph
+    _worker_incumbent = incumbent
+    _worker_cache = None if cache_maxsize is None else SubresultCache(maxsize=cache_maxsize)
+
+
+def _resolve_worker_branch(
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+    num_forced_cyclic_edges: int,
+) -> list[set[tuple[int, int]]]:
+    """Determine the minimal cyclic edges of the reduced graph of a branch in a worker process, bounded by the shared
+    incumbent, and update the incumbent if a better solution was found.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :param num_forced_cyclic_edges: The number of cyclic edges that were declared cyclic to create the reduced graph.
+    :returns: A list of sets of tuples, where each tuple represents a cyclic edge in the reduced graph. The list is
+        empty if the branch can't improve on the incumbent.
+    """
+    if _worker_incumbent is None:
+        msg = "Worker process of cyclic_toposort has not been initialized"
+        raise RuntimeError(msg)
+
+    max_cyclic_edges = _worker_incumbent.value - num_forced_cyclic_edges
+    if max_cyclic_edges < 0:
+        return []
+
+    reduced_cyclic_edges = _cyclic_toposort_recursive(
+        node_ins=node_ins,
+        node_outs=node_outs,
+        cache=_worker_cache,
+        max_cyclic_edges=max_cyclic_edges,
+    )
+    if reduced_cyclic_edges:
+        total_cyclic_edges = num_forced_cyclic_edges + len(reduced_cyclic_edges[0])
+        with _worker_incumbent.get_lock():
+            _worker_incumbent.value = min(_worker_incumbent.value, total_cyclic_edges)
+    return reduced_cyclic_edges
+
+
+def _count_worker_levels(excluded_edges: frozenset[tuple[int, int]]) -> int:
+    """Determine the number of topological groupings of the graph of a worker process without the excluded edges.
+
+    :param excluded_edges: Edges of node indices that are excluded from the graph before sorting it.
+    :return: The number of topological groupings.
+    """
+    if _worker_graph is None:
+        msg = "Worker process of cyclic_toposort has not been initialized"
+        raise RuntimeError(msg)
+    return len(acyclic_toposort_indices(graph=_worker_graph, excluded_edges=excluded_edges))
@@ -0,0 +1,198 @@
+"""Module providing a directed acyclic graph whose topological sorting is kept up to date as edges change."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import heapq
+import itertools
+from collections.abc import Iterable
+from typing import Generic
+
+from cyclic_toposort.acyclic_toposort import iter_acyclic_toposort_indices
+from cyclic_toposort.graph import IndexedGraph, NodeT
+
+
+class DynamicToposort(Generic[NodeT]):
+    """Directed acyclic graph that keeps its topological sorting up to date as edges are added or removed. The
+    topological level of each node is the length of the longest path leading to it, which is the same sorting that
+    acyclic_toposort returns. Each change only repairs the levels of the nodes it affects, which are the nodes
+    following the changed edge whose longest incoming path changes.
+    """
+
+    __slots__ = ("_node_ins", "_node_outs", "_node_levels", "_level_nodes")
+
+    def __init__(self, edges: Iterable[tuple[NodeT, NodeT]] = ()) -> None:
+        """Initialize the graph and sort it once in linear time.
+
+        :param edges: iterable of edges represented as 2-tuples, whereas each 2-tuple represents the start-node and
+            end-node of an edge. Nodes can be of any hashable type.
+        :raises RuntimeError: if a cyclic graph is detected.
+        """
+        self._node_ins: dict[NodeT, set[NodeT]] = {}
+        self._node_outs: dict[NodeT, set[NodeT]] = {}
+        self._node_levels: dict[NodeT, int] = {}
+        self._level_nodes: list[set[NodeT]] = []
+
+        graph = IndexedGraph.from_edges(edges)
+        if not graph.num_nodes:
+            return
+        for node_level in iter_acyclic_toposort_indices(graph):
+            level_nodes = graph.to_labels(node_level)
+            for node in level_nodes:
+                self._node_levels[node] = len(self._level_nodes)
+            self._level_nodes.append(level_nodes)
+        for node in graph.labels:
+            self._node_ins[node] = set()
+            self._node_outs[node] = set()
+        for edge_start, edge_end in graph.to_label_edges(graph.edges()):
+            self._node_outs[edge_start].add(edge_end)
+            self._node_ins[edge_end].add(edge_start)
+
+    def __contains__(self, node: object) -> bool:
+        """Return True if the supplied node is part of an edge of the graph."""
+        return node in self._node_levels
+
+    def topology(self) -> list[set[NodeT]]:
+        """Return the current topological sorting of the graph as a list of sets, each set representing a topological
+        level, starting with the nodes that have no dependencies.
+        """
+        return [set(level_nodes) for level_nodes in self._level_nodes]
+
+    def level(self, node: NodeT) -> int:
+        """Return the topological level of the supplied node.
+
+        :raises KeyError: if the node is not part of the graph.
+        """
+        return self._node_levels[node]
+
+    def add_edge(self, edge_start: NodeT, edge_end: NodeT) -> None:
+        """Add an edge to the graph and repair the topological levels of all nodes following it whose level increases.
+        Self-referencing and already present edges are ignored.
+
+        :param edge_start: The start-node of the edge.
+        :param edge_end: The end-node of the edge.
+        :raises RuntimeError: if the edge would close a cycle, in which case the graph remains unchanged.
+        """
+        if edge_start == edge_end or edge_end in self._node_outs.get(edge_start, ()):
+            return
+
+        for node in (edge_start, edge_end):
+            if node not in self._node_levels:
+                self._node_ins[node] = set()
+                self._node_outs[node] = set()
+                self._set_level(node, 0)
+
+        start_level = self._node_levels[edge_start]
+        if self._node_levels[edge_end] <= start_level and self._reaches(edge_end, edge_start):
+            self._discard_if_isolated(edge_start)
+            self._discard_if_isolated(edge_end)
+            msg = f"Cyclic graph detected when adding edge ({edge_start!r}, {edge_end!r}) to DynamicToposort"
+            raise RuntimeError(msg)
+
+        self._node_outs[edge_start].add(edge_end)
+        self._node_ins[edge_end].add(edge_start)
+        self._repair_levels(edge_end)
+
+    def remove_edge(self, edge_start: NodeT, edge_end: NodeT) -> None:
+        """Remove an edge from the graph and repair the topological levels of all nodes following it whose level
+        decreases. Nodes without any remaining edges are removed from the graph.
+
+        :param edge_start: The start-node of the edge.
+        :param edge_end: The end-node of the edge.
+        :raises KeyError: if the edge is not part of the graph.
+        """
+        if edge_end not in self._node_outs.get(edge_start, ()):
+            raise KeyError((edge_start, edge_end))
+
+        self._node_outs[edge_start].remove(edge_end)
+        self._node_ins[edge_end].remove(edge_start)
+        self._discard_if_isolated(edge_start)
+        if not self._discard_if_isolated(edge_end):
+            self._repair_levels(edge_end)
+
+    def _reaches(self, node: NodeT, target: NodeT) -> bool:
+        """Determine if the target node is reachable from the supplied node. As levels strictly increase along each
+        edge, only nodes with a lower level than the target are searched.
+        """
+        target_level = self._node_levels[target]
+        visited = {node}
+        nodes_to_visit = [node]
+        while nodes_to_visit:
+            for follower in self._node_outs[nodes_to_visit.pop()]:
+                if follower == target:
+                    return True
+                if follower not in visited and self._node_levels[follower] < target_level:
+                    visited.add(follower)
+                    nodes_to_visit.append(follower)
+        return False
+
+    def _repair_levels(self, node: NodeT) -> None:
+        """Recompute the level of the supplied node from its dependencies and propagate changed levels to its
+        followers. Nodes are repaired in order of their previous level, which guarantees that all dependencies of a
+        node are final before the node is repaired, as changed dependencies have a lower previous level.
+        """
+        # Order nodes with the same previous level by their insertion as nodes are not required to be comparable
+        insertion_counter = itertools.count()
+        nodes_to_repair = [(self._node_levels[node], next(insertion_counter), node)]
+        queued = {node}
+        while nodes_to_repair:
+            _, _, node_to_repair = heapq.heappop(nodes_to_repair)
+            queued.remove(node_to_repair)
+            dependency_levels = (self._node_levels[dependency] for dependency in self._node_ins[node_to_repair])
+            node_level = 1 + max(dependency_levels, default=-1)
+            if node_level == self._node_levels[node_to_repair]:
+                continue
+            self._set_level(node_to_repair, node_level)
+            for follower in self._node_outs[node_to_repair]:
+                if follower not in queued:
+                    queued.add(follower)
+                    heapq.heappush(nodes_to_repair, (self._node_levels[follower], next(insertion_counter), follower))
+
+    def _set_level(self, node: NodeT, node_level: int) -> None:
+        """Move the supplied node to the supplied level, removing the node from its previous level if present."""
+        previous_level = self._node_levels.get(node)
+        if previous_level is not None:
+            self._level_nodes[previous_level].remove(node)
+        if node_level == len(self._level_nodes):
+            self._level_nodes.append(set())
+        self._level_nodes[node_level].add(node)
+        self._node_levels[node] = node_level
+        self._remove_empty_levels()
+
+    def _discard_if_isolated(self, node: NodeT) -> bool:
+        """Remove the supplied node from the graph if it has no remaining edges.
+
+        :return: True if the node was removed.
+        """
+        if self._node_ins[node] or self._node_outs[node]:
+            return False
+        del self._node_ins[node]
+        del self._node_outs[node]
+        self._level_nodes[self._node_levels.pop(node)].remove(node)
+        self._remove_empty_levels()
+        return True
+
+    def _remove_empty_levels(self) -> None:
+        """Remove empty levels from the end of the sorting. As each node of a level has a dependency in the preceding
+        level, only the last levels can become empty.
+        """
+        while self._level_nodes and not self._level_nodes[-1]:
+            self._level_nodes.pop()
@@ -0,0 +1,131 @@
+"""Module providing loaders that stream the edges of large graphs from binary and CSV edge files."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import mmap
+import struct
+from collections.abc import Iterator
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+EdgeDtype = Literal["int32", "int64"]
+
+# memoryview formats of the supported edge file dtypes
+EDGE_DTYPE_FORMATS: dict[EdgeDtype, Literal["i", "q"]] = {"int32": "i", "int64": "q"}
+
+
+def iter_binary_edges(
+    path: str | PathLike[str],
+    dtype: EdgeDtype = "int64",
+    chunk_size: int = 65536,
+) -> Iterator[tuple[int, int]]:
+    """Iterate over the edges of a binary edge file via mmap without reading the whole file into memory. The file is
+    a flat array of native byte order ints in which each pair of ints represents the start-node and end-node of an
+    edge.
+
+    :param path: Path of the binary edge file.
+    :param dtype: int type of the file, either 'int32' or 'int64'.
+    :param chunk_size: Number of edges that are converted to Python ints at once.
+    :return: iterator over the edges of the file as 2-tuples.
+    :raises ValueError: if the file size is not a multiple of the size of an edge.
+    """
+    item_format = EDGE_DTYPE_FORMATS[dtype]
+    edge_size = 2 * struct.calcsize(item_format)
+    with Path(path).open("rb") as edge_file:
+        file_size = edge_file.seek(0, 2)
+        if file_size % edge_size:
+            msg = f"Size of binary edge file {path} is not a multiple of the {dtype} edge size"
+            raise ValueError(msg)
+        if not file_size:
+            return
+
+        with mmap.mmap(edge_file.fileno(), 0, access=mmap.ACCESS_READ) as edge_map, memoryview(edge_map) as edge_view:
+            chunk_bytes = chunk_size * edge_size
+            for chunk_start in range(0, file_size, chunk_bytes):
+                # Convert a chunk of edges at once and release the views into the mmap before yielding them
+                chunk_view = edge_view[chunk_start : chunk_start + chunk_bytes]
+                with chunk_view, chunk_view.cast(item_format) as chunk_nodes:
+                    nodes = chunk_nodes.tolist()
+                yield from zip(nodes[::2], nodes[1::2], strict=True)
+
+
+def iter_csv_edges(
+    path: str | PathLike[str],
+    delimiter: str = ",",
+    chunk_size: int = 65536,
+) -> Iterator[tuple[int, int]]:
+    """Iterate over the edges of a CSV edge file in chunks of lines without reading the whole file into memory. Each
+    non-empty line holds the int start-node and end-node of an edge separated by the delimiter. Lines starting with '#'
+    are ignored.
+
+    :param path: Path of the CSV edge file.
+    :param delimiter: String separating the start-node and end-node of an edge.
+    :param chunk_size: Approximate number of bytes read at once.
+    :return: iterator over the edges of the file as 2-tuples.
+    :raises ValueError: if a line does not consist of two ints.
+    """
+    with Path(path).open(encoding="utf-8") as edge_file:
+        while lines := edge_file.readlines(chunk_size):
+            for line in lines:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                edge_start, edge_end = line.split(delimiter)
+                yield int(edge_start), int(edge_end)
+
+
+def memmap_binary_edges(
+    path: str | PathLike[str],
+    dtype: EdgeDtype = "int64",
+) -> tuple["NDArray[np.signedinteger]", "NDArray[np.signedinteger]"]:
+    """Map a binary edge file into memory via numpy.memmap and return zero-copy views of its edge start-nodes and
+    end-nodes, which can be supplied to numpy_acyclic_toposort directly.
+
+    :param path: Path of the binary edge file, a flat array of native byte order ints in which each pair of ints
+        represents the start-node and end-node of an edge.
+    :param dtype: int type of the file, either 'int32' or 'int64'.
+    :return: A 2-tuple consisting of the int array of the start-nodes and the int array of the end-nodes of all edges.
+    :raises ImportError: if NumPy is not installed.
+    :raises ValueError: if the file size is not a multiple of the size of an edge.
+    """
+    if np is None:
+        msg = "memmap_binary_edges requires NumPy, install it with the 'numpy' extra of cyclic-toposort"
+        raise ImportError(msg)
+
+    edge_size = 2 * np.dtype(dtype).itemsize
+    file_size = Path(path).stat().st_size
+    if file_size % edge_size:
+        msg = f"Size of binary edge file {path} is not a multiple of the {dtype} edge size"
+        raise ValueError(msg)
+    if not file_size:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+
+    edges = np.memmap(path, dtype=dtype, mode="r", shape=(file_size // edge_size, 2))
+    return edges[:, 0], edges[:, 1]
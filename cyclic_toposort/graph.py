@@ -0,0 +1,214 @@
+"""Module providing a compact integer-indexed graph representation for the cyclic_toposort package."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Generic, TypeVar
+
+NodeT = TypeVar("NodeT", bound=Hashable)
+
+
+class CSRAdjacency(Mapping[int, memoryview]):
+    """Read-only mapping of each node index of a graph to the sorted node indices it is adjacent to, stored in
+    compressed sparse row (CSR) format as an array of row offsets and an array of adjacent node indices.
+    """
+
+    __slots__ = ("offsets", "targets", "_targets_view")
+
+    def __init__(self, offsets: "array[int]", targets: "array[int]") -> None:
+        """Initialize the adjacency from its CSR arrays.
+
+        :param offsets: Array of length num_nodes + 1 whereas the adjacent nodes of node i are stored in
+            targets[offsets[i]:offsets[i + 1]].
+        :param targets: Array of the adjacent node indices of all nodes.
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self._targets_view = memoryview(targets)
+
+    def __reduce__(self) -> tuple[type["CSRAdjacency"], tuple["array[int]", "array[int]"]]:
+        """Pickle the adjacency by its CSR arrays, as the memoryview into the targets can't be pickled."""
+        return CSRAdjacency, (self.offsets, self.targets)
+
+    def __getitem__(self, node: int) -> memoryview:
+        """Return a zero-copy view of the node indices adjacent to the supplied node index."""
+        if not 0 <= node < len(self.offsets) - 1:
+            raise KeyError(node)
+        return self._targets_view[self.offsets[node] : self.offsets[node + 1]]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over all node indices."""
+        return iter(range(len(self.offsets) - 1))
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.offsets) - 1
+
+    def degree(self, node: int) -> int:
+        """Return the number of nodes adjacent to the supplied node index."""
+        return self.offsets[node + 1] - self.offsets[node]
+
+
+class IndexedGraph(Generic[NodeT]):
+    """Compact representation of a directed graph with arbitrary hashable node labels. Each label is mapped once to a
+    dense int index and the adjacency in both directions is stored in array-backed CSR format, requiring 16 bytes per
+    edge. Self-referencing and duplicate edges are dropped as they are not relevant for topological sorting.
+    """
+
+    __slots__ = ("labels", "label_indices", "node_ins", "node_outs")
+
+    def __init__(
+        self,
+        labels: list[NodeT],
+        label_indices: dict[NodeT, int],
+        node_ins: CSRAdjacency,
+        node_outs: CSRAdjacency,
+    ) -> None:
+        """Initialize the graph from its already indexed components. Use from_edges to create a graph from edges.
+
+        :param labels: List mapping each node index to its label.
+        :param label_indices: Dictionary mapping each label to its node index.
+        :param node_ins: Adjacency mapping each node index to the node indices that have edges directed towards it.
+        :param node_outs: Adjacency mapping each node index to the node indices it directs edges towards.
+        """
+        self.labels = labels
+        self.label_indices = label_indices
+        self.node_ins = node_ins
+        self.node_outs = node_outs
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[NodeT, NodeT]]) -> "IndexedGraph[NodeT]":
+        """Create a graph from an iterable of edges, consuming the iterable once.
+
+        :param edges: iterable of edges represented as 2-tuples, whereas each 2-tuple represents the start-label and
+            end-label of an edge
+        :return: The indexed graph.
+        """
+        labels: list[NodeT] = []
+        label_indices: dict[NodeT, int] = {}
+        edge_starts = array("q")
+        edge_ends = array("q")
+
+        for edge_start, edge_end in edges:
+            # Don't consider cyclic node edges as not relevant for topological sorting
+            if edge_start == edge_end:
+                continue
+
+            for label in (edge_start, edge_end):
+                if label not in label_indices:
+                    label_indices[label] = len(labels)
+                    labels.append(label)
+
+            edge_starts.append(label_indices[edge_start])
+            edge_ends.append(label_indices[edge_end])
+
+        return cls(
+            labels=labels,
+            label_indices=label_indices,
+            node_ins=_compress_adjacency(num_nodes=len(labels), rows=edge_ends, columns=edge_starts),
+            node_outs=_compress_adjacency(num_nodes=len(labels), rows=edge_starts, columns=edge_ends),
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Return the number of nodes of the graph."""
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        """Return the number of distinct edges of the graph."""
+        return len(self.node_outs.targets)
+
+    def edges(self) -> Iterator[tuple[int, int]]:
+        """Iterate over all edges of the graph as 2-tuples of node indices."""
+        for node in self.node_outs:
+            for follower in self.node_outs[node]:
+                yield node, follower
+
+    def subgraph_ins_outs(self, nodes: set[int]) -> tuple[dict[int, set[int]], dict[int, set[int]]]:
+        """Create the node inputs and outputs of the subgraph induced by the supplied node indices as dicts of sets,
+        which is the representation the exponential solvers operate on.
+
+        :param nodes: Set of node indices inducing the subgraph.
+        :return: A 2-tuple consisting of
+            - Dictionary mapping each node index to the set of node indices that have edges directed towards it.
+            - Dictionary mapping each node index to the set of node indices it directs edges towards.
+        """
+        return (
+            {node: nodes.intersection(self.node_ins[node]) for node in nodes},
+            {node: nodes.intersection(self.node_outs[node]) for node in nodes},
+        )
+
+    def to_labels(self, nodes: Iterable[int]) -> set[NodeT]:
+        """Map node indices back to a set of their labels.
+
+        :param nodes: Iterable of node indices.
+        :return: Set of the labels of the nodes.
+        """
+        labels = self.labels
+        return {labels[node] for node in nodes}
+
+    def to_label_edges(self, edges: Iterable[tuple[int, int]]) -> set[tuple[NodeT, NodeT]]:
+        """Map edges of node indices back to a set of edges of labels.
+
+        :param edges: Iterable of edges represented as 2-tuples of node indices.
+        :return: Set of the edges represented as 2-tuples of labels.
+        """
+        labels = self.labels
+        return {(labels[edge_start], labels[edge_end]) for edge_start, edge_end in edges}
+
+
+def _compress_adjacency(num_nodes: int, rows: "array[int]", columns: "array[int]") -> CSRAdjacency:
+    """Compress the pairs of row and column node indices into a CSR adjacency with sorted and deduplicated rows.
+
+    :param num_nodes: Number of nodes of the graph.
+    :param rows: Array of the row node index of each pair.
+    :param columns: Array of the column node index of each pair.
+    :return: The CSR adjacency mapping each row node index to its column node indices.
+    """
+    # Count the pairs of each row and determine the offset of each row in the unsorted columns with a prefix sum
+    offsets = array("q", bytes(8 * (num_nodes + 1)))
+    for row in rows:
+        offsets[row + 1] += 1
+    for node in range(num_nodes):
+        offsets[node + 1] += offsets[node]
+
+    # Distribute the columns into their rows
+    positions = array("q", offsets)
+    unsorted_columns = array("q", bytes(8 * len(columns)))
+    for row, column in zip(rows, columns, strict=True):
+        unsorted_columns[positions[row]] = column
+        positions[row] += 1
+
+    # Sort and deduplicate the columns of each row, skipping the rows with a single column
+    compressed_offsets = array("q", [0])
+    compressed_columns = array("q")
+    for node in range(num_nodes):
+        row_start, row_end = offsets[node], offsets[node + 1]
+        if row_end - row_start == 1:
+            compressed_columns.append(unsorted_columns[row_start])
+        elif row_end - row_start > 1:
+            compressed_columns.extend(sorted(set(unsorted_columns[row_start:row_end])))
+        compressed_offsets.append(len(compressed_columns))
+
+    return CSRAdjacency(offsets=compressed_offsets, targets=compressed_columns)
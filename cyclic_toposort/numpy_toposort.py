@@ -0,0 +1,131 @@
+"""Module providing an optional NumPy backend for sorting very large directed acyclic graphs given as int arrays."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+def numpy_acyclic_toposort(sources: "ArrayLike", targets: "ArrayLike") -> list[set[int]]:
+    """Create and return a topological sorting of an acyclic graph given as two int arrays of edge start-nodes and
+    edge end-nodes, using vectorized NumPy operations. Returns the same sorting as acyclic_toposort for the same edges.
+
+    :param sources: int array of the start-node of each edge. Nodes are non-negative ints.
+    :param targets: int array of the end-node of each edge, of the same length as sources.
+    :return: topological sorting of the graph represented by the input edges as a list of sets that represent each
+        topological level in order beginning with all dependencyless nodes.
+    :raises ImportError: if NumPy is not installed.
+    :raises ValueError: if the arrays have differing shapes or contain negative nodes.
+    :raises RuntimeError: if a cyclic graph is detected.
+    """
+    node_levels = numpy_acyclic_levels(sources, targets)
+
+    # Sort the placed nodes by their level and split them at the level boundaries
+    placed_nodes = np.flatnonzero(node_levels >= 0)
+    order = placed_nodes[np.argsort(node_levels[placed_nodes], kind="stable")]
+    level_offsets = np.cumsum(np.bincount(node_levels[order]))[:-1]
+    return [set(level.tolist()) for level in np.split(order, level_offsets)]
+
+
+def numpy_acyclic_levels(sources: "ArrayLike", targets: "ArrayLike") -> "NDArray[np.int64]":
+    """Determine the topological level of each node of an acyclic graph given as two int arrays of edge start-nodes
+    and edge end-nodes, using vectorized NumPy operations. This compact array result avoids creating a Python object
+    per node.
+
+    :param sources: int array of the start-node of each edge. Nodes are non-negative ints.
+    :param targets: int array of the end-node of each edge, of the same length as sources.
+    :return: int64 array of length max(node) + 1 holding the topological level of each node, beginning with 0 for all
+        dependencyless nodes, and -1 for all ints that are not a node of the graph.
+    :raises ImportError: if NumPy is not installed.
+    :raises ValueError: if the arrays have differing shapes or contain negative nodes.
+    :raises RuntimeError: if a cyclic graph is detected.
+    """
+    if np is None:
+        msg = "numpy_acyclic_levels requires NumPy, install it with the 'numpy' extra of cyclic-toposort"
+        raise ImportError(msg)
+
+    sources = np.asarray(sources, dtype=np.int64).ravel()
+    targets = np.asarray(targets, dtype=np.int64).ravel()
+    if sources.shape != targets.shape:
+        msg = "Edge sources and targets supplied to numpy_acyclic_levels differ in length"
+        raise ValueError(msg)
+
+    # Don't consider cyclic node edges as not relevant for topological sorting
+    not_self_referencing = sources != targets
+    sources = sources[not_self_referencing]
+    targets = targets[not_self_referencing]
+    if not sources.size:
+        msg = "Invalid graph detected"
+        raise RuntimeError(msg)
+    if min(sources.min(), targets.min()) < 0:
+        msg = "Negative node supplied to numpy_acyclic_levels"
+        raise ValueError(msg)
+
+    # Sort the edges by their start-node into CSR format so that the followers of node i are stored in
+    # sorted_targets[offsets[i]:offsets[i + 1]]. Duplicate edges don't need to be removed as they are counted in the
+    # in_degree as often as their end-node is decremented when their start-node is placed.
+    num_nodes = int(max(sources.max(), targets.max())) + 1
+    out_degree = np.bincount(sources, minlength=num_nodes)
+    in_degree = np.bincount(targets, minlength=num_nodes)
+    sorted_targets = targets[np.argsort(sources, kind="stable")]
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(out_degree, out=offsets[1:])
+
+    node_levels = np.full(num_nodes, -1, dtype=np.int64)
+    num_unplaced_nodes = int(np.count_nonzero((in_degree > 0) | (out_degree > 0)))
+    dependencyless = np.flatnonzero((in_degree == 0) & (out_degree > 0))
+    level = 0
+    while dependencyless.size:
+        # Set dependencyless nodes as the nodes of the next topological level
+        node_levels[dependencyless] = level
+        num_unplaced_nodes -= dependencyless.size
+        level += 1
+
+        # Gather the followers of all just placed nodes by concatenating their CSR rows without a Python loop, whereas
+        # each edge position is the offset of its row plus its position within the row.
+        row_starts = offsets[dependencyless]
+        row_lengths = offsets[dependencyless + 1] - row_starts
+        num_row_edges = int(row_lengths.sum())
+        if not num_row_edges:
+            break
+        row_ends = np.cumsum(row_lengths)
+        edge_positions = np.arange(num_row_edges) + np.repeat(row_starts - (row_ends - row_lengths), row_lengths)
+        followers, decrements = np.unique(sorted_targets[edge_positions], return_counts=True)
+
+        # Decrement the in_degree of all followers as their dependency on the placed nodes is fulfilled. Followers
+        # whose in_degree reaches zero have no remaining dependencies and form the next level.
+        in_degree[followers] -= decrements
+        dependencyless = followers[in_degree[followers] == 0]
+
+    # If not all nodes could be placed then the remaining nodes are part of or depend on a cycle
+    if num_unplaced_nodes:
+        msg = "Cyclic graph detected in acyclic_toposort function"
+        raise RuntimeError(msg)
+
+    return node_levels
@@ -0,0 +1,176 @@
+"""Module providing a potentially cyclic graph prepared for sorting it with many different start nodes."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from collections.abc import Iterable
+from typing import Generic, Literal
+
+from cyclic_toposort.cyclic_toposort import (
+    _component_solver,
+    _cyclic_toposort_components,
+    _sort_with_minimal_cyclic_edges,
+    _split_component,
+)
+from cyclic_toposort.graph import IndexedGraph, NodeT
+from cyclic_toposort.utils import SolverStats, SubresultCache, strongly_connected_components
+
+
+class PreparedToposort(Generic[NodeT]):
+    """Potentially cyclic graph prepared for sorting it with many different start nodes. The compact graph and its
+    strongly connected components are created once and the minimal cyclic edges of each component are memoized when
+    first determined. A start node only affects the component containing it, so sorting the graph with a start node
+    only resolves the components that this component splits up into without the edges leading into the start node,
+    which are memoized as well, and reuses the minimal cyclic edges of all other components. The least recently used
+    components are evicted once more than maxsize components are memoized.
+    """
+
+    __slots__ = ("_graph", "_engine", "_cache", "_components", "_node_components", "_component_cyclic_edges")
+
+    def __init__(
+        self,
+        edges: Iterable[tuple[NodeT, NodeT]],
+        engine: Literal["recursive", "bitmask"] = "recursive",
+        cache: SubresultCache | None = None,
+        maxsize: int = 1024,
+    ) -> None:
+        """Initialize the graph and determine its strongly connected components.
+
+        :param edges: An iterable of tuples where each tuple represents a directed edge (start_node, end_node) in the
+            graph. Nodes can be of any hashable type.
+        :param engine: The engine used to determine the minimal cyclic edges of each strongly connected component, see
+            cyclic_toposort.
+        :param cache: An optional cache of sub-results of the recursive engine. By default a cache private to the
+            prepared graph is used, which is shared by the components of all start nodes.
+        :param maxsize: Maximum number of components whose minimal cyclic edges are memoized before the least recently
+            used component is evicted.
+        :raises ValueError: if an unknown engine is supplied.
+        """
+        if engine not in ("recursive", "bitmask"):
+            msg = f"Unknown engine '{engine}' supplied to PreparedToposort"
+            raise ValueError(msg)
+
+        self._graph = IndexedGraph.from_edges(edges)
+        self._engine: Literal["recursive", "bitmask"] = engine
+        self._cache = SubresultCache() if cache is None else cache
+        self._components = [
+            component for component in strongly_connected_components(self._graph.node_outs) if len(component) > 1
+        ]
+        self._node_components = {
+            node: component_index for component_index, component in enumerate(self._components) for node in component
+        }
+        self._component_cyclic_edges = SubresultCache(maxsize=maxsize)
+
+    def __contains__(self, node: object) -> bool:
+        """Return True if the supplied node is part of an edge of the graph."""
+        return node in self._graph.label_indices
+
+    def cyclic_toposort(
+        self,
+        start_node: NodeT | None = None,
+        stats: SolverStats | None = None,
+    ) -> tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]:
+        """Perform a topological sorting on the graph, returning the same result as cyclic_toposort for the edges and
+        start node.
+
+        :param start_node: An optional node. If provided, any edge leading into this node will be considered as a
+            forced cyclic edge.
+        :param stats: Optional statistics recording the explored search space and the time spent in each phase of the
+            search, whose progress callback may cancel the search. Memoized components are not searched again.
+        :return: A tuple containing:
+            - A list of sets representing the topological ordering of nodes. Each set contains nodes at the same depth.
+                The amount of topological groupings is minimal out of all possible sets of cyclic edges.
+            - A set of tuples representing the cyclic edges that were identified in the graph and that yielded a graph
+                topology with the fewest topological groupings.
+        :raises ValueError: if a strongly connected component exceeds the node limit of the bitmask engine.
+        :raises SearchCancelledError: if the progress callback of the supplied stats cancels the search.
+        """
+        graph = self._graph
+
+        # If start_node is supplied then all edges leading into it are considered as forced cyclic edges and its
+        # component is replaced with the components it splits up into without these edges
+        phase_start_time = time.perf_counter()
+        start_node_index = None if start_node is None else graph.label_indices.get(start_node)
+        cyclic_edges_forced = set()
+        components = self._components
+        if start_node_index is not None:
+            cyclic_edges_forced = {(edge_start, start_node_index) for edge_start in graph.node_ins[start_node_index]}
+            component_index = self._node_components.get(start_node_index)
+            if component_index is not None:
+                components = [
+                    *components[:component_index],
+                    *components[component_index + 1 :],
+                    *_split_component(
+                        graph=graph,
+                        component=components[component_index],
+                        start_node_index=start_node_index,
+                    ),
+                ]
+        if stats is not None:
+            stats.add_phase_time("components", phase_start_time)
+            phase_start_time = time.perf_counter()
+
+        # Each minimal set of cyclic edges of the graph is the union of a minimal set of cyclic edges of each component
+        cyclic_edges: list[set[tuple[int, int]]] = [set()]
+        for component in components:
+            component_cyclic_edges = self._resolve_component(component=component, stats=stats)
+            cyclic_edges = [
+                cyclic_edges_set.union(component_cyclic_edges_set)
+                for cyclic_edges_set in cyclic_edges
+                for component_cyclic_edges_set in component_cyclic_edges
+            ]
+        if stats is not None:
+            stats.add_phase_time("search", phase_start_time)
+
+        graph_topology, cyclic_edges_set = _sort_with_minimal_cyclic_edges(
+            graph=graph,
+            cyclic_edges=cyclic_edges,
+            cyclic_edges_forced=cyclic_edges_forced,
+            stats=stats,
+        )
+        return [graph.to_labels(level) for level in graph_topology], graph.to_label_edges(cyclic_edges_set)
+
+    def _resolve_component(
+        self,
+        component: set[int],
+        stats: SolverStats | None = None,
+    ) -> list[set[tuple[int, int]]]:
+        """Determine the minimal sets of cyclic edges of the subgraph induced by a strongly connected component, which
+        only depend on the edges of the subgraph and are therefore memoized for all start nodes.
+
+        :param component: The strongly connected component as a set of node indices.
+        :param stats: Optional statistics of the search.
+        :return: A list of the minimal sets of cyclic edges of the component as sets of tuples of node indices.
+        """
+        node_outs = self._graph.node_outs
+        component_edges = frozenset(
+            (node, follower) for node in component for follower in node_outs[node] if follower in component
+        )
+        component_cyclic_edges = self._component_cyclic_edges.get(component_edges)
+        if component_cyclic_edges is None:
+            component_cyclic_edges = _cyclic_toposort_components(
+                node_ins=self._graph.node_ins,
+                node_outs=node_outs,
+                components=[component],
+                solver=_component_solver(engine=self._engine, cache=self._cache, stats=stats),
+            )
+            self._component_cyclic_edges.put(component_edges, component_cyclic_edges)
+        return component_cyclic_edges
@@ -0,0 +1,255 @@
+"""Module providing a persistent on-disk cache of the results of cyclic_toposort, keyed by graph fingerprints."""
+
+# Copyright (c) 2020 Paul Pauls.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import pickle
+import sqlite3
+from os import PathLike
+from types import TracebackType
+
+from cyclic_toposort.graph import IndexedGraph, NodeT
+
+
+class ResultCache:
+    """Persistent cache of the results of cyclic_toposort in an SQLite database, mapping the fingerprint of a graph and
+    its start node to the graph topology and cyclic edges. The least recently used results are evicted once the cache
+    holds more than maxsize results. Each hit is checked in O(E) to be a valid result of the graph before it is used.
+
+    The results are stored pickled, so the database file has to be as trusted as the code that is run.
+    """
+
+    def __init__(self, path: str | PathLike[str], maxsize: int = 1024) -> None:
+        """Open the cache database, creating it if it doesn't exist yet.
+
+        :param path: Path of the SQLite database file.
+        :param maxsize: Maximum number of results held in the cache before the least recently used result is evicted.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(fingerprint TEXT PRIMARY KEY, result BLOB NOT NULL, last_used INTEGER NOT NULL)",
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    def __enter__(self) -> "ResultCache":
+        """Return the cache itself to be used as context manager that closes the database on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of results held in the cache."""
+        (num_results,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return int(num_results)
+
+    def get(
+        self,
+        fingerprint: str,
+        graph: IndexedGraph[NodeT],
+        start_node: NodeT | None = None,
+    ) -> tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]] | None:
+        """Look up the result of the graph with the supplied fingerprint and check that it is a valid result of the
+        graph. Invalid results, e.g. due to a fingerprint collision, are removed from the cache.
+
+        :param fingerprint: The fingerprint of the graph and start node as determined by graph_fingerprint.
+        :param graph: The indexed graph the result is checked against.
+        :param start_node: The optional start node whose incoming edges have to be cyclic edges of the result.
+        :return: A 2-tuple of the graph topology and the cyclic edges or None if no valid result is cached.
+        """
+        row = self._connection.execute("SELECT result FROM results WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        graph_topology, cyclic_edges = pickle.loads(row[0])  # noqa: S301
+        if not _is_valid_result(
+            graph=graph,
+            start_node=start_node,
+            graph_topology=graph_topology,
+            cyclic_edges=cyclic_edges,
+        ):
+            self.invalidations += 1
+            self.misses += 1
+            with self._connection:
+                self._connection.execute("DELETE FROM results WHERE fingerprint = ?", (fingerprint,))
+            return None
+
+        self.hits += 1
+        with self._connection:
+            self._connection.execute(
+                "UPDATE results SET last_used = (SELECT MAX(last_used) + 1 FROM results) WHERE fingerprint = ?",
+                (fingerprint,),
+            )
+        return graph_topology, cyclic_edges
+
+    def put(self, fingerprint: str, result: tuple[list[set[NodeT]], set[tuple[NodeT, NodeT]]]) -> None:
+        """Store the result of the graph with the supplied fingerprint, evicting the least recently used results if the
+        cache holds more than maxsize results.
+
+        :param fingerprint: The fingerprint of the graph and start node as determined by graph_fingerprint.
+        :param result: A 2-tuple of the graph topology and the cyclic edges as returned by cyclic_toposort.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (fingerprint, result, last_used) "
+                "VALUES (?, ?, (SELECT COALESCE(MAX(last_used), 0) + 1 FROM results))",
+                (fingerprint, pickle.dumps(result)),
+            )
+            self._connection.execute(
+                "DELETE FROM results WHERE fingerprint IN "
+                "(SELECT fingerprint FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> None:
+        """Remove all results from the cache and reset the hit, miss and invalidation counters."""
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+def graph_fingerprint(graph: IndexedGraph[NodeT], start_node: NodeT | None = None) -> str:
+    """Determine a fingerprint of a graph and its start node that is stable across processes. The graph is normalised
+    to the sorted canonical encodings of its distinct edges, which makes the fingerprint independent of the order and
+    duplicates of the supplied edges. A start node that is not a node of the graph doesn't affect the fingerprint.
+
+    Only labels with a canonical encoding are supported, i.e. integers, strings, bytes and tuples thereof, as the
+    representations of other labels are neither guaranteed to be stable across processes nor to be unique.
+
+    :param graph: The indexed graph.
+    :param start_node: The optional start node.
+    :return: Hexadecimal SHA-256 digest of the normalised graph and start node.
+    :raises TypeError: If a label of the graph or the start node has no canonical encoding.
+    """
+    label_encodings = [_encode_label(label) for label in graph.labels]
+    digest = hashlib.sha256()
+    for edge in sorted(
+        label_encodings[edge_start] + label_encodings[edge_end] for edge_start, edge_end in graph.edges()
+    ):
+        digest.update(edge)
+    if start_node is not None and start_node in graph.label_indices:
+        digest.update(b"start_node:" + _encode_label(start_node))
+    return digest.hexdigest()
+
+
+def _encode_label(label: object) -> bytes:
+    """Encode a label canonically as its type tag and the length of its payload followed by the payload, which makes
+    the encodings of distinct labels and of sequences of labels distinct.
+
+    :param label: The label to encode.
+    :return: The canonical encoding of the label.
+    :raises TypeError: If the label is not an integer, string, bytes or a tuple thereof.
+    """
+    if isinstance(label, bool):
+        tag, payload = b"b", str(int(label)).encode()
+    elif isinstance(label, int):
+        tag, payload = b"i", str(int(label)).encode()
+    elif isinstance(label, str):
+        tag, payload = b"s", label.encode("utf-8", "surrogatepass")
+    elif isinstance(label, bytes):
+        tag, payload = b"y", bytes(label)
+    elif isinstance(label, tuple):
+        tag, payload = b"t", b"".join(_encode_label(element) for element in label)
+    else:
+        msg = f"Label of type '{type(label).__name__}' has no canonical encoding for the fingerprint of a graph"
+        raise TypeError(msg)
+    return tag + str(len(payload)).encode() + b":" + payload
+
+
+def _is_valid_result(
+    graph: IndexedGraph[NodeT],
+    start_node: NodeT | None,
+    graph_topology: list[set[NodeT]],
+    cyclic_edges: set[tuple[NodeT, NodeT]],
+) -> bool:
+    """Check in O(E) if a graph topology and cyclic edges are a valid result of a graph. The graph topology has to hold
+    each node of the graph with non-cyclic edges exactly once, the cyclic edges have to be edges of the graph that
+    include all edges leading into the start node, and each level of the graph topology has to be the level
+    acyclic_toposort assigns to the node in the graph without the cyclic edges.
+
+    :param graph: The indexed graph.
+    :param start_node: The optional start node.
+    :param graph_topology: The graph topology as list of sets of nodes.
+    :param cyclic_edges: The cyclic edges as set of 2-tuples of nodes.
+    :return: True if the result is valid for the graph.
+    """
+    label_indices = graph.label_indices
+    node_levels = [-1] * graph.num_nodes
+    for level, nodes in enumerate(graph_topology):
+        for node in nodes:
+            node_index = label_indices.get(node)
+            if node_index is None or node_levels[node_index] != -1:
+                return False
+            node_levels[node_index] = level
+
+    cyclic_edge_indices = set()
+    for edge_start, edge_end in cyclic_edges:
+        edge_start_index, edge_end_index = label_indices.get(edge_start), label_indices.get(edge_end)
+        if edge_start_index is None or edge_end_index is None:
+            return False
+        cyclic_edge_indices.add((edge_start_index, edge_end_index))
+
+    start_node_index = None if start_node is None else label_indices.get(start_node)
+    num_graph_cyclic_edges = 0
+    for node_index in range(graph.num_nodes):
+        node_level = node_levels[node_index]
+        num_acyclic_outs = sum(
+            (node_index, follower) not in cyclic_edge_indices for follower in graph.node_outs[node_index]
+        )
+
+        # Each node of a level other than the first requires a dependency on the directly preceding level. Nodes whose
+        # edges are all cyclic are not part of the graph topology.
+        has_preceding_dependency = node_level == 0 and num_acyclic_outs > 0
+        for dependency in graph.node_ins[node_index]:
+            if (dependency, node_index) in cyclic_edge_indices:
+                num_graph_cyclic_edges += 1
+                continue
+            dependency_level = node_levels[dependency]
+            if node_index == start_node_index or dependency_level == -1 or dependency_level >= node_level:
+                return False
+            has_preceding_dependency |= dependency_level == node_level - 1
+        if node_level == -1:
+            if num_acyclic_outs > 0:
+                return False
+        elif not has_preceding_dependency:
+            return False
+
+    return num_graph_cyclic_edges == len(cyclic_edge_indices)
@@ -22,18 +22,351 @@
 
 
 import itertools
-from collections.abc import Iterator
-from copy import deepcopy
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Generator, Iterable, Mapping
+
+MAX_LOCAL_IMPROVEMENT_PASSES = 10
+
+
+class SearchBudgetExhaustedError(Exception):
+    """Exception raised when the budget of a search for minimal cyclic edges is exhausted. It holds the sets of cyclic
+    edges of the best solution the interrupted search has found for the graph it was called with.
+    """
+
+    def __init__(self, msg: str) -> None:
+        """Initialize the exception without any found sets of cyclic edges.
+
+        :param msg: The error message.
+        """
+        super().__init__(msg)
+        self.cyclic_edges: list[set[tuple[int, int]]] = []
+
+
+class SearchBudget:
+    """Budget limiting the wall-clock time and the amount of explored nodes of a search for minimal cyclic edges."""
+
+    def __init__(self, time_budget: float | None = None, node_budget: int | None = None) -> None:
+        """Initialize the budget, starting its wall-clock time immediately.
+
+        :param time_budget: Optional wall-clock time in seconds after which the budget is exhausted.
+        :param node_budget: Optional amount of explored search nodes after which the budget is exhausted.
+        """
+        self.deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.node_budget = node_budget
+        self.explored_nodes = 0
+
+    def tick(self) -> None:
+        """Account for a single explored search node.
+
+        :raises SearchBudgetExhaustedError: if the time or node budget is exhausted.
+        """
+        self.explored_nodes += 1
+        if self.node_budget is not None and self.explored_nodes > self.node_budget:
+            msg = "Node budget of search for minimal cyclic edges exhausted"
+            raise SearchBudgetExhaustedError(msg)
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            msg = "Time budget of search for minimal cyclic edges exhausted"
+            raise SearchBudgetExhaustedError(msg)
+
+
+class SearchCancelledError(Exception):
+    """Exception raised when a search for minimal cyclic edges is cancelled by its progress callback."""
+
+
+class SolverStats:
+    """Statistics of a search for minimal cyclic edges, recording counters of the explored search space and the
+    wall-clock time spent in each phase of the search. An optional progress callback is invoked periodically from the
+    innermost loop of the search with the statistics and can cancel the search by returning True.
+    """
+
+    def __init__(
+        self,
+        progress: Callable[["SolverStats"], bool | None] | None = None,
+        progress_interval: int = 1000,
+    ) -> None:
+        """Initialize empty statistics.
+
+        :param progress: Optional callback invoked with the statistics every progress_interval explored sets of cyclic
+            edges. If it returns True the search is cancelled.
+        :param progress_interval: Number of explored sets of cyclic edges between two invocations of the callback.
+        """
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.subsets_explored = 0
+        self.peeled_nodes = 0
+        self.recursive_calls = 0
+        self.recursion_depth = 0
+        self.max_recursion_depth = 0
+        self.candidates_tied = 0
+        self.candidates_evaluated = 0
+        self.phase_times: dict[str, float] = {}
+
+    def tick(self) -> None:
+        """Account for a single explored set of cyclic edges and invoke the progress callback if it is due.
+
+        :raises SearchCancelledError: if the progress callback requests the cancellation of the search.
+        """
+        self.subsets_explored += 1
+        if (
+            self.progress is not None
+            and self.subsets_explored % self.progress_interval == 0
+            and self.progress(self)
+        ):
+            msg = "Search for minimal cyclic edges cancelled by progress callback"
+            raise SearchCancelledError(msg)
+
+    def add_phase_time(self, phase: str, start_time: float) -> None:
+        """Add the wall-clock time elapsed since the supplied start time to the time spent in the supplied phase.
+
+        :param phase: Name of the phase.
+        :param start_time: Start time of the phase as returned by time.perf_counter.
+        """
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + time.perf_counter() - start_time
+
+
+class SubresultCache:
+    """Bounded cache with least recently used eviction, mapping graphs to their minimal sets of cyclic edges."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Initialize an empty cache.
+
+        :param maxsize: Maximum number of graphs held in the cache before the least recently used graph is evicted.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[frozenset[tuple[int, int]], tuple[frozenset[tuple[int, int]], ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of graphs held in the cache."""
+        return len(self._cache)
+
+    def get(self, edges: frozenset[tuple[int, int]]) -> list[set[tuple[int, int]]] | None:
+        """Look up the minimal sets of cyclic edges of the graph represented by the supplied edges.
+
+        :param edges: Frozenset of the edges of the graph, serving as its canonical form.
+        :return: A new list of new sets of cyclic edges that may be modified by the caller or None if not cached.
+        """
+        cyclic_edges = self._cache.get(edges)
+        if cyclic_edges is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._cache.move_to_end(edges)
+        return [set(cyclic_edges_set) for cyclic_edges_set in cyclic_edges]
+
+    def put(self, edges: frozenset[tuple[int, int]], cyclic_edges: list[set[tuple[int, int]]]) -> None:
+        """Store the minimal sets of cyclic edges of the graph represented by the supplied edges.
+
+        :param edges: Frozenset of the edges of the graph, serving as its canonical form.
+        :param cyclic_edges: List of the minimal sets of cyclic edges of the graph.
+        """
+        self._cache[edges] = tuple(frozenset(cyclic_edges_set) for cyclic_edges_set in cyclic_edges)
+        self._cache.move_to_end(edges)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all graphs from the cache and reset the hit and miss counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def cycle_packing_lower_bound(node_outs: dict[int, set[int]]) -> int:
+    """Determine a lower bound on the minimal number of cyclic edges of a graph by greedily packing edge-disjoint
+    cycles, as at least one edge of each of those cycles has to be cyclic. Short cycles are packed first by searching
+    the shortest cycle through each node with a breadth-first search.
+
+    :param node_outs: Dictionary mapping each node of the graph to the set of nodes to which it sends edges. All nodes
+        have to be present as keys in the dictionary.
+    :return: Number of packed edge-disjoint cycles.
+    """
+    remaining_outs = {node: set(outgoings) for node, outgoings in node_outs.items()}
+    num_cycles = 0
+
+    for root in node_outs:
+        while True:
+            # Search the shortest path from the root back to the root in the remaining graph
+            predecessors: dict[int, int] = {}
+            queue = deque([root])
+            while queue and root not in predecessors:
+                node = queue.popleft()
+                for follower in remaining_outs[node]:
+                    if follower not in predecessors:
+                        predecessors[follower] = node
+                        queue.append(follower)
+
+            if root not in predecessors:
+                break
+
+            # Remove the edges of the found cycle from the remaining graph to keep the packed cycles edge-disjoint
+            num_cycles += 1
+            node = root
+            while True:
+                predecessor = predecessors[node]
+                remaining_outs[predecessor].discard(node)
+                node = predecessor
+                if node == root:
+                    break
+
+    return num_cycles
+
+
+def greedy_cyclic_edges(
+    node_ins: dict[int, set[int]],
+    node_outs: dict[int, set[int]],
+) -> set[tuple[int, int]]:
+    """Heuristically determine a small set of cyclic edges of a graph by creating a node ordering with the greedy
+    algorithm of Eades, Lin and Smyth and improving it by moving single nodes to their best position in the ordering.
+    The cyclic edges are the edges pointing from a later to an earlier node in the ordering.
+
+    :param node_ins: A dictionary mapping each node to a set of nodes that have edges directed towards it.
+    :param node_outs: A dictionary mapping each node to a set of nodes it directs edges towards.
+    :return: A set of tuples, where each tuple represents a cyclic edge in the graph.
+    """
+    #### GREEDY ORDERING ###############################################################################################
+    remaining_ins = {node: set(incomings) for node, incomings in node_ins.items()}
+    remaining_outs = {node: set(outgoings) for node, outgoings in node_outs.items()}
+    ordering_start: list[int] = []
+    ordering_end: list[int] = []
+
+    def remove_node(node: int) -> None:
+        """Remove the node from the remaining graph."""
+        for follower in remaining_outs.pop(node):
+            remaining_ins[follower].discard(node)
+        for predecessor in remaining_ins.pop(node):
+            remaining_outs[predecessor].discard(node)
+
+    while remaining_ins:
+        # Place all nodes without followers at the end and all nodes without predecessors at the start of the ordering
+        # as they can't be part of any cycle. Otherwise place the node with the highest difference between outgoing
+        # and incoming edges at the start, as that node makes the fewest edges cyclic.
+        followerless = [node for node, outgoings in remaining_outs.items() if not outgoings]
+        dependencyless = [node for node, incomings in remaining_ins.items() if not incomings and remaining_outs[node]]
+        if followerless or dependencyless:
+            ordering_end.extend(followerless)
+            ordering_start.extend(dependencyless)
+            for node in followerless + dependencyless:
+                remove_node(node)
+            continue
+
+        node = max(remaining_ins, key=lambda node: len(remaining_outs[node]) - len(remaining_ins[node]))
+        ordering_start.append(node)
+        remove_node(node)
+
+    ordering = ordering_start + ordering_end[::-1]
+
+    #### LOCAL IMPROVEMENT #############################################################################################
+    for _ in range(MAX_LOCAL_IMPROVEMENT_PASSES):
+        improved = False
+        for node in list(ordering):
+            # Determine the number of cyclic edges of the node for each position it could be moved to in the ordering.
+            # At the first position all incoming edges are cyclic. Moving the node past a follower makes the edge to
+            # the follower cyclic and moving it past a predecessor makes the edge from the predecessor non-cyclic.
+            position = ordering.index(node)
+            del ordering[position]
+            position_num_cyclic_edges = [len(node_ins[node])]
+            for other_node in ordering:
+                num_cyclic_edges = position_num_cyclic_edges[-1]
+                num_cyclic_edges += other_node in node_outs[node]
+                num_cyclic_edges -= other_node in node_ins[node]
+                position_num_cyclic_edges.append(num_cyclic_edges)
+
+            # Move the node to the best position if it reduces the number of cyclic edges
+            min_num_cyclic_edges = min(position_num_cyclic_edges)
+            if min_num_cyclic_edges < position_num_cyclic_edges[position]:
+                position = position_num_cyclic_edges.index(min_num_cyclic_edges)
+                improved = True
+            ordering.insert(position, node)
+
+        if not improved:
+            break
+
+    node_positions = {node: position for position, node in enumerate(ordering)}
+    return {
+        (node, follower)
+        for node, outgoings in node_outs.items()
+        for follower in outgoings
+        if node_positions[follower] < node_positions[node]
+    }
+
+
+def strongly_connected_components(node_outs: Mapping[int, Iterable[int]]) -> list[set[int]]:
+    """Determine the strongly connected components of a graph with an iterative version of Tarjan's algorithm.
+
+    :param node_outs: Mapping of each node of the graph to the nodes to which it sends edges. All nodes have to be
+        present as keys in the mapping.
+    :return: List of sets of nodes, each set representing a strongly connected component. The components are returned
+        in reverse topological order of the condensation of the graph, i.e. sink components first.
+    """
+    index_counter = 0
+    node_index: dict[int, int] = {}
+    node_lowlink: dict[int, int] = {}
+    node_stack: list[int] = []
+    on_stack: set[int] = set()
+    components: list[set[int]] = []
+
+    for root in node_outs:
+        if root in node_index:
+            continue
+
+        # Simulate the recursive depth-first search with an explicit stack of (node, iterator over followers) pairs
+        node_index[root] = node_lowlink[root] = index_counter
+        index_counter += 1
+        node_stack.append(root)
+        on_stack.add(root)
+        dfs_stack = [(root, iter(node_outs[root]))]
+
+        while dfs_stack:
+            node, followers = dfs_stack[-1]
+            for follower in followers:
+                if follower not in node_index:
+                    # Descend into the unvisited follower
+                    node_index[follower] = node_lowlink[follower] = index_counter
+                    index_counter += 1
+                    node_stack.append(follower)
+                    on_stack.add(follower)
+                    dfs_stack.append((follower, iter(node_outs[follower])))
+                    break
+                if follower in on_stack:
+                    node_lowlink[node] = min(node_lowlink[node], node_index[follower])
+            else:
+                # All followers of node have been visited. Pop the node from the depth-first search and propagate its
+                # lowlink to its parent. If node is the root of a component then pop the component from the stack.
+                dfs_stack.pop()
+                if dfs_stack:
+                    parent = dfs_stack[-1][0]
+                    node_lowlink[parent] = min(node_lowlink[parent], node_lowlink[node])
+
+                if node_lowlink[node] == node_index[node]:
+                    component = set()
+                    while True:
+                        component_node = node_stack.pop()
+                        on_stack.discard(component_node)
+                        component.add(component_node)
+                        if component_node == node:
+                            break
+                    components.append(component)
+
+    return components
 
 
 def generate_reduced_ins_outs(
     edges: set[tuple[int, int]],
     node_ins: dict[int, set[int]],
     node_outs: dict[int, set[int]],
-) -> Iterator[tuple[dict[int, set[int]], dict[int, set[int]], set[tuple[int, int]]]]:
+) -> Generator[tuple[dict[int, set[int]], dict[int, set[int]], set[tuple[int, int]]], None, None]:
     """Randomly select subsets of edges, treat them as cyclic, and yield modified node_ins and node_outs with those
     cyclic edges removed.
 
+    The cyclic edges are removed from the supplied node_ins and node_outs in place and are restored once the generator
+    is resumed or closed, making each yielded candidate cost O(k) for k cyclic edges instead of copying the whole graph.
+    The yielded dicts are therefore only valid until the generator is resumed and must not be modified by the caller.
+    A caller that stops iterating before the generator is exhausted has to close the generator to restore the graph.
+
     :param edges: Set of edges, each represented as a (start_node, end_node) tuple.
     :param node_ins: Dictionary mapping nodes to sets of nodes from which they receive edges.
     :param node_outs: Dictionary mapping nodes to sets of nodes to which they send edges.
@@ -45,12 +378,71 @@ def generate_reduced_ins_outs(
     # Iterate over subsets of edges of increasing sizes
     for n in range(1, len(edges) + 1):
         for cyclic_edges in itertools.combinations(edges, n):
-            modified_ins = deepcopy(node_ins)
-            modified_outs = deepcopy(node_outs)
-
-            # Remove cyclic edges from modified ins and outs
+            # Remove cyclic edges from ins and outs
             for edge_start, edge_end in cyclic_edges:
-                modified_ins[edge_end].discard(edge_start)
-                modified_outs[edge_start].discard(edge_end)
+                node_ins[edge_end].discard(edge_start)
+                node_outs[edge_start].discard(edge_end)
+
+            try:
+                yield node_ins, node_outs, set(cyclic_edges)
+            finally:
+                # Restore cyclic edges in ins and outs
+                for edge_start, edge_end in cyclic_edges:
+                    node_ins[edge_end].add(edge_start)
+                    node_outs[edge_start].add(edge_end)
+
+
+def ins_outs_to_bitsets(
+    nodes: list[int],
+    node_ins: Mapping[int, Iterable[int]],
+    node_outs: Mapping[int, Iterable[int]],
+) -> tuple[list[int], list[int]]:
+    """Encode the node inputs and outputs of a graph as Python int bitsets, whereas bit i represents nodes[i].
+
+    :param nodes: List of all nodes of the graph, determining the bit of each node.
+    :param node_ins: Mapping of each node to the nodes from which it receives edges.
+    :param node_outs: Mapping of each node to the nodes to which it sends edges.
+    :return: A 2-tuple consisting of
+        - List of the bitset of the nodes from which nodes[i] receives edges at index i.
+        - List of the bitset of the nodes to which nodes[i] sends edges at index i.
+    """
+    node_bits = {node: 1 << index for index, node in enumerate(nodes)}
+    in_masks = [sum(node_bits[incoming] for incoming in node_ins[node]) for node in nodes]
+    out_masks = [sum(node_bits[outgoing] for outgoing in node_outs[node]) for node in nodes]
+    return in_masks, out_masks
+
+
+def bitsets_to_ins_outs(
+    nodes: list[int],
+    in_masks: list[int],
+    out_masks: list[int],
+    node_mask: int,
+) -> tuple[dict[int, set[int]], dict[int, set[int]]]:
+    """Decode the subgraph induced by the nodes of a bitset from the bitset representation of a graph into node inputs
+    and outputs as dicts of sets, keeping the nodes in their order.
+
+    :param nodes: List of all nodes of the graph, whereas bit i represents nodes[i].
+    :param in_masks: List of the bitset of the nodes from which each node receives edges.
+    :param out_masks: List of the bitset of the nodes to which each node sends edges.
+    :param node_mask: Bitset of the nodes inducing the subgraph.
+    :return: A 2-tuple consisting of
+        - Dictionary mapping each node of the subgraph to the set of nodes from which it receives edges.
+        - Dictionary mapping each node of the subgraph to the set of nodes to which it sends edges.
+    """
+    node_ins: dict[int, set[int]] = {}
+    node_outs: dict[int, set[int]] = {}
+    for node_index, node in enumerate(nodes):
+        if not node_mask >> node_index & 1:
+            continue
+
+        # Iterate over the set bits of the masks by repeatedly isolating and clearing their lowest set bit
+        for node_masks, adjacency in ((in_masks, node_ins), (out_masks, node_outs)):
+            adjacent_nodes = set()
+            mask = node_masks[node_index] & node_mask
+            while mask:
+                lowest_bit = mask & -mask
+                adjacent_nodes.add(nodes[lowest_bit.bit_length() - 1])
+                mask ^= lowest_bit
+            adjacency[node] = adjacent_nodes
+    return node_ins, node_outs
 
-            yield modified_ins, modified_outs, set(cyclic_edges)
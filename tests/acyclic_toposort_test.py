@@ -2,7 +2,7 @@
 
 import pytest
 
-from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.acyclic_toposort import acyclic_toposort, iter_acyclic_toposort
 
 
 def test_runtimeerror_acyclic_toposort() -> None:
@@ -10,3 +10,42 @@ def test_runtimeerror_acyclic_toposort() -> None:
     edges = {(1, 2), (2, 3), (3, 1)}
     with pytest.raises(RuntimeError, match="Cyclic graph detected in acyclic_toposort function"):
         acyclic_toposort(edges)
+
+
+def test_runtimeerror_invalid_graph_acyclic_toposort() -> None:
+    """Test acyclic_toposort with a graph consisting only of self-referencing edges, expecting an invalid graph
+    RuntimeError.
+    """
+    edges = {(1, 1), (2, 2)}
+    with pytest.raises(RuntimeError, match="Invalid graph detected"):
+        acyclic_toposort(edges)
+
+
+def test_acyclic_toposort() -> None:
+    """Test acyclic_toposort with an acyclic graph, a self-referencing edge and duplicate edges."""
+    edges = [(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (5, 3), (5, 6), (7, 6), (4, 4), (1, 2)]
+    assert acyclic_toposort(edges) == [{1, 5, 7}, {2, 6}, {3}, {4}]
+
+
+def test_deep_acyclic_toposort() -> None:
+    """Test acyclic_toposort with a deep chain graph in which each node additionally depends on the first node."""
+    edges = {(node, node + 1) for node in range(1000)} | {(0, node) for node in range(2, 1001)}
+    assert acyclic_toposort(edges) == [{node} for node in range(1001)]
+
+
+def test_hashable_labels_acyclic_toposort() -> None:
+    """Test acyclic_toposort with string and tuple node labels."""
+    edges = {("build", ("test", 1)), ("build", ("test", 2)), (("test", 1), "deploy"), (("test", 2), "deploy")}
+    assert acyclic_toposort(edges) == [{"build"}, {("test", 1), ("test", 2)}, {"deploy"}]
+
+
+def test_iter_acyclic_toposort() -> None:
+    """Test iter_acyclic_toposort yielding the levels preceding a cycle before raising a cyclic graph RuntimeError."""
+    edges = [(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (5, 3), (5, 6), (7, 6)]
+    assert list(iter_acyclic_toposort(edges)) == acyclic_toposort(edges)
+
+    levels = iter_acyclic_toposort([(1, 2), (2, 3), (3, 4), (4, 3)])
+    assert next(levels) == {1}
+    assert next(levels) == {2}
+    with pytest.raises(RuntimeError, match="Cyclic graph detected in acyclic_toposort function"):
+        next(levels)
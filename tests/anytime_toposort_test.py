@@ -0,0 +1,57 @@
+"""Tests for the anytime_toposort module."""
+
+import random
+
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.anytime_toposort import anytime_cyclic_toposort
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from tests.utils import create_random_graph
+
+
+def test_anytime_cyclic_toposort_without_budget() -> None:
+    """Test anytime_cyclic_toposort without a budget, which has to yield an optimal result like cyclic_toposort."""
+    for _ in range(50):
+        edges = create_random_graph(num_edges=random.randint(6, 10))
+        result = anytime_cyclic_toposort(edges=edges)
+        graph_topology, cyclic_edges = cyclic_toposort(edges=edges)
+        assert result.optimal
+        assert result.lower_bound == len(result.cyclic_edges) == len(cyclic_edges)
+        assert len(result.graph_topology) == len(graph_topology)
+
+
+def test_anytime_cyclic_toposort_with_exhausted_budget() -> None:
+    """Test anytime_cyclic_toposort with a budget too small to explore the graph, expecting a valid heuristic result."""
+    edges = {(node, (node + 1) % 30) for node in range(30)} | {(node, (node + 7) % 30) for node in range(30)}
+
+    result = anytime_cyclic_toposort(edges=edges, node_budget=1)
+
+    assert not result.optimal
+    assert 1 <= result.lower_bound <= len(result.cyclic_edges)
+    assert result.graph_topology == acyclic_toposort(edges - result.cyclic_edges)
+
+
+def test_anytime_cyclic_toposort_refutes_lower_bound() -> None:
+    """Test anytime_cyclic_toposort with a budget that refutes the lower bound of the edge-disjoint cycles but does not
+    suffice to complete the search, expecting the raised lower bound to be reported.
+    """
+    edges = {(0, 1), (0, 3), (1, 2), (1, 3), (1, 5), (2, 3), (2, 6), (3, 0), (3, 2), (4, 2), (4, 5), (4, 6), (5, 0)}
+    edges |= {(5, 1), (6, 0)}
+
+    result = anytime_cyclic_toposort(edges=edges, node_budget=200)
+
+    assert not result.optimal
+    assert result.lower_bound == len(result.cyclic_edges) == 4  # noqa: PLR2004
+    assert result.graph_topology == acyclic_toposort(edges - result.cyclic_edges)
+
+
+def test_anytime_cyclic_toposort_keeps_incumbent() -> None:
+    """Test anytime_cyclic_toposort with a budget that is exhausted after the exact search found a smaller set of cyclic
+    edges than the heuristic, expecting the smaller set of cyclic edges to be kept.
+    """
+    edges = {(node, (node + 1) % 12) for node in range(12)} | {(node, (node + 5) % 12) for node in range(12)}
+
+    result = anytime_cyclic_toposort(edges=edges, node_budget=80000)
+
+    assert not result.optimal
+    assert result.lower_bound == len(result.cyclic_edges) == 6  # noqa: PLR2004
+    assert result.graph_topology == acyclic_toposort(edges - result.cyclic_edges)
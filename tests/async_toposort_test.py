@@ -0,0 +1,67 @@
+"""Tests for the async_toposort module."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cyclic_toposort import async_toposort
+from cyclic_toposort.async_toposort import async_cyclic_toposort
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+
+# Complete graph whose minimal cyclic edges take far longer to determine than any of the tests waits
+HARD_EDGES = {(edge_start, edge_end) for edge_start in range(7) for edge_end in range(7) if edge_start != edge_end}
+
+
+def test_async_cyclic_toposort_shared_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test async_cyclic_toposort with concurrent calls for the same graph and start node, expecting a single search
+    and the same results as cyclic_toposort.
+    """
+    edges = {(1, 2), (2, 3), (3, 5), (3, 6), (4, 1), (4, 5), (4, 6), (5, 2), (5, 7), (6, 1), (8, 6)}
+    solve = async_toposort._solve  # noqa: SLF001
+    num_searches = []
+
+    def counting_solve(*args: object) -> object:
+        """Count the searches and perform them after a delay, giving the concurrent calls time to join them."""
+        num_searches.append(1)
+        time.sleep(0.2)
+        return solve(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(async_toposort, "_solve", counting_solve)
+
+    async def sort_concurrently() -> list[object]:
+        """Sort the graph three times concurrently with the same start node and once with another one."""
+        return await asyncio.gather(
+            *(async_cyclic_toposort(edges, start_node=2) for _ in range(3)),
+            async_cyclic_toposort(edges, start_node=5),
+        )
+
+    results = asyncio.run(sort_concurrently())
+
+    assert results == [*(cyclic_toposort(edges, start_node=2) for _ in range(3)), cyclic_toposort(edges, start_node=5)]
+    assert len(num_searches) == 2  # noqa: PLR2004
+    assert not async_toposort._in_flight_searches  # noqa: SLF001
+
+
+def test_async_cyclic_toposort_cancellation() -> None:
+    """Test async_cyclic_toposort with a timeout and a cancellation, expecting the search of the single worker thread
+    to stop so that the worker thread is free to perform the next search.
+    """
+
+    async def cancel_searches() -> None:
+        """Time out and cancel a search of the hard graph and each time sort a trivial graph afterwards."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(asyncio.TimeoutError):
+                await async_cyclic_toposort(HARD_EDGES, timeout=0.1, executor=executor)
+            assert await asyncio.wait_for(async_cyclic_toposort({(1, 2)}, executor=executor), 10) == ([{1}, {2}], set())
+
+            task = asyncio.ensure_future(async_cyclic_toposort(HARD_EDGES, executor=executor))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert await asyncio.wait_for(async_cyclic_toposort({(1, 2)}, executor=executor), 10) == ([{1}, {2}], set())
+
+    asyncio.run(cancel_searches())
+    assert not async_toposort._in_flight_searches  # noqa: SLF001
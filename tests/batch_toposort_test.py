@@ -0,0 +1,47 @@
+"""Tests for the batch_toposort module."""
+
+import random
+
+from cyclic_toposort.batch_toposort import cyclic_toposort_many
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from tests.utils import create_random_graph
+
+
+def test_cyclic_toposort_many_relabeled_graphs() -> None:
+    """Test cyclic_toposort_many with randomly relabeled copies of graphs, expecting each distinct graph to be solved
+    once and each result to be as minimal as the result of cyclic_toposort.
+    """
+    graphs = []
+    for _ in range(5):
+        edges = create_random_graph(num_edges=random.randint(8, 12))
+        nodes = sorted({node for edge in edges for node in edge})
+        for _ in range(4):
+            relabeling = dict(zip(nodes, random.sample(range(100, 200), k=len(nodes)), strict=True))
+            graphs.append({(relabeling[edge_start], relabeling[edge_end]) for edge_start, edge_end in edges})
+
+    batch_result = cyclic_toposort_many(graphs)
+
+    assert batch_result.num_solves <= 5  # noqa: PLR2004
+    assert batch_result.num_solves + batch_result.num_saved_solves == len(graphs)
+    for edges, (graph_topology, cyclic_edges) in zip(graphs, batch_result.results, strict=True):
+        expected_graph_topology, expected_cyclic_edges = cyclic_toposort(edges=edges)
+        assert cyclic_edges <= edges
+        assert len(cyclic_edges) == len(expected_cyclic_edges)
+        assert len(graph_topology) == len(expected_graph_topology)
+        assert set().union(*graph_topology) == set().union(*expected_graph_topology)
+
+
+def test_cyclic_toposort_many_start_nodes() -> None:
+    """Test cyclic_toposort_many with start nodes, which distinguish otherwise isomorphic graphs."""
+    edges = {(1, 2), (2, 3), (3, 5), (3, 6), (4, 1), (4, 5), (4, 6), (5, 2), (5, 7), (6, 1), (8, 6)}
+    relabeled_edges = {(str(edge_start), str(edge_end)) for edge_start, edge_end in edges}
+
+    batch_result = cyclic_toposort_many([edges, relabeled_edges, edges], start_nodes=[2, "2", None], workers=2)
+
+    assert (batch_result.num_solves, batch_result.num_saved_solves) == (2, 1)
+    assert batch_result.results[0] == cyclic_toposort(edges=edges, start_node=2)
+    assert batch_result.results[1] == (
+        [{"8", "2", "4"}, {"3"}, {"5", "6"}, {"1", "7"}],
+        {("1", "2"), ("5", "2")},
+    )
+    assert batch_result.results[2] == cyclic_toposort(edges=edges)
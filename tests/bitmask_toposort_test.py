@@ -0,0 +1,48 @@
+"""Tests for the bitmask_toposort module."""
+
+import random
+
+import pytest
+
+from cyclic_toposort.bitmask_toposort import BITMASK_MAX_NODES, bitmask_cyclic_edges
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from tests.utils import create_random_graph
+
+
+def test_bitmask_cyclic_edges() -> None:
+    """Test bitmask_cyclic_edges() with a cycle of three nodes, each edge of which is a minimal set of cyclic edges."""
+    node_ins: dict[int, set[int]] = {1: {3}, 2: {1}, 3: {2}}
+    node_outs: dict[int, set[int]] = {1: {2}, 2: {3}, 3: {1}}
+
+    cyclic_edges = bitmask_cyclic_edges(node_ins=node_ins, node_outs=node_outs)
+
+    assert sorted(cyclic_edges, key=sorted) == [{(1, 2)}, {(2, 3)}, {(3, 1)}]
+
+
+def test_random_graphs_bitmask_engine_against_recursive_engine() -> None:
+    """Test cyclic_toposort with the bitmask engine with randomly generated graphs against the recursive engine, both
+    having to yield the same amount of cyclic edges and topological groupings.
+    """
+    for _ in range(50):
+        edges = create_random_graph(num_edges=random.randint(6, 10))
+        graph_topology, cyclic_edges = cyclic_toposort(edges=edges, engine="bitmask")
+        recursive_graph_topology, recursive_cyclic_edges = cyclic_toposort(edges=edges, engine="recursive")
+        assert len(cyclic_edges) == len(recursive_cyclic_edges)
+        assert len(graph_topology) == len(recursive_graph_topology)
+
+
+def test_bitmask_engine_node_limit() -> None:
+    """Test cyclic_toposort with the bitmask engine with a cycle exceeding the node limit of the bitmask engine,
+    expecting a ValueError instead of an attempt to allocate the tables of the dynamic programming.
+    """
+    num_nodes = BITMASK_MAX_NODES + 1
+    edges = {(node, (node + 1) % num_nodes) for node in range(num_nodes)}
+    with pytest.raises(ValueError, match=f"Graph of {num_nodes} nodes exceeds the limit of 20 nodes"):
+        cyclic_toposort(edges=edges, engine="bitmask")
+
+    # The limit itself is still accepted, which is checked with a lower limit as the default limit takes minutes
+    node_ins = {node: {(node - 1) % 6} for node in range(6)}
+    node_outs = {node: {(node + 1) % 6} for node in range(6)}
+    assert len(bitmask_cyclic_edges(node_ins=node_ins, node_outs=node_outs, max_nodes=6)) == 6  # noqa: PLR2004
+    with pytest.raises(ValueError, match="Graph of 6 nodes exceeds the limit of 5 nodes"):
+        bitmask_cyclic_edges(node_ins=node_ins, node_outs=node_outs, max_nodes=5)
@@ -0,0 +1,63 @@
+"""Tests for the cli module."""
+
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+from cyclic_toposort.cli import main
+
+
+def test_main_cyclic_csv(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line entry point sorting the cyclic README example graph from a CSV edge file."""
+    edges = {(1, 2), (2, 3), (3, 5), (3, 6), (4, 1), (4, 5), (4, 6), (5, 2), (5, 7), (6, 1), (8, 6)}
+    edge_file = tmp_path / "edges.csv"
+    edge_file.write_text("".join(f"{start},{end}\n" for start, end in edges), encoding="utf-8")
+
+    assert main([str(edge_file)]) == 0
+    assert capsys.readouterr().out == "# levels\n3 4 8\n5 6\n1 7\n2\n# cyclic edges\n2,3\n"
+
+    output_file = tmp_path / "topology.txt"
+    assert main([str(edge_file), "--start-node", "2", "--output", str(output_file)]) == 0
+    assert output_file.read_text(encoding="utf-8") == "# levels\n2 4 8\n3\n5 6\n1 7\n# cyclic edges\n1,2\n5,2\n"
+
+
+def test_main_acyclic_binary(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line entry point sorting acyclic and cyclic graphs from binary edge files as acyclic graphs."""
+    edge_file = tmp_path / "edges.bin"
+    edge_file.write_bytes(array("i", [1, 2, 1, 3, 2, 3, 2, 4, 3, 4, 5, 3, 5, 6, 7, 6]).tobytes())
+    assert main([str(edge_file), "--dtype", "int32", "--acyclic"]) == 0
+    assert capsys.readouterr().out == "# levels\n1 5 7\n2 6\n3\n4\n"
+
+    edge_file.write_bytes(array("q", [1, 2, 2, 3, 3, 1]).tobytes())
+    assert main([str(edge_file), "--acyclic"]) == 1
+    assert "Cyclic graph detected" in capsys.readouterr().err
+
+    output_file = tmp_path / "topology.txt"
+    output_file.write_text("previous result\n", encoding="utf-8")
+    assert main([str(edge_file), "--acyclic", "--output", str(output_file)]) == 1
+    assert output_file.read_text(encoding="utf-8") == "previous result\n"
+    assert set(tmp_path.iterdir()) == {edge_file, output_file}
+
+
+def test_main_numpy_missing(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the command line entry point with the NumPy backend while NumPy is not installed, expecting a usage error
+    instead of an ImportError traceback.
+    """
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    edge_file = tmp_path / "edges.bin"
+    edge_file.write_bytes(array("q", [1, 2, 2, 3]).tobytes())
+    output_file = tmp_path / "topology.txt"
+    output_file.write_text("previous result\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(edge_file), "--acyclic", "--numpy", "--output", str(output_file)])
+
+    assert exit_info.value.code == 2  # noqa: PLR2004
+    assert "--numpy requires the numpy extra" in capsys.readouterr().err
+    assert output_file.read_text(encoding="utf-8") == "previous result\n"
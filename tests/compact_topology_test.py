@@ -0,0 +1,50 @@
+"""Tests for the compact_topology module."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.compact_topology import CompactTopology
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.result_cache import ResultCache
+from tests.utils import create_random_graph
+
+
+def test_compact_acyclic_toposort() -> None:
+    """Test acyclic_toposort with a compact result, expecting zero-copy level views into the order array."""
+    edges = {(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (5, 3), (5, 6), (7, 6)}
+    topology = acyclic_toposort(edges, compact=True)
+
+    assert isinstance(topology, CompactTopology)
+    assert topology.to_sets() == acyclic_toposort(edges)
+    assert len(topology) == 4  # noqa: PLR2004
+    assert topology.num_nodes == 7  # noqa: PLR2004
+    assert list(topology.offsets) == [0, 3, 5, 6, 7]
+    assert set(topology.level_labels(-1)) == {4}
+    assert topology[1].obj is topology.order
+    assert [set(topology.level_labels(level)) for level in range(len(topology))] == topology.to_sets()
+    assert pickle.loads(pickle.dumps(topology)).to_sets() == topology.to_sets()  # noqa: S301
+
+    with pytest.raises(IndexError):
+        topology.level_labels(4)
+
+
+def test_compact_cyclic_toposort(tmp_path: Path) -> None:
+    """Test cyclic_toposort with a compact result on random graphs, expecting the same topology as sets, also for
+    results of the persistent result cache.
+    """
+    with ResultCache(tmp_path / "results.sqlite3") as result_cache:
+        for _ in range(10):
+            edges = create_random_graph(num_edges=10)
+            graph_topology, cyclic_edges = cyclic_toposort(edges)
+            for _ in range(2):
+                compact_topology, compact_cyclic_edges = cyclic_toposort(
+                    edges,
+                    result_cache=result_cache,
+                    compact=True,
+                )
+                assert compact_topology.to_sets() == graph_topology
+                assert compact_cyclic_edges == cyclic_edges
+        assert result_cache.hits >= 10  # noqa: PLR2004
@@ -1,11 +1,14 @@
 """Tests for the cyclic_toposort module."""
 import random
+import time
 from pathlib import Path
 
+import pytest
 import yaml
 from graphviz import Digraph
 
 from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.utils import SearchCancelledError, SolverStats, SubresultCache
 from tests.utils import bruteforce_toposort, create_random_graph
 
 TEST_GRAPHS_DIR = "./test_graphs/"
@@ -52,3 +55,102 @@ def test_random_graphs_against_bruteforce() -> None:
 
     with test_results_yaml.open("w") as test_results_yaml_file:
         yaml.dump(test_results, test_results_yaml_file)
+
+
+def test_disjoint_cycles() -> None:
+    """Test cyclic_toposort with two disjoint cycles that are connected by an acyclic edge."""
+    edges = {(1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 6), (6, 4)}
+    graph_topology, cyclic_edges = cyclic_toposort(edges=edges)
+    assert (len(graph_topology), len(cyclic_edges)) == (3, 2)
+
+
+def test_dense_graph() -> None:
+    """Test cyclic_toposort with the complete directed graph of 4 nodes, whose 12 edges form 6 edge-disjoint cycles,
+    expecting the search to only explore the branches of single cyclic edges that aren't cut off by the lower bound.
+    """
+    edges = {(edge_start, edge_end) for edge_start in range(4) for edge_end in range(4) if edge_start != edge_end}
+    stats = SolverStats()
+    start_time = time.perf_counter()
+    graph_topology, cyclic_edges = cyclic_toposort(edges=edges, stats=stats)
+    assert time.perf_counter() - start_time < 10  # noqa: PLR2004
+    assert (len(graph_topology), len(cyclic_edges)) == (4, 6)
+    assert stats.subsets_explored <= 100000  # noqa: PLR2004
+
+
+def test_start_node() -> None:
+    """Test cyclic_toposort with a start_node whose incoming edges are forced to be cyclic."""
+    edges = {(1, 2), (2, 3), (3, 5), (3, 6), (4, 1), (4, 5), (4, 6), (5, 2), (5, 7), (6, 1), (8, 6)}
+    assert cyclic_toposort(edges=edges, start_node=2) == ([{8, 2, 4}, {3}, {5, 6}, {1, 7}], {(1, 2), (5, 2)})
+
+
+def test_subresult_cache() -> None:
+    """Test cyclic_toposort with a cache of sub-results, expecting the same results and hits on repeated graphs."""
+    cache = SubresultCache()
+    for _ in range(20):
+        edges = create_random_graph(num_edges=random.randint(8, 12))
+        graph_topology, cyclic_edges = cyclic_toposort(edges=edges, cache=cache)
+        uncached_graph_topology, uncached_cyclic_edges = cyclic_toposort(edges=edges)
+        assert len(cyclic_edges) == len(uncached_cyclic_edges)
+        assert len(graph_topology) == len(uncached_graph_topology)
+
+    assert cache.hits > 0
+
+
+def test_hashable_labels() -> None:
+    """Test cyclic_toposort with string node labels, including start nodes whose incoming edges are forced cyclic."""
+    edges = {("a", "b"), ("b", "c"), ("c", "a"), ("x", "a")}
+    assert cyclic_toposort(edges=edges, start_node="a") == ([{"a"}, {"b"}, {"c"}], {("c", "a"), ("x", "a")})
+    assert cyclic_toposort(edges=edges, start_node="b") == ([{"x", "b"}, {"c"}, {"a"}], {("a", "b")})
+
+
+def test_workers() -> None:
+    """Test cyclic_toposort with a process pool of workers, expecting exactly the results of the serial search."""
+    rng = random.Random(0)
+    for _ in range(5):
+        edges: set[tuple[int, int]] = set()
+        while len(edges) < 14:  # noqa: PLR2004
+            edge_start, edge_end = rng.sample(range(7), k=2)
+            edges.add((edge_start, edge_end))
+        assert cyclic_toposort(edges=edges, workers=2, cache=SubresultCache()) == cyclic_toposort(edges=edges)
+
+
+def test_tie_break() -> None:
+    """Test cyclic_toposort with chained triangles whose minimal cyclic edges are tied, expecting the tie-break to stop
+    evaluating the sets of cyclic edges once a set reaches the lower bound on the number of topological groupings.
+    """
+    edges = {(0, 1), (1, 0), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (6, 7), (7, 8), (8, 6), (0, 3), (3, 6)}
+    stats = SolverStats()
+    assert cyclic_toposort(edges=edges, stats=stats) == (
+        [{1, 4, 7}, {2, 5, 8}, {0}, {3}, {6}],
+        {(0, 1), (3, 4), (6, 7)},
+    )
+    assert stats.candidates_tied == 9  # noqa: PLR2004
+    assert stats.candidates_evaluated == 1
+
+    edges.remove((1, 0))
+    stats = SolverStats()
+    assert cyclic_toposort(edges=edges, stats=stats) == ([{0, 5, 7}, {1, 3, 8}, {2, 4, 6}], {(2, 0), (4, 5), (6, 7)})
+    assert stats.candidates_tied == 27  # noqa: PLR2004
+    assert 1 < stats.candidates_evaluated < stats.candidates_tied
+
+
+def test_solver_stats() -> None:
+    """Test cyclic_toposort with solver statistics, expecting the same results and a cancellation by the callback."""
+    edges = {(node, (node + 1) % 7) for node in range(7)} | {(node, (node + 3) % 7) for node in range(7)}
+    stats = SolverStats()
+    assert cyclic_toposort(edges=edges, stats=stats) == cyclic_toposort(edges=edges)
+    assert stats.subsets_explored > 0
+    assert stats.max_recursion_depth >= 1
+    assert stats.candidates_tied >= 1
+    assert set(stats.phase_times) == {"components", "search", "peeling", "tie_break", "final_sort"}
+
+    progress_subsets_explored = []
+
+    def progress(stats: SolverStats) -> bool:
+        """Record the number of explored subsets and cancel the search."""
+        progress_subsets_explored.append(stats.subsets_explored)
+        return True
+
+    with pytest.raises(SearchCancelledError):
+        cyclic_toposort(edges=edges, stats=SolverStats(progress=progress, progress_interval=5))
+    assert progress_subsets_explored == [5]
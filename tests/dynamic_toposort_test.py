@@ -0,0 +1,62 @@
+"""Tests for the dynamic_toposort module."""
+
+import random
+
+import pytest
+
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.dynamic_toposort import DynamicToposort
+
+
+def test_dynamic_toposort() -> None:
+    """Test DynamicToposort by adding and removing edges of the README example graph."""
+    dynamic_toposort = DynamicToposort({(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (5, 3), (5, 6)})
+    dynamic_toposort.add_edge(7, 6)
+    assert dynamic_toposort.topology() == [{1, 5, 7}, {2, 6}, {3}, {4}]
+
+    dynamic_toposort.add_edge(4, 6)
+    assert dynamic_toposort.topology() == [{1, 5, 7}, {2}, {3}, {4}, {6}]
+    assert dynamic_toposort.level(6) == 4  # noqa: PLR2004
+
+    dynamic_toposort.remove_edge(2, 3)
+    dynamic_toposort.remove_edge(7, 6)
+    assert 7 not in dynamic_toposort  # noqa: PLR2004
+    assert dynamic_toposort.topology() == [{1, 5}, {2, 3}, {4}, {6}]
+
+    with pytest.raises(KeyError):
+        dynamic_toposort.remove_edge(2, 3)
+
+
+def test_runtimeerror_dynamic_toposort() -> None:
+    """Test DynamicToposort with an edge closing a cycle, expecting a cyclic graph RuntimeError and an unchanged
+    graph.
+    """
+    dynamic_toposort = DynamicToposort({(1, 2), (2, 3)})
+    with pytest.raises(RuntimeError, match="Cyclic graph detected"):
+        dynamic_toposort.add_edge(3, 1)
+    with pytest.raises(RuntimeError, match="Cyclic graph detected"):
+        DynamicToposort({(1, 2), (2, 1)})
+    assert dynamic_toposort.topology() == [{1}, {2}, {3}]
+
+
+def test_dynamic_toposort_against_acyclic_toposort() -> None:
+    """Test DynamicToposort with random edge additions and removals against sorting the whole graph anew."""
+    rng = random.Random(0)
+    dynamic_toposort: DynamicToposort[int] = DynamicToposort()
+    edges: set[tuple[int, int]] = set()
+    for _ in range(500):
+        if edges and rng.random() < 0.3:  # noqa: PLR2004
+            edge_start, edge_end = rng.choice(sorted(edges))
+            dynamic_toposort.remove_edge(edge_start, edge_end)
+            edges.remove((edge_start, edge_end))
+        else:
+            edge_start, edge_end = rng.sample(range(20), k=2)
+            try:
+                dynamic_toposort.add_edge(edge_start, edge_end)
+            except RuntimeError:
+                with pytest.raises(RuntimeError, match="Cyclic graph detected"):
+                    acyclic_toposort(edges | {(edge_start, edge_end)})
+                continue
+            edges.add((edge_start, edge_end))
+
+        assert dynamic_toposort.topology() == (acyclic_toposort(edges) if edges else [])
@@ -0,0 +1,38 @@
+"""Tests for the edge_io module."""
+
+from array import array
+from pathlib import Path
+
+import pytest
+
+from cyclic_toposort.edge_io import iter_binary_edges, iter_csv_edges, memmap_binary_edges
+from cyclic_toposort.numpy_toposort import numpy_acyclic_toposort
+
+EDGES = [(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (5, 3), (5, 6), (7, 6)]
+
+
+@pytest.mark.parametrize(("dtype", "typecode"), [("int32", "i"), ("int64", "q")])
+def test_iter_binary_edges(tmp_path: Path, dtype: str, typecode: str) -> None:
+    """Test iter_binary_edges with int32 and int64 edge files, converting them in chunks smaller than the file."""
+    edge_file = tmp_path / "edges.bin"
+    edge_file.write_bytes(array(typecode, [node for edge in EDGES for node in edge]).tobytes())
+    assert list(iter_binary_edges(edge_file, dtype=dtype, chunk_size=3)) == EDGES  # type: ignore[arg-type]
+
+    edge_file.write_bytes(array(typecode, [1, 2, 3]).tobytes())
+    with pytest.raises(ValueError, match="is not a multiple of the"):
+        list(iter_binary_edges(edge_file, dtype=dtype))  # type: ignore[arg-type]
+
+
+def test_iter_csv_edges(tmp_path: Path) -> None:
+    """Test iter_csv_edges with comment and empty lines."""
+    edge_file = tmp_path / "edges.csv"
+    edge_file.write_text("# start,end\n" + "".join(f"{start},{end}\n\n" for start, end in EDGES), encoding="utf-8")
+    assert list(iter_csv_edges(edge_file, chunk_size=16)) == EDGES
+
+
+def test_memmap_binary_edges(tmp_path: Path) -> None:
+    """Test memmap_binary_edges by sorting the mapped edge file with the NumPy backend."""
+    pytest.importorskip("numpy")
+    edge_file = tmp_path / "edges.bin"
+    edge_file.write_bytes(array("q", [node for edge in EDGES for node in edge]).tobytes())
+    assert numpy_acyclic_toposort(*memmap_binary_edges(edge_file)) == [{1, 5, 7}, {2, 6}, {3}, {4}]
@@ -0,0 +1,27 @@
+"""Tests for the graph module."""
+
+from cyclic_toposort.graph import IndexedGraph
+
+
+def test_indexed_graph_from_edges() -> None:
+    """Test IndexedGraph.from_edges() with string labels, a duplicate edge and a self-referencing edge."""
+    edges = [("a", "c"), ("a", "b"), ("b", "c"), ("a", "b"), ("c", "c")]
+
+    graph = IndexedGraph.from_edges(edges)
+
+    assert graph.labels == ["a", "c", "b"]
+    assert (graph.num_nodes, graph.num_edges) == (3, 3)
+    assert list(graph.node_outs.offsets) == [0, 2, 2, 3]
+    assert list(graph.node_outs.targets) == [1, 2, 1]
+    assert list(graph.node_ins[1]) == [0, 2]
+    assert graph.to_label_edges(graph.edges()) == {("a", "c"), ("a", "b"), ("b", "c")}
+
+
+def test_subgraph_ins_outs() -> None:
+    """Test IndexedGraph.subgraph_ins_outs() with a subgraph excluding the start and end of a path through a cycle."""
+    graph = IndexedGraph.from_edges([(0, 1), (1, 2), (2, 1), (2, 3)])
+
+    node_ins, node_outs = graph.subgraph_ins_outs({1, 2})
+
+    assert node_ins == {1: {2}, 2: {1}}
+    assert node_outs == {1: {2}, 2: {1}}
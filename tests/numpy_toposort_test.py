@@ -0,0 +1,38 @@
+"""Tests for the numpy_toposort module."""
+
+import random
+
+import pytest
+
+from cyclic_toposort.acyclic_toposort import acyclic_toposort
+from cyclic_toposort.numpy_toposort import numpy_acyclic_levels, numpy_acyclic_toposort
+
+np = pytest.importorskip("numpy")
+
+
+def test_runtimeerror_numpy_acyclic_toposort() -> None:
+    """Test numpy_acyclic_toposort with a cyclic graph and a graph consisting only of self-referencing edges."""
+    with pytest.raises(RuntimeError, match="Cyclic graph detected in acyclic_toposort function"):
+        numpy_acyclic_toposort([1, 2, 3], [2, 3, 1])
+    with pytest.raises(RuntimeError, match="Invalid graph detected"):
+        numpy_acyclic_toposort([1, 2], [1, 2])
+
+
+def test_numpy_acyclic_toposort() -> None:
+    """Test numpy_acyclic_toposort and numpy_acyclic_levels with an acyclic graph, a self-referencing edge and
+    duplicate edges.
+    """
+    sources = np.array([1, 1, 2, 2, 3, 5, 5, 7, 4, 1])
+    targets = np.array([2, 3, 3, 4, 4, 3, 6, 6, 4, 2])
+    assert numpy_acyclic_toposort(sources, targets) == [{1, 5, 7}, {2, 6}, {3}, {4}]
+    assert numpy_acyclic_levels(sources, targets).tolist() == [-1, 0, 1, 2, 3, 0, 1, 0]
+
+
+def test_numpy_acyclic_toposort_against_acyclic_toposort() -> None:
+    """Test numpy_acyclic_toposort with random acyclic graphs against the pure Python acyclic_toposort."""
+    rng = random.Random(0)
+    for _ in range(50):
+        nodes = rng.sample(range(200), k=rng.randint(2, 60))
+        edges = [(min(edge), max(edge)) for edge in (rng.sample(nodes, k=2) for _ in range(rng.randint(1, 150)))]
+        sources, targets = zip(*edges, strict=True)
+        assert numpy_acyclic_toposort(sources, targets) == acyclic_toposort(edges)
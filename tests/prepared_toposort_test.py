@@ -0,0 +1,62 @@
+"""Tests for the prepared_toposort module."""
+
+import random
+
+import pytest
+
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.prepared_toposort import PreparedToposort
+from cyclic_toposort.utils import SolverStats
+from tests.utils import create_random_graph
+
+
+def test_prepared_toposort_random_graphs() -> None:
+    """Test PreparedToposort with randomly generated graphs and each of their nodes as start node, expecting the same
+    results as cyclic_toposort.
+    """
+    for _ in range(10):
+        edges = create_random_graph(num_edges=random.randint(8, 12))
+        prepared_toposort = PreparedToposort(edges)
+        for start_node in [None, *{edge_start for edge_start, _ in edges}]:
+            assert prepared_toposort.cyclic_toposort(start_node=start_node) == cyclic_toposort(
+                edges=edges,
+                start_node=start_node,
+            )
+
+
+def test_prepared_toposort_reuses_components() -> None:
+    """Test PreparedToposort with a graph of two disjoint cycles, expecting a start node in one cycle to not resolve
+    the other cycle again.
+    """
+    edges = {(1, 2), (2, 3), (3, 1), (4, 5), (5, 6), (6, 4)}
+    prepared_toposort = PreparedToposort(edges)
+    assert 1 in prepared_toposort
+    assert 7 not in prepared_toposort  # noqa: PLR2004
+
+    stats = SolverStats()
+    assert prepared_toposort.cyclic_toposort(stats=stats) == cyclic_toposort(edges=edges)
+    assert stats.recursive_calls > 0
+
+    stats = SolverStats()
+    assert prepared_toposort.cyclic_toposort(start_node=2, stats=stats) == cyclic_toposort(edges=edges, start_node=2)
+    assert stats.recursive_calls == 0
+    assert set(stats.phase_times) == {"components", "search", "tie_break", "final_sort"}
+
+    with pytest.raises(ValueError, match="Unknown engine"):
+        PreparedToposort(edges, engine="unknown")  # type: ignore[arg-type]
+
+
+def test_prepared_toposort_bounded_memo() -> None:
+    """Test PreparedToposort with a memo of a single component, expecting the least recently used component to be
+    resolved again.
+    """
+    edges = {(1, 2), (2, 3), (3, 1), (4, 5), (5, 6), (6, 4)}
+    prepared_toposort = PreparedToposort(edges, maxsize=1)
+
+    stats = SolverStats()
+    assert prepared_toposort.cyclic_toposort(stats=stats) == cyclic_toposort(edges=edges)
+    assert stats.recursive_calls > 0
+
+    stats = SolverStats()
+    assert prepared_toposort.cyclic_toposort(start_node=5, stats=stats) == cyclic_toposort(edges=edges, start_node=5)
+    assert stats.recursive_calls > 0
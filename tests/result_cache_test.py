@@ -0,0 +1,62 @@
+"""Tests for the result_cache module."""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from cyclic_toposort.cyclic_toposort import cyclic_toposort
+from cyclic_toposort.graph import IndexedGraph
+from cyclic_toposort.result_cache import ResultCache, graph_fingerprint
+from tests.utils import create_random_graph
+
+
+def test_result_cache_across_instances(tmp_path: Path) -> None:
+    """Test cyclic_toposort with a persistent result cache, expecting hits for the same graphs in a reopened cache."""
+    graphs = [create_random_graph(num_edges=random.randint(8, 12)) for _ in range(5)]
+    with ResultCache(tmp_path / "cache.sqlite3") as result_cache:
+        results = [cyclic_toposort(edges=edges, start_node=1, result_cache=result_cache) for edges in graphs]
+        assert result_cache.misses == len(graphs)
+
+    with ResultCache(tmp_path / "cache.sqlite3") as result_cache:
+        for edges, result in zip(graphs, results, strict=True):
+            assert cyclic_toposort(edges=list(edges)[::-1], start_node=1, result_cache=result_cache) == result
+        assert (result_cache.hits, result_cache.misses) == (len(graphs), 0)
+
+
+def test_result_cache_eviction_and_invalidation(tmp_path: Path) -> None:
+    """Test the result cache evicting the least recently used results and dropping results invalid for their graph."""
+    with ResultCache(tmp_path / "cache.sqlite3", maxsize=2) as result_cache:
+        for num_nodes in (3, 4, 5):
+            edges = {(node, (node + 1) % num_nodes) for node in range(num_nodes)}
+            cyclic_toposort(edges=edges, result_cache=result_cache)
+        assert len(result_cache) == 2  # noqa: PLR2004
+
+        graph = IndexedGraph.from_edges({(1, 2), (2, 3), (3, 1)})
+        fingerprint = graph_fingerprint(graph=graph)
+        assert result_cache.get(fingerprint=fingerprint, graph=graph) is None
+
+        result_cache.put(fingerprint=fingerprint, result=([{1}, {2}, {3}], {(2, 3)}))
+        assert result_cache.get(fingerprint=fingerprint, graph=graph) is None
+        assert result_cache.invalidations == 1
+        assert cyclic_toposort(edges={(1, 2), (2, 3), (3, 1)}, result_cache=result_cache) == ([{3}, {1}, {2}], {(2, 3)})
+
+
+def test_graph_fingerprint_labels() -> None:
+    """Test graph_fingerprint with labels of different types, expecting distinct fingerprints for distinct labels with
+    equal representations and a TypeError for labels without canonical encoding.
+    """
+    fingerprints = {
+        graph_fingerprint(graph=IndexedGraph.from_edges({(start_node, end_node)}))
+        for start_node, end_node in ((1, 2), ("1", "2"), (b"1", b"2"), ((1,), (2,)), (("1", 2), (1, "2")), (True, 2))
+    }
+    assert len(fingerprints) == 6  # noqa: PLR2004
+    assert graph_fingerprint(graph=IndexedGraph.from_edges({("a", ("b", 1))}), start_node="a") == graph_fingerprint(
+        graph=IndexedGraph.from_edges([("a", ("b", 1)), ("a", ("b", 1))]),
+        start_node="a",
+    )
+
+    with pytest.raises(TypeError):
+        graph_fingerprint(graph=IndexedGraph.from_edges({(1.0, 2.0)}))
+    with pytest.raises(TypeError):
+        graph_fingerprint(graph=IndexedGraph.from_edges({(frozenset({1}), 2)}))
@@ -16,24 +16,24 @@ def create_random_graph(
         distinct nodes.
     :return: A set of edges represented as tuples where each tuple contains two integers corresponding to node IDs.
     """
-    nodes = [1, 2]
+    # The nodes are always 1 to num_nodes, which allows to draw them without materializing a list of nodes
+    num_nodes = 2
     edges = {(1, 2)}
 
     while len(edges) < num_edges:
-        possible_new_node = max(nodes) + 1
-        possible_nodes = [*nodes, possible_new_node]
+        possible_new_node = num_nodes + 1
         if cyclic_nodes:
-            edge_start = random.choice(possible_nodes)
-            edge_end = random.choice(nodes) if edge_start == possible_new_node else random.choice(possible_nodes)
+            edge_start = random.randint(1, possible_new_node)
+            edge_end = random.randint(1, num_nodes if edge_start == possible_new_node else possible_new_node)
         else:
-            edge_start, edge_end = random.sample(possible_nodes, k=2)
+            edge_start, edge_end = random.sample(range(1, possible_new_node + 1), k=2)
 
         new_edge = (edge_start, edge_end)
         if new_edge not in edges:
             edges.add(new_edge)
 
             if possible_new_node in new_edge:
-                nodes.append(possible_new_node)
+                num_nodes = possible_new_node
 
     return edges
 
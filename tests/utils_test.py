@@ -1,6 +1,17 @@
 """Tests for the utils module."""
 
-from cyclic_toposort.utils import generate_reduced_ins_outs
+from contextlib import closing
+from copy import deepcopy
+
+from cyclic_toposort.utils import (
+    SubresultCache,
+    bitsets_to_ins_outs,
+    cycle_packing_lower_bound,
+    generate_reduced_ins_outs,
+    greedy_cyclic_edges,
+    ins_outs_to_bitsets,
+    strongly_connected_components,
+)
 
 
 def test_basic_functionality() -> None:
@@ -9,7 +20,14 @@ def test_basic_functionality() -> None:
     node_ins: dict[int, set[int]] = {1: set(), 2: set(), 3: {1, 2}, 4: {3}}
     node_outs: dict[int, set[int]] = {1: {3}, 2: {3}, 3: {4}, 4: set()}
 
-    results = list(generate_reduced_ins_outs(edges=edges, node_ins=node_ins, node_outs=node_outs))
+    results = [
+        (deepcopy(reduced_node_ins), deepcopy(reduced_node_outs), cyclic_edges)
+        for reduced_node_ins, reduced_node_outs, cyclic_edges in generate_reduced_ins_outs(
+            edges=edges,
+            node_ins=node_ins,
+            node_outs=node_outs,
+        )
+    ]
     expected = [
         ({1: set(), 2: set(), 3: {1}, 4: {3}}, {1: {3}, 2: set(), 3: {4}, 4: set()}, {(2, 3)}),
         ({1: set(), 2: set(), 3: {2}, 4: {3}}, {1: set(), 2: {3}, 3: {4}, 4: set()}, {(1, 3)}),
@@ -44,3 +62,79 @@ def test_input_not_modified() -> None:
 
     assert node_ins == {1: {4, 6}, 2: {1, 5}, 3: {2}, 4: set(), 5: {3, 4}, 6: {3, 4, 8}, 7: {5}, 8: set()}
     assert node_outs == {1: {2}, 2: {3}, 3: {5, 6}, 4: {1, 5, 6}, 5: {2, 7}, 6: {1}, 7: set(), 8: {6}}
+
+
+def test_input_restored_when_closed() -> None:
+    """Make sure the input dictionaries are restored when the generator is closed before it is exhausted."""
+    edges = {(1, 2), (2, 3), (3, 1)}
+    node_ins: dict[int, set[int]] = {1: {3}, 2: {1}, 3: {2}}
+    node_outs: dict[int, set[int]] = {1: {2}, 2: {3}, 3: {1}}
+
+    with closing(generate_reduced_ins_outs(edges=edges, node_ins=node_ins, node_outs=node_outs)) as reduced_ins_outs:
+        for reduced_node_ins, _, cyclic_edges in reduced_ins_outs:
+            if len(cyclic_edges) == 2:  # noqa: PLR2004
+                assert sum(len(incomings) for incomings in reduced_node_ins.values()) == 1
+                break
+
+    assert node_ins == {1: {3}, 2: {1}, 3: {2}}
+    assert node_outs == {1: {2}, 2: {3}, 3: {1}}
+
+
+def test_strongly_connected_components() -> None:
+    """Test strongly_connected_components() with a graph of two cycles connected by an acyclic path."""
+    node_outs: dict[int, set[int]] = {1: {2}, 2: {3}, 3: {1, 4}, 4: {5}, 5: {6}, 6: {7}, 7: {5}, 8: {1}}
+
+    components = strongly_connected_components(node_outs)
+
+    assert components == [{5, 6, 7}, {4}, {1, 2, 3}, {8}]
+
+
+def test_subresult_cache_lru_eviction() -> None:
+    """Test that SubresultCache evicts the least recently used graph, counts hits and misses and returns copies."""
+    cache = SubresultCache(maxsize=2)
+    cache.put(frozenset({(1, 2), (2, 1)}), [{(1, 2)}, {(2, 1)}])
+    cache.put(frozenset({(3, 4), (4, 3)}), [{(3, 4)}, {(4, 3)}])
+
+    cached_cyclic_edges = cache.get(frozenset({(1, 2), (2, 1)}))
+    assert cached_cyclic_edges == [{(1, 2)}, {(2, 1)}]
+    cached_cyclic_edges[0].add((5, 6))
+
+    cache.put(frozenset({(5, 6), (6, 5)}), [{(5, 6)}, {(6, 5)}])
+    assert cache.get(frozenset({(3, 4), (4, 3)})) is None
+    assert cache.get(frozenset({(1, 2), (2, 1)})) == [{(1, 2)}, {(2, 1)}]
+    assert (len(cache), cache.hits, cache.misses) == (2, 2, 1)
+
+
+def test_greedy_cyclic_edges() -> None:
+    """Test greedy_cyclic_edges() with two cycles sharing a single edge, which is the only minimal cyclic edge."""
+    node_ins: dict[int, set[int]] = {1: {3, 4}, 2: {1}, 3: {2}, 4: {2}}
+    node_outs: dict[int, set[int]] = {1: {2}, 2: {3, 4}, 3: {1}, 4: {1}}
+
+    assert greedy_cyclic_edges(node_ins=node_ins, node_outs=node_outs) == {(1, 2)}
+
+
+def test_cycle_packing_lower_bound() -> None:
+    """Test cycle_packing_lower_bound() with two cycles sharing a node and a third cycle sharing an edge."""
+    node_outs: dict[int, set[int]] = {1: {2}, 2: {1, 3}, 3: {2, 4}, 4: {2}}
+
+    assert cycle_packing_lower_bound(node_outs=node_outs) == 2  # noqa: PLR2004
+
+
+def test_bitsets_round_trip() -> None:
+    """Test the conversion of node inputs and outputs to bitsets and back, restricted to a subset of nodes."""
+    nodes = [1, 2, 3, 4]
+    node_ins: dict[int, set[int]] = {1: {4}, 2: {1}, 3: {1, 2}, 4: {3}}
+    node_outs: dict[int, set[int]] = {1: {2, 3}, 2: {3}, 3: {4}, 4: {1}}
+
+    in_masks, out_masks = ins_outs_to_bitsets(nodes=nodes, node_ins=node_ins, node_outs=node_outs)
+
+    assert in_masks == [0b1000, 0b0001, 0b0011, 0b0100]
+    assert out_masks == [0b0110, 0b0100, 0b1000, 0b0001]
+    assert bitsets_to_ins_outs(nodes=nodes, in_masks=in_masks, out_masks=out_masks, node_mask=0b1111) == (
+        node_ins,
+        node_outs,
+    )
+    assert bitsets_to_ins_outs(nodes=nodes, in_masks=in_masks, out_masks=out_masks, node_mask=0b1101) == (
+        {1: {4}, 3: {1}, 4: {3}},
+        {1: {3}, 3: {4}, 4: {1}},
+    )